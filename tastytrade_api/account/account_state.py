@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from ..streamer.account_events import TERMINAL_ORDER_STATUSES, decode_message
+
+logger = logging.getLogger(__name__)
+
+POSITION_EVENT_TYPES = {"CurrentPosition", "Position"}
+
+
+class AccountStateStore:
+    """
+    In-memory live orders, positions and balances of an account, kept current by account streamer events.
+
+    The store takes one REST snapshot with load_snapshot() and then applies the Order, ComplexOrder,
+    CurrentPosition and AccountBalance events from the account streamer (after TastytradeStreamer.connect_account) incrementally.
+    Lookups by order id, symbol and underlying symbol are dictionary lookups.
+
+    Listeners registered with add_listener() are called as listener(kind, key, old, new) whenever an order
+    ("order", keyed by order id), position ("position", keyed by symbol) or the balances ("balances", keyed by
+    account number) change. ``new`` is the latest state received; filled or cancelled orders and positions with
+    zero quantity are passed as ``new`` and then dropped from the store.
+
+    After a streamer reconnect, resync() converges the local state with a fresh snapshot: only the differences
+    are reported to the listeners (with ``new`` set to None for orders and positions that disappeared), and
+    events received while the snapshot was in flight are buffered and applied in order afterwards. If the
+    snapshot cannot be fetched, ``stale`` is set until a later resync() or load_snapshot() succeeds.
+
+    Args:
+        account_number (str): The account to track. Events for other accounts are ignored.
+        order_client (TastytradeOrder): Client used to load live orders.
+        positions_client (TastytradeAccountPositions): Client used to load positions and balances.
+    """
+
+    def __init__(self, account_number, order_client, positions_client):
+        self.account_number = account_number
+        self.order_client = order_client
+        self.positions_client = positions_client
+        self.orders = {}
+        self.positions = {}
+        self.orders_by_underlying = {}
+        self.positions_by_underlying = {}
+        self.balances = None
+        self.listeners = []
+        self.lock = threading.RLock()
+        self.buffer = None
+        self.stale = False
+
+    def add_listener(self, listener):
+        """
+        Registers a change callback.
+
+        Args:
+            listener (callable): Called as listener(kind, key, old, new).
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, kind, key, old, new):
+        for listener in self.listeners:
+            try:
+                listener(kind, key, old, new)
+            except Exception:
+                logger.exception("Account state listener failed for %s %s", kind, key)
+
+    def fetch_snapshot(self):
+        """
+        Fetches live orders, positions and balances of the account through the REST API.
+
+        Returns:
+            tuple: (orders, positions, balances) as returned by the API.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            orders = executor.submit(self.order_client.get_live_orders, self.account_number)
+            positions = executor.submit(self.positions_client.get_positions, self.account_number)
+            balances = executor.submit(self.positions_client.get_account_balances, self.account_number)
+            return orders.result()["data"]["items"], positions.result(), balances.result()
+
+    def load_snapshot(self):
+        """Replaces the local state with a fresh REST snapshot. Listeners are not called."""
+        orders, positions, balances = self.fetch_snapshot()
+        with self.lock:
+            self.orders = {}
+            self.positions = {}
+            self.orders_by_underlying = {}
+            self.positions_by_underlying = {}
+            for order in orders:
+                if order.get("status") not in TERMINAL_ORDER_STATUSES:
+                    self._store_order(order)
+            for position in positions:
+                if not _is_closed(position):
+                    self._store_position(position)
+            self.balances = balances
+            self.stale = False
+
+    def begin_resync(self):
+        """Starts buffering incoming events until the next resync() completes."""
+        with self.lock:
+            if self.buffer is None:
+                self.buffer = []
+
+    def resync(self):
+        """
+        Fetches a fresh snapshot, reports the differences to the local state as synthetic changes, then applies
+        the events buffered since begin_resync() in the order they arrived.
+        """
+        self.begin_resync()
+        try:
+            snapshot = self.fetch_snapshot()
+        except Exception:
+            with self.lock:
+                self.stale = True
+                buffered, self.buffer = self.buffer, None
+                for event in buffered:
+                    self._apply(event)
+            raise
+        with self.lock:
+            self.reconcile(*snapshot)
+            self.stale = False
+            buffered, self.buffer = self.buffer, None
+            for event in buffered:
+                self._apply(event, skip_stale=True)
+        logger.info("Account %s resynchronized, %d buffered events applied", self.account_number, len(buffered))
+
+    def start_resync(self, streamer=None):
+        """
+        Begins buffering and runs resync() in the default executor of the running event loop.
+
+        Meant as the on_reconnect callback of AsyncTastytradeStreamer: events keep flowing into the buffer
+        while the snapshot is fetched. The callback does not await the returned future, so a failed resync is
+        logged here and leaves the store marked stale.
+
+        Returns:
+            asyncio.Future: Completes when the resync is done.
+        """
+        self.begin_resync()
+        future = asyncio.get_running_loop().run_in_executor(None, self.resync)
+        future.add_done_callback(self._resync_done)
+        return future
+
+    def _resync_done(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Resynchronizing account %s failed, its state is stale: %s", self.account_number,
+                         future.exception())
+
+    def reconcile(self, orders, positions, balances):
+        """
+        Replaces the local state with a snapshot, notifying listeners only about the differences.
+
+        Args:
+            orders (list): Live orders as returned by the API.
+            positions (list): Positions as returned by the API.
+            balances (dict): Balances as returned by the API.
+        """
+        with self.lock:
+            live_orders = {order["id"]: order for order in orders if order.get("status") not in TERMINAL_ORDER_STATUSES}
+            for order_id in [order_id for order_id in self.orders if order_id not in live_orders]:
+                self.notify("order", order_id, self._discard_order(order_id), None)
+            for order_id, order in live_orders.items():
+                old = self.orders.get(order_id)
+                if old != order:
+                    self._discard_order(order_id)
+                    self._store_order(order)
+                    self.notify("order", order_id, old, order)
+
+            open_positions = {position["symbol"]: position for position in positions if not _is_closed(position)}
+            for symbol in [symbol for symbol in self.positions if symbol not in open_positions]:
+                self.notify("position", symbol, self._discard_position(symbol), None)
+            for symbol, position in open_positions.items():
+                old = self.positions.get(symbol)
+                if old != position:
+                    self._discard_position(symbol)
+                    self._store_position(position)
+                    self.notify("position", symbol, old, position)
+
+            if balances != self.balances:
+                old, self.balances = self.balances, balances
+                self.notify("balances", self.account_number, old, balances)
+
+    def _is_stale(self, event):
+        """
+        Returns True for a buffered event that is older than the state taken from the snapshot. A ComplexOrder
+        is stale when all of its component orders are.
+        """
+        if event.type == "Order":
+            return _is_older(event.data, self.orders.get(event.data.get("id")))
+        if event.type == "ComplexOrder":
+            orders = _component_orders(event.data)
+            return bool(orders) and all(_is_older(order, self.orders.get(order.get("id"))) for order in orders)
+        if event.type in POSITION_EVENT_TYPES:
+            return _is_older(event.data, self.positions.get(event.data.get("symbol")))
+        return False
+
+    def get_order(self, order_id):
+        """Returns the live order with the given id, or None."""
+        return self.orders.get(order_id)
+
+    def get_position(self, symbol):
+        """Returns the open position in the given symbol, or None."""
+        return self.positions.get(symbol)
+
+    def orders_for_underlying(self, underlying_symbol):
+        """Returns a list of live orders on the given underlying symbol."""
+        return list(self.orders_by_underlying.get(underlying_symbol, {}).values())
+
+    def positions_for_underlying(self, underlying_symbol):
+        """Returns a list of open positions on the given underlying symbol."""
+        return list(self.positions_by_underlying.get(underlying_symbol, {}).values())
+
+    def apply_message(self, message):
+        """
+        Decodes and applies a raw account streamer message. Can be used as the message callback of
+        TastytradeStreamer: ``message_callback=lambda ws, message: store.apply_message(message)``.
+
+        Args:
+            message (Union[str, dict]): The raw JSON message or the parsed dictionary.
+        """
+        self.apply(decode_message(message))
+
+    def apply(self, event):
+        """
+        Applies an account streamer event. Events of other types or for other accounts are ignored.
+
+        Args:
+            event (AccountEvent): The decoded event.
+        """
+        with self.lock:
+            if self.buffer is not None:
+                self.buffer.append(event)
+                return
+            self._apply(event)
+
+    def _apply(self, event, skip_stale=False):
+        if not isinstance(event.data, dict):
+            # Raw events, e.g. with "data": null, carry nothing to apply
+            return
+        if skip_stale and self._is_stale(event):
+            return
+        if event.type == "Order":
+            self.apply_order(event.data)
+        elif event.type == "ComplexOrder":
+            # The store tracks the component orders of OCO, OTO and OTOCO orders individually
+            for order in _component_orders(event.data):
+                if not (skip_stale and _is_older(order, self.orders.get(order.get("id")))):
+                    self.apply_order(order)
+        elif event.type in POSITION_EVENT_TYPES:
+            self.apply_position(event.data)
+        elif event.type == "AccountBalance":
+            self.apply_balances(event.data)
+
+    def apply_order(self, order):
+        """Applies an order update."""
+        if order.get("account-number", self.account_number) != self.account_number:
+            return
+        with self.lock:
+            old = self._discard_order(order["id"])
+            if order.get("status") not in TERMINAL_ORDER_STATUSES:
+                self._store_order(order)
+        self.notify("order", order["id"], old, order)
+
+    def apply_position(self, position):
+        """Applies a position update."""
+        if position.get("account-number", self.account_number) != self.account_number:
+            return
+        with self.lock:
+            old = self._discard_position(position["symbol"])
+            if not _is_closed(position):
+                self._store_position(position)
+        self.notify("position", position["symbol"], old, position)
+
+    def apply_balances(self, balances):
+        """Applies a balance update."""
+        if balances.get("account-number", self.account_number) != self.account_number:
+            return
+        with self.lock:
+            old = self.balances
+            self.balances = balances
+        self.notify("balances", self.account_number, old, balances)
+
+    def _store_order(self, order):
+        self.orders[order["id"]] = order
+        self.orders_by_underlying.setdefault(order.get("underlying-symbol"), {})[order["id"]] = order
+
+    def _discard_order(self, order_id):
+        old = self.orders.pop(order_id, None)
+        if old is not None:
+            by_underlying = self.orders_by_underlying.get(old.get("underlying-symbol"))
+            if by_underlying is not None:
+                by_underlying.pop(order_id, None)
+                if not by_underlying:
+                    del self.orders_by_underlying[old.get("underlying-symbol")]
+        return old
+
+    def _store_position(self, position):
+        self.positions[position["symbol"]] = position
+        self.positions_by_underlying.setdefault(position.get("underlying-symbol"), {})[position["symbol"]] = position
+
+    def _discard_position(self, symbol):
+        old = self.positions.pop(symbol, None)
+        if old is not None:
+            by_underlying = self.positions_by_underlying.get(old.get("underlying-symbol"))
+            if by_underlying is not None:
+                by_underlying.pop(symbol, None)
+                if not by_underlying:
+                    del self.positions_by_underlying[old.get("underlying-symbol")]
+        return old
+
+
+def _component_orders(complex_order):
+    orders = list(complex_order.get("orders") or [])
+    if complex_order.get("trigger-order"):
+        orders.append(complex_order["trigger-order"])
+    return orders
+
+
+def _is_older(item, current):
+    if current is None:
+        return False
+    updated_at = _updated_at(item)
+    current_updated_at = _updated_at(current)
+    if updated_at is None or current_updated_at is None:
+        return False
+    return updated_at < current_updated_at
+
+
+def _updated_at(item):
+    value = item.get("updated-at")
+    if not value:
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value / 1000, timezone.utc)
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _is_closed(position):
+    try:
+        return float(position.get("quantity", 0)) == 0
+    except (TypeError, ValueError):
+        return False
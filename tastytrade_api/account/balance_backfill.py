@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIELDS = ("net-liquidating-value", "cash-balance", "equity-buying-power", "derivative-buying-power",
+                  "maintenance-requirement")
+
+
+def trading_dates(start_date, end_date, holidays=()):
+    """
+    Returns the weekdays from start_date to end_date inclusive, as YYYY-MM-DD strings.
+
+    Args:
+        start_date (Union[date, str]): The first date.
+        end_date (Union[date, str]): The last date.
+        holidays (iterable): Dates (date objects or YYYY-MM-DD strings) to leave out, e.g. market holidays.
+    """
+    start_date = _date(start_date)
+    end_date = _date(end_date)
+    holidays = {_date(holiday) for holiday in holidays}
+    dates = []
+    day = start_date
+    while day <= end_date:
+        if day.weekday() < 5 and day not in holidays:
+            dates.append(day.isoformat())
+        day += timedelta(days=1)
+    return dates
+
+
+class BalanceSnapshotTable:
+    """
+    Balance snapshots indexed by account, date and time of day, with one tuple of values per snapshot.
+
+    Attributes:
+        fields (tuple): The balance fields kept, in value order.
+        rows (dict): Values tuples keyed by (account_number, date, time_of_day). Numeric values are floats,
+            missing ones None.
+        errors (dict): The exception of each failed (account_number, date, time_of_day) request.
+        missing (list): The (account_number, date, time_of_day) keys the API returned no snapshot of that date for.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.rows = {}
+        self.errors = {}
+        self.missing = []
+
+    def add(self, account_number, snapshot_date, time_of_day, snapshot):
+        self.rows[(account_number, snapshot_date, time_of_day)] = tuple(
+            _float(snapshot.get(field)) for field in self.fields
+        )
+
+    def get(self, account_number, snapshot_date, time_of_day="EOD"):
+        """Returns one snapshot as a dictionary of fields, or None if it is missing."""
+        values = self.rows.get((account_number, snapshot_date, time_of_day))
+        return dict(zip(self.fields, values)) if values is not None else None
+
+    def series(self, account_number, field, time_of_day="EOD"):
+        """Returns the (date, value) pairs of one field of an account, sorted by date."""
+        column = self.fields.index(field)
+        return sorted(
+            (key[1], values[column])
+            for key, values in self.rows.items()
+            if key[0] == account_number and key[2] == time_of_day
+        )
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class BalanceSnapshotBackfill:
+    """
+    Fetches balance snapshots of many accounts over date ranges concurrently.
+
+    Snapshots of past dates never change, so they are cached permanently: one JSON file per account and time of
+    day in cache_directory, or in memory only if no directory is given. Only dates missing from the cache and the
+    current date are requested.
+
+    Args:
+        positions_client (TastytradeAccountPositions): Client used to fetch the snapshots.
+        cache_directory (str): Optional directory for the snapshot cache. It is created if missing.
+        max_workers (int): Maximum number of concurrent requests.
+        rate_limiter (RateLimiter): Optional rate limiter taken before each request.
+    """
+
+    def __init__(self, positions_client, cache_directory=None, max_workers=8, rate_limiter=None):
+        self.positions_client = positions_client
+        self.cache_directory = cache_directory
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.cache = {}
+        self.lock = threading.Lock()
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+
+    def _cache_path(self, account_number, time_of_day):
+        return os.path.join(self.cache_directory, f"{account_number}-{time_of_day}.json")
+
+    def _cached(self, account_number, time_of_day):
+        key = (account_number, time_of_day)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = {}
+            if self.cache_directory is not None and os.path.exists(self._cache_path(account_number, time_of_day)):
+                with open(self._cache_path(account_number, time_of_day)) as file:
+                    cached = json.load(file)
+            self.cache[key] = cached
+        return cached
+
+    def _save(self, account_number, time_of_day):
+        if self.cache_directory is None:
+            return
+        path = self._cache_path(account_number, time_of_day)
+        with open(path + ".tmp", "w") as file:
+            json.dump(self.cache[(account_number, time_of_day)], file)
+        os.replace(path + ".tmp", path)
+
+    def _fetch(self, account_number, snapshot_date, time_of_day):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.positions_client.get_balance_snapshots(account_number, snapshot_date, time_of_day)
+        data = response["data"]
+        items = data.get("items")
+        # A snapshot of another day must not be stored, and cached, as the requested date's balances
+        for item in [data] if items is None else items:
+            if item.get("snapshot-date") == snapshot_date:
+                return item
+        return None
+
+    def backfill(self, account_numbers, start_date, end_date, times_of_day=("EOD",), fields=DEFAULT_FIELDS,
+                 holidays=()):
+        """
+        Returns the balance snapshots of the accounts for every trading date in a range.
+
+        Args:
+            account_numbers (list): The accounts to fetch.
+            start_date (Union[date, str]): The first date.
+            end_date (Union[date, str]): The last date.
+            times_of_day (tuple): "EOD", "BOD" or both.
+            fields (tuple): The balance fields kept in the table.
+            holidays (iterable): Dates to skip, see trading_dates().
+
+        Returns:
+            BalanceSnapshotTable: The snapshots. Failed requests are recorded in its errors, dates without a
+            snapshot in its missing list; both are retried on the next backfill.
+        """
+        today = date.today().isoformat()
+        dates = trading_dates(start_date, end_date, holidays)
+        table = BalanceSnapshotTable(fields)
+        missing = []
+        with self.lock:
+            for account_number in account_numbers:
+                for time_of_day in times_of_day:
+                    cached = self._cached(account_number, time_of_day)
+                    for snapshot_date in dates:
+                        snapshot = cached.get(snapshot_date)
+                        if snapshot is not None and snapshot_date < today:
+                            table.add(account_number, snapshot_date, time_of_day, snapshot)
+                        else:
+                            missing.append((account_number, snapshot_date, time_of_day))
+
+        def fetch(key):
+            try:
+                return key, self._fetch(*key), None
+            except Exception as error:
+                logger.warning("Fetching balance snapshot %s failed: %s", key, error)
+                return key, None, error
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                results = list(executor.map(fetch, missing))
+        else:
+            results = []
+
+        changed = set()
+        with self.lock:
+            for (account_number, snapshot_date, time_of_day), snapshot, error in results:
+                if error is not None:
+                    table.errors[(account_number, snapshot_date, time_of_day)] = error
+                    continue
+                if snapshot is None:
+                    table.missing.append((account_number, snapshot_date, time_of_day))
+                    continue
+                table.add(account_number, snapshot_date, time_of_day, snapshot)
+                if snapshot_date < today:
+                    self._cached(account_number, time_of_day)[snapshot_date] = snapshot
+                    changed.add((account_number, time_of_day))
+            for account_number, time_of_day in changed:
+                self._save(account_number, time_of_day)
+        return table
+
+
+def _date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _float(value):
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,7 +1,35 @@
+import hashlib
 import requests
 import json
 
 
+class PositionDelta:
+    """
+    The changes between two polls of TastytradeAccountPositions.poll_position_changes.
+
+    Attributes:
+        opened (list): Positions that were not present before.
+        closed (list): Previous positions that are gone or have a zero quantity.
+        quantity_changed (list): (previous signed quantity, position) pairs.
+        mark_changed (list): (previously reported mark, position) pairs of marks that moved past the threshold.
+    """
+
+    __slots__ = ("opened", "closed", "quantity_changed", "mark_changed")
+
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+        self.quantity_changed = []
+        self.mark_changed = []
+
+    def __bool__(self):
+        return bool(self.opened or self.closed or self.quantity_changed or self.mark_changed)
+
+    def __repr__(self):
+        return (f"PositionDelta(opened={len(self.opened)}, closed={len(self.closed)}, "
+                f"quantity_changed={len(self.quantity_changed)}, mark_changed={len(self.mark_changed)})")
+
+
 class TastytradeAccountPositions:
     """
     Initializes a new instance of the API client with the given session token and API URL.
@@ -17,6 +45,7 @@ class TastytradeAccountPositions:
     def __init__(self, session_token, api_url):
         self.session_token = session_token
         self.api_url = api_url
+        self.position_snapshots = {}
 
     def get_positions(
         self,
@@ -51,7 +80,6 @@ class TastytradeAccountPositions:
         Raises:
             Exception: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        headers = {"Authorization": f"{self.session_token}"}
         params = {
             "underlying-symbol": underlying_symbol,
             "symbol": symbol,
@@ -62,20 +90,98 @@ class TastytradeAccountPositions:
             "net-positions": net_positions,
             "include-marks": include_marks,
         }
+        response_data = json.loads(self._get_positions_content(account_number, params))
+        positions = response_data["data"]["items"]
+        return positions
+
+    def _get_positions_content(self, account_number, params):
+        headers = {"Authorization": f"{self.session_token}"}
         response = requests.get(
             f"{self.api_url}/accounts/{account_number}/positions",
             headers=headers,
             params=params,
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
-            positions = response_data["data"]["items"]
-            return positions
+            return response.content
         else:
             raise Exception(
                 f"Error getting positions: {response.status_code} - {response.content}"
             )
 
+    def poll_position_changes(
+        self,
+        account_number,
+        mark_threshold=None,
+        underlying_symbol=None,
+        instrument_type=None,
+        include_marks=False,
+    ):
+        """
+        Fetches the positions of an account and returns what changed since the previous poll.
+
+        The previous poll is kept indexed by position key (symbol and instrument type), so the comparison is
+        O(n). A hash of the raw response is compared first; an unchanged payload is not parsed at all. The first
+        poll of an account reports every position as opened.
+
+        Args:
+            account_number (int): The account number to retrieve positions for.
+            mark_threshold (float, optional): Report mark changes of at least this absolute amount, compared to the
+                mark last reported. Mark changes are not reported if None. Requires include_marks or positions
+                that carry a mark. Defaults to None.
+            underlying_symbol (list of str, optional): Underlying symbols to filter positions by. Defaults to None.
+            instrument_type (str, optional): The type of instrument to filter positions by. Defaults to None.
+            include_marks (bool, optional): Whether to include current quote marks. Defaults to False.
+
+        Returns:
+            PositionDelta: The opened, closed, quantity changed and mark changed positions.
+
+        Raises:
+            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+        """
+        params = {
+            "underlying-symbol": underlying_symbol,
+            "instrument-type": instrument_type,
+            "include-marks": include_marks,
+        }
+        content = self._get_positions_content(account_number, params)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        key = (account_number, repr(sorted(params.items())))
+        previous_digest, previous = self.position_snapshots.get(key, (None, {}))
+        if digest == previous_digest:
+            return PositionDelta()
+
+        delta = PositionDelta()
+        current = {}
+        for position in json.loads(content)["data"]["items"]:
+            position_key = (position["symbol"], position.get("instrument-type"))
+            quantity = float(position.get("quantity") or 0)
+            if position.get("quantity-direction") == "Short":
+                quantity = -quantity
+            mark = position.get("mark-price", position.get("mark"))
+            mark = float(mark) if mark is not None else None
+            old = previous.get(position_key)
+            if old is None:
+                if quantity:
+                    delta.opened.append(position)
+                    current[position_key] = (quantity, mark, position)
+                continue
+            old_quantity, reported_mark, _ = old
+            if not quantity:
+                continue
+            if quantity != old_quantity:
+                delta.quantity_changed.append((old_quantity, position))
+            if (mark_threshold is not None and mark is not None
+                    and (reported_mark is None or abs(mark - reported_mark) >= mark_threshold)):
+                if reported_mark is not None:
+                    delta.mark_changed.append((reported_mark, position))
+                reported_mark = mark
+            current[position_key] = (quantity, reported_mark, position)
+        for position_key, (_, _, position) in previous.items():
+            if position_key not in current:
+                delta.closed.append(position)
+        self.position_snapshots[key] = (digest, current)
+        return delta
+
     def get_account_balances(self, account_number):
         """
         Makes a GET request to the /accounts/{account_number}/balances API endpoint for the account's balances,
@@ -0,0 +1,110 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = ("balances", "positions", "margin_requirements", "position_limit")
+
+
+class AccountSnapshot:
+    """
+    The data fetched for one account by MultiAccountClient.
+
+    Attributes:
+        account_number (str): The account number.
+        account (dict): The account object from get_accounts, if the account list was loaded from the API.
+        balances (dict): The get_account_balances response, or None if not fetched or failed.
+        positions (list): The get_positions response, or None if not fetched or failed.
+        margin_requirements (dict): The get_margin_requirements response, or None if not fetched or failed.
+        position_limit (dict): The get_position_limit response, or None if not fetched or failed.
+        errors (dict): The exception raised by each failed endpoint, keyed by endpoint name.
+    """
+
+    __slots__ = ("account_number", "account", "balances", "positions", "margin_requirements", "position_limit",
+                 "errors")
+
+    def __init__(self, account_number, account=None):
+        self.account_number = account_number
+        self.account = account
+        self.balances = None
+        self.positions = None
+        self.margin_requirements = None
+        self.position_limit = None
+        self.errors = {}
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"AccountSnapshot({self.account_number!r}, ok={self.ok})"
+
+
+class MultiAccountClient:
+    """
+    Fetches balances, positions, margin requirements and position limits of many accounts concurrently.
+
+    Every (account, endpoint) request runs as its own task in a bounded thread pool, so one slow or failing
+    request holds up neither the other endpoints of the account nor the other accounts.
+
+    Args:
+        account_client (TastytradeAccount): Client used for the account list, margin requirements and position limits.
+        positions_client (TastytradeAccountPositions): Client used for balances and positions.
+        max_workers (int): Maximum number of concurrent requests.
+        rate_limiter (RateLimiter): Optional rate limiter taken before each request.
+    """
+
+    def __init__(self, account_client, positions_client, max_workers=8, rate_limiter=None):
+        self.account_client = account_client
+        self.positions_client = positions_client
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.fetchers = {
+            "balances": positions_client.get_account_balances,
+            "positions": positions_client.get_positions,
+            "margin_requirements": account_client.get_margin_requirements,
+            "position_limit": account_client.get_position_limit,
+        }
+
+    def _fetch(self, snapshot, endpoint):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            setattr(snapshot, endpoint, self.fetchers[endpoint](snapshot.account_number))
+        except Exception as error:
+            logger.warning("Fetching %s of account %s failed: %s", endpoint, snapshot.account_number, error)
+            snapshot.errors[endpoint] = error
+
+    def fetch_all(self, account_numbers=None, endpoints=ENDPOINTS):
+        """
+        Fetches the given endpoints for every account.
+
+        Args:
+            account_numbers (list): The accounts to fetch. Defaults to all accounts returned by get_accounts.
+            endpoints (tuple): The endpoints to fetch, a subset of ENDPOINTS.
+
+        Returns:
+            dict: An AccountSnapshot per account number, in account order. Failures are recorded in the
+            snapshot's errors instead of being raised.
+
+        Raises:
+            ValueError: If an endpoint name is unknown.
+            Exception: If the account list could not be loaded.
+        """
+        unknown = set(endpoints) - set(self.fetchers)
+        if unknown:
+            raise ValueError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+        if account_numbers is None:
+            snapshots = {}
+            for item in self.account_client.get_accounts():
+                account = item.get("account", item)
+                snapshots[account["account-number"]] = AccountSnapshot(account["account-number"], account)
+        else:
+            snapshots = {account_number: AccountSnapshot(account_number) for account_number in account_numbers}
+
+        tasks = [(snapshot, endpoint) for snapshot in snapshots.values() for endpoint in endpoints]
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                list(executor.map(lambda task: self._fetch(*task), tasks))
+        return snapshots
@@ -0,0 +1,200 @@
+import array
+import bisect
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+VALUE_COLUMNS = ("open", "high", "low", "close", "total-open", "total-high", "total-low", "total-close")
+INTERVALS = {"5m": 300, "1h": 3600, "1d": 86400}
+
+
+class NetLiqHistoryStore:
+    """
+    Local columnar cache of account net liquidating value history.
+
+    Each account's history is kept as one append-only binary file per column (the point times as int64 epoch
+    seconds, the values as doubles) in the given directory. update() fetches only the tail since the last stored
+    point through the start-time parameter; query() answers range queries from the local columns, optionally
+    downsampled to 1h or 1d OHLC buckets, without network access.
+
+    Args:
+        account_client (TastytradeAccount): Client used to fetch the history.
+        directory (str): Directory for the column files. It is created if missing.
+        initial_time_back (str): The time-back window fetched for an account without stored history, e.g. "1y".
+    """
+
+    def __init__(self, account_client, directory, initial_time_back="1y"):
+        self.account_client = account_client
+        self.directory = directory
+        self.initial_time_back = initial_time_back
+        self.columns = {}
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, account_number, column):
+        return os.path.join(self.directory, f"{account_number}.{column}.bin")
+
+    def _load(self, account_number):
+        columns = self.columns.get(account_number)
+        if columns is not None:
+            return columns
+        columns = {"time": array.array("q")}
+        columns.update((column, array.array("d")) for column in VALUE_COLUMNS)
+        for column, values in columns.items():
+            path = self._path(account_number, column)
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    values.frombytes(file.read())
+        count = min(len(values) for values in columns.values())
+        if any(len(values) != count for values in columns.values()):
+            # An interrupted append, keep the points all columns have
+            logger.warning("Truncating net liq history of %s to %d points", account_number, count)
+            self._truncate(account_number, columns, count)
+        self.columns[account_number] = columns
+        return columns
+
+    def _truncate(self, account_number, columns, count):
+        for column, values in columns.items():
+            del values[count:]
+            with open(self._path(account_number, column), "ab") as file:
+                file.truncate(count * values.itemsize)
+
+    def _append(self, account_number, columns, points):
+        for column, values in columns.items():
+            chunk = array.array(values.typecode, (point[column] for point in points))
+            with open(self._path(account_number, column), "ab") as file:
+                chunk.tofile(file)
+            values.extend(chunk)
+
+    def update(self, account_number):
+        """
+        Fetches the points after the last stored one and appends them.
+
+        The last stored point is fetched again and replaced, since the API revises the interval in progress.
+
+        Args:
+            account_number (str): The account to update.
+
+        Returns:
+            int: The number of points added or replaced.
+        """
+        with self.lock:
+            columns = self._load(account_number)
+            last_time = columns["time"][-1] if columns["time"] else None
+        if last_time is None:
+            response = self.account_client.get_account_net_liq_history(account_number, time_back=self.initial_time_back)
+        else:
+            start_time = datetime.fromtimestamp(last_time, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            response = self.account_client.get_account_net_liq_history(account_number, start_time=start_time)
+
+        points = sorted((_point(item) for item in response["data"]["items"]), key=lambda point: point["time"])
+        with self.lock:
+            times = columns["time"]
+            keep = bisect.bisect_left(times, points[0]["time"]) if points else len(times)
+            if keep < len(times):
+                self._truncate(account_number, columns, keep)
+            self._append(account_number, columns, points)
+        return len(points)
+
+    def update_all(self, account_numbers, max_workers=8):
+        """
+        Updates several accounts concurrently.
+
+        Returns:
+            dict: The number of points added per account, or the exception if the update failed.
+        """
+
+        def update(account_number):
+            try:
+                return self.update(account_number)
+            except Exception as error:
+                logger.warning("Updating net liq history of %s failed: %s", account_number, error)
+                return error
+
+        account_numbers = list(account_numbers)
+        if not account_numbers:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(account_numbers))) as executor:
+            return dict(zip(account_numbers, executor.map(update, account_numbers)))
+
+    def query(self, account_number, start=None, end=None, interval=None):
+        """
+        Returns the stored points of an account in a time range.
+
+        Args:
+            account_number (str): The account.
+            start (Union[datetime, str, int]): Inclusive start as a datetime, ISO string or epoch seconds.
+            end (Union[datetime, str, int]): Exclusive end as a datetime, ISO string or epoch seconds.
+            interval (Union[str, int]): Optional bucket size, "5m", "1h", "1d" or seconds. Buckets are aligned to
+                UTC and carry the first open, highest high, lowest low and last close of their points.
+
+        Returns:
+            list: Points as dictionaries with "time" (UTC datetime) and the VALUE_COLUMNS as floats.
+        """
+        with self.lock:
+            columns = self._load(account_number)
+            times = columns["time"]
+            low = bisect.bisect_left(times, _epoch(start)) if start is not None else 0
+            high = bisect.bisect_left(times, _epoch(end)) if end is not None else len(times)
+            selected = {column: values[low:high] for column, values in columns.items()}
+
+        if interval is not None:
+            selected = _downsample(selected, INTERVALS.get(interval, interval))
+        return [
+            dict({"time": datetime.fromtimestamp(selected["time"][i], timezone.utc)},
+                 **{column: selected[column][i] for column in VALUE_COLUMNS})
+            for i in range(len(selected["time"]))
+        ]
+
+    def clear(self, account_number):
+        """Deletes the stored history of an account."""
+        with self.lock:
+            self.columns.pop(account_number, None)
+            for column in ("time",) + VALUE_COLUMNS:
+                path = self._path(account_number, column)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def _downsample(columns, seconds):
+    times = columns["time"]
+    result = {column: array.array(values.typecode) for column, values in columns.items()}
+    start = 0
+    while start < len(times):
+        bucket = times[start] - times[start] % seconds
+        end = bisect.bisect_left(times, bucket + seconds, start)
+        result["time"].append(bucket)
+        for column in VALUE_COLUMNS:
+            values = columns[column][start:end]
+            if column.endswith("open"):
+                result[column].append(values[0])
+            elif column.endswith("high"):
+                result[column].append(max(values))
+            elif column.endswith("low"):
+                result[column].append(min(values))
+            else:
+                result[column].append(values[-1])
+        start = end
+    return result
+
+
+def _epoch(value):
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _point(item):
+    point = {"time": _epoch(item["time"])}
+    for column in VALUE_COLUMNS:
+        value = item.get(column)
+        point[column] = float(value) if value is not None else float("nan")
+    return point
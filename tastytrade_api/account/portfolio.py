@@ -0,0 +1,262 @@
+import logging
+import math
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, see the "analytics" extra
+    np = None
+
+logger = logging.getLogger(__name__)
+
+GROUPINGS = ("underlying", "expiry", "strategy")
+METRICS = ("delta", "gamma", "theta", "vega", "market-value", "pnl")
+
+# Columns of the per-unit matrix; each row is multiplied by the signed quantity times the multiplier
+_DELTA, _GAMMA, _THETA, _VEGA, _MARK, _PNL = range(6)
+_GREEKS = ("delta", "gamma", "theta", "vega")
+
+
+class PortfolioEngine:
+    """
+    Columnar portfolio of positions with aggregates by underlying, expiry and strategy.
+
+    Positions are loaded into numpy arrays: a per-unit matrix (delta, gamma, theta, vega, mark, mark - cost) and
+    a scale vector (signed quantity times multiplier). Group totals are computed once with np.add.at, and each
+    streamed quote or greeks update only adds the difference of the changed rows to their groups, so an update
+    costs O(changed positions) instead of a full recomputation.
+
+    Example:
+        positions = positions_client.get_positions(account_number, include_marks=True)
+        engine = PortfolioEngine(positions)
+        engine.update_greeks(["SPY   230616C00400000"], delta=[0.52], theta=[-0.08])
+        engine.aggregates("underlying")  # {"SPY": {"delta": ..., "theta": ..., "pnl": ...}, ...}
+
+    Args:
+        positions (list): Positions as returned by TastytradeAccountPositions.get_positions.
+        strategy_of: Optional callable returning the strategy name of a position. Defaults to the instrument type.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+
+    def __init__(self, positions=(), strategy_of=None):
+        if np is None:
+            raise ImportError("PortfolioEngine requires numpy, install it with: pip install tastytrade-api[analytics]")
+        self.strategy_of = strategy_of or (lambda position: position.get("instrument-type"))
+        self.lock = threading.Lock()
+        self.load_positions(positions)
+
+    def load_positions(self, positions):
+        """
+        Replaces the portfolio with the given positions and recomputes all aggregates.
+
+        Streamed events can be matched by the position symbol or by the position's "streamer-symbol", if present.
+        Equities start with a delta of 1 per share, other instruments with zero greeks until the first update.
+
+        Args:
+            positions (list): Positions as returned by get_positions, ideally with include_marks=True.
+        """
+        positions = list(positions)
+        count = len(positions)
+        units = np.zeros((count, len(METRICS)))
+        scale = np.zeros(count)
+        cost = np.zeros(count)
+        index = {}
+        keys = {grouping: [] for grouping in GROUPINGS}
+
+        for row, position in enumerate(positions):
+            quantity = _float(position.get("quantity"))
+            if position.get("quantity-direction") == "Short":
+                quantity = -quantity
+            scale[row] = quantity * _float(position.get("multiplier"), 1.0)
+            cost[row] = _float(position.get("average-open-price"))
+            units[row, _MARK] = _float(position.get("mark-price", position.get("mark", position.get("close-price"))))
+            if position.get("instrument-type") == "Equity":
+                units[row, _DELTA] = 1.0
+            index[position["symbol"]] = row
+            if position.get("streamer-symbol"):
+                index[position["streamer-symbol"]] = row
+            keys["underlying"].append(position.get("underlying-symbol") or position["symbol"])
+            keys["expiry"].append(_expiry_of(position))
+            keys["strategy"].append(self.strategy_of(position))
+        units[:, _PNL] = units[:, _MARK] - cost
+
+        codes = {}
+        labels = {}
+        for grouping, values in keys.items():
+            group_labels = list(dict.fromkeys(values))
+            positions_of = {label: code for code, label in enumerate(group_labels)}
+            codes[grouping] = np.array([positions_of[value] for value in values], dtype=np.intp)
+            labels[grouping] = group_labels
+
+        with self.lock:
+            self.positions = positions
+            self.units = units
+            self.scale = scale
+            self.cost = cost
+            self.index = index
+            self.codes = codes
+            self.labels = labels
+            self._recompute()
+
+    def _recompute(self):
+        contributions = self.units * self.scale[:, None]
+        self.totals = {}
+        for grouping in GROUPINGS:
+            totals = np.zeros((len(self.labels[grouping]), len(METRICS)))
+            np.add.at(totals, self.codes[grouping], contributions)
+            self.totals[grouping] = totals
+
+    def recompute(self):
+        """Recomputes all aggregates from scratch, discarding rounding drift accumulated by incremental updates."""
+        with self.lock:
+            self._recompute()
+
+    def _update(self, symbols, columns, values):
+        index = self.index
+        # Rows must be unique for the difference below, the last update of a row wins
+        latest = {index[symbol]: position for position, symbol in enumerate(symbols) if symbol in index}
+        if not latest:
+            return 0
+        rows = np.fromiter(latest.keys(), dtype=np.intp, count=len(latest))
+        positions = np.fromiter(latest.values(), dtype=np.intp, count=len(latest))
+        with self.lock:
+            scale = self.scale[rows, None]
+            before = self.units[rows] * scale
+            for column, column_values in zip(columns, values):
+                self.units[rows, column] = np.asarray(column_values, dtype=float)[positions]
+            self.units[rows, _PNL] = self.units[rows, _MARK] - self.cost[rows]
+            difference = self.units[rows] * scale - before
+            for grouping in GROUPINGS:
+                np.add.at(self.totals[grouping], self.codes[grouping][rows], difference)
+        return len(rows)
+
+    def update_marks(self, symbols, marks):
+        """
+        Sets the marks of the given positions, e.g. quote mid prices, and updates the aggregates incrementally.
+
+        Args:
+            symbols (list): Position or streamer symbols.
+            marks (list): The new marks, one per symbol.
+
+        Returns:
+            int: The number of positions updated.
+        """
+        return self._update(symbols, (_MARK,), (marks,))
+
+    def update_quotes(self, symbols, bid_prices, ask_prices):
+        """Sets the marks of the given positions to the mid of the bid and ask prices."""
+        marks = (np.asarray(bid_prices, dtype=float) + np.asarray(ask_prices, dtype=float)) / 2
+        valid = np.isfinite(marks)
+        if not valid.all():
+            # One-sided or empty quotes keep the previous mark
+            symbols = [symbol for symbol, keep in zip(symbols, valid) if keep]
+            marks = marks[valid]
+        return self._update(symbols, (_MARK,), (marks,))
+
+    def update_greeks(self, symbols, delta=None, gamma=None, theta=None, vega=None):
+        """
+        Sets per-unit greeks of the given positions and updates the aggregates incrementally.
+
+        Only the greeks passed are changed.
+
+        Args:
+            symbols (list): Position or streamer symbols.
+            delta, gamma, theta, vega (list): The new per-unit values, one per symbol.
+
+        Returns:
+            int: The number of positions updated.
+        """
+        columns = []
+        values = []
+        for column, column_values in enumerate((delta, gamma, theta, vega)):
+            if column_values is not None:
+                columns.append(column)
+                values.append(column_values)
+        return self._update(symbols, columns, values)
+
+    def apply_feed_rows(self, rows, event_fields):
+        """
+        Applies Quote and Greeks events as returned by DXLinkWebsocketClient.rows().
+
+        Events of other types, or of types missing from event_fields, are ignored. Quotes and greeks of a batch are each applied in one vectorized update.
+
+        Args:
+            rows (list): (event_type, row) tuples.
+            event_fields (dict): The field list per event type, e.g. DXLinkWebsocketClient.fields_for results or
+                DEFAULT_EVENT_FIELDS.
+
+        Returns:
+            int: The number of position updates applied.
+        """
+        quote_fields = _row_fields(event_fields.get("Quote") or ())
+        greeks_fields = _row_fields(event_fields.get("Greeks") or ())
+        # An event type missing from event_fields has no known layout, its rows are skipped
+        quote_symbol = quote_fields.index("eventSymbol") if "eventSymbol" in quote_fields else None
+        greeks_symbol = greeks_fields.index("eventSymbol") if "eventSymbol" in greeks_fields else None
+        quotes = {}
+        greeks = {}
+        for event_type, row in rows:
+            if event_type == "Quote" and quote_symbol is not None:
+                quotes[row[quote_symbol]] = row
+            elif event_type == "Greeks" and greeks_symbol is not None:
+                greeks[row[greeks_symbol]] = row
+
+        updated = 0
+        if quotes:
+            bid, ask = quote_fields.index("bidPrice"), quote_fields.index("askPrice")
+            symbols = list(quotes)
+            updated += self.update_quotes(symbols, [_float(quotes[symbol][bid], math.nan) for symbol in symbols],
+                                          [_float(quotes[symbol][ask], math.nan) for symbol in symbols])
+        if greeks:
+            symbols = list(greeks)
+            values = {name: [_float(greeks[symbol][greeks_fields.index(name)]) for symbol in symbols]
+                      for name in _GREEKS if name in greeks_fields}
+            updated += self.update_greeks(symbols, **values)
+        return updated
+
+    def aggregates(self, by="underlying"):
+        """
+        Returns the portfolio metrics per group.
+
+        Args:
+            by (str): "underlying", "expiry" or "strategy".
+
+        Returns:
+            dict: Metrics (delta, gamma, theta, vega, market-value, pnl) per group label. Greeks are position
+            greeks, i.e. per-unit greeks times signed quantity times multiplier.
+        """
+        with self.lock:
+            totals = self.totals[by].copy()
+        return {label: dict(zip(METRICS, row.tolist())) for label, row in zip(self.labels[by], totals)}
+
+    def portfolio_totals(self):
+        """Returns the portfolio-wide metrics."""
+        with self.lock:
+            totals = self.totals[GROUPINGS[0]].sum(axis=0)
+        return dict(zip(METRICS, totals.tolist()))
+
+
+def _float(value, default=0.0):
+    if value is None or value == "NaN":
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _expiry_of(position):
+    expires_at = position.get("expires-at")
+    if expires_at:
+        return expires_at[:10]
+    if position.get("instrument-type") == "Equity Option" and len(position.get("symbol", "")) >= 12:
+        code = position["symbol"][6:12]
+        return f"20{code[:2]}-{code[2:4]}-{code[4:6]}"
+    return None
+
+
+def _row_fields(fields):
+    # DXLinkWebsocketClient.rows() strips the leading eventType from each row
+    return fields[1:] if fields and fields[0] == "eventType" else fields
@@ -0,0 +1,152 @@
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+
+class ChainLoadReport:
+    """
+    The outcome of ChainLoader.load.
+
+    Attributes:
+        loaded (list): Underlyings whose chains were downloaded and passed to the sink.
+        skipped (list): Underlyings already loaded today according to the checkpoint.
+        failed (dict): The last exception of each underlying that failed after all retries.
+        elapsed (float): Seconds spent.
+    """
+
+    __slots__ = ("loaded", "skipped", "failed", "elapsed")
+
+    def __init__(self):
+        self.loaded = []
+        self.skipped = []
+        self.failed = {}
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """Chains loaded per second."""
+        return len(self.loaded) / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (f"ChainLoadReport(loaded={len(self.loaded)}, skipped={len(self.skipped)}, failed={len(self.failed)}, "
+                f"elapsed={self.elapsed:.1f}s)")
+
+
+class ChainLoader:
+    """
+    Downloads the nested option chains of many underlyings concurrently.
+
+    Downloads run in a thread pool, behind the rate limiter if one is given, with a bounded number of requests in
+    flight. Each chain is handed to the sink in the calling thread as soon as it arrives, so the sink does not
+    need to be thread-safe and chains are not accumulated in memory. Underlyings that reached the sink are
+    appended to the checkpoint file; a load interrupted the same day resumes with the remaining ones.
+
+    Example:
+        master = InstrumentMaster("instruments.db")
+        loader = ChainLoader(instruments, lambda symbol, items: master.upsert_option_chain(items),
+                             rate_limiter=RateLimiter(20), checkpoint_path="chains.checkpoint")
+        report = loader.load(underlyings)
+
+    Args:
+        instruments (TastytradeInstruments): Client used to download the chains.
+        sink: Callable receiving (underlying_symbol, chain_items) for every downloaded chain.
+        max_workers (int): Maximum number of concurrent downloads.
+        rate_limiter (RateLimiter): Optional rate limiter taken before each request.
+        checkpoint_path (str): Optional file recording the underlyings loaded today.
+        progress: Optional callable receiving (done, total, chains_per_second) after each underlying.
+        retries (int): Additional attempts for a failed download, with exponential backoff.
+    """
+
+    def __init__(self, instruments, sink, max_workers=16, rate_limiter=None, checkpoint_path=None, progress=None,
+                 retries=2):
+        self.instruments = instruments
+        self.sink = sink
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.checkpoint_path = checkpoint_path
+        self.progress = progress
+        self.retries = retries
+
+    def completed_today(self):
+        """Returns the underlyings the checkpoint records as loaded today."""
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return set()
+        today = date.today().isoformat()
+        with open(self.checkpoint_path) as file:
+            return {line.split()[1] for line in file if line.startswith(today) and len(line.split()) == 2}
+
+    def reset(self):
+        """Deletes the checkpoint, so the next load downloads every underlying."""
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _download(self, symbol):
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                return self.instruments.get_option_chains(symbol)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+
+    def load(self, underlyings):
+        """
+        Downloads the chains of the underlyings not loaded today yet and passes them to the sink.
+
+        Args:
+            underlyings (list): The underlying symbols.
+
+        Returns:
+            ChainLoadReport: The loaded, skipped and failed underlyings and the elapsed time.
+        """
+        report = ChainLoadReport()
+        completed = self.completed_today()
+        pending = []
+        for symbol in dict.fromkeys(underlyings):
+            (report.skipped if symbol in completed else pending).append(symbol)
+
+        total = len(pending)
+        started = time.monotonic()
+        checkpoint = open(self.checkpoint_path, "a") if self.checkpoint_path is not None else None
+        today = date.today().isoformat()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                remaining = iter(pending)
+                in_flight = {}
+                for symbol in remaining:
+                    in_flight[executor.submit(self._download, symbol)] = symbol
+                    if len(in_flight) >= self.max_workers * 2:
+                        break
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        symbol = in_flight.pop(future)
+                        try:
+                            self.sink(symbol, future.result())
+                        except Exception as error:
+                            logger.warning("Loading the option chain of %s failed: %s", symbol, error)
+                            report.failed[symbol] = error
+                        else:
+                            report.loaded.append(symbol)
+                            if checkpoint is not None:
+                                checkpoint.write(f"{today} {symbol}\n")
+                                checkpoint.flush()
+                        for next_symbol in remaining:
+                            in_flight[executor.submit(self._download, next_symbol)] = next_symbol
+                            break
+                        report.elapsed = time.monotonic() - started
+                        if self.progress is not None:
+                            self.progress(len(report.loaded) + len(report.failed), total, report.throughput)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        report.elapsed = time.monotonic() - started
+        logger.info("Loaded %d option chains in %.1fs (%.1f/s), %d failed, %d skipped", len(report.loaded),
+                    report.elapsed, report.throughput, len(report.failed), len(report.skipped))
+        return report
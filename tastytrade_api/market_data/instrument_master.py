@@ -0,0 +1,257 @@
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instruments (
+    symbol TEXT PRIMARY KEY,
+    instrument_type TEXT NOT NULL,
+    underlying_symbol TEXT,
+    root_symbol TEXT,
+    expiration_date TEXT,
+    strike_price REAL,
+    option_type TEXT,
+    streamer_symbol TEXT,
+    multiplier REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS instruments_chain
+    ON instruments (underlying_symbol, expiration_date, option_type, strike_price);
+CREATE INDEX IF NOT EXISTS instruments_expiration ON instruments (expiration_date);
+CREATE INDEX IF NOT EXISTS instruments_streamer_symbol ON instruments (streamer_symbol);
+CREATE TABLE IF NOT EXISTS refresh_state (
+    source TEXT PRIMARY KEY,
+    refreshed_on TEXT NOT NULL
+);
+"""
+
+_COLUMNS = ("symbol", "instrument_type", "underlying_symbol", "root_symbol", "expiration_date", "strike_price",
+            "option_type", "streamer_symbol", "multiplier", "data")
+
+
+class InstrumentMaster:
+    """
+    Local SQLite database of instruments, indexed by symbol, underlying, expiration, strike, option type and
+    streamer symbol.
+
+    The database is filled from the instruments endpoints by refresh(), which reloads each underlying's option
+    chain and each futures product at most once a day and drops expired contracts. The file is opened in WAL
+    mode, so other processes on the host can open the same path and query it while it is being refreshed.
+
+    Example:
+        master = InstrumentMaster("instruments.db", TastytradeInstruments(session_token, api_url))
+        master.refresh(underlyings=["SPY", "QQQ"], future_product_codes=["ES"])
+        master.options("SPY", expiration_date="2023-06-16", option_type="C", min_strike=400, max_strike=410)
+
+    Args:
+        path (str): The database file.
+        instruments (TastytradeInstruments): Client used by refresh(). Not needed for read-only use.
+    """
+
+    def __init__(self, path, instruments=None):
+        self.path = path
+        self.instruments = instruments
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        self.connection.close()
+
+    def _upsert(self, rows):
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO instruments VALUES ({', '.join('?' * len(_COLUMNS))})", rows
+            )
+        return len(rows)
+
+    def upsert_instruments(self, items):
+        """
+        Stores instruments as returned by get_equities, get_equity_options, get_futures or get_cryptocurrencies.
+
+        Args:
+            items (list): The instrument objects.
+
+        Returns:
+            int: The number of instruments stored.
+        """
+        rows = []
+        for item in items:
+            strike_price = item.get("strike-price")
+            option_type = item.get("option-type")
+            multiplier = item.get("shares-per-contract") or item.get("notional-multiplier") or item.get("contract-size")
+            rows.append((
+                item["symbol"],
+                item.get("instrument-type"),
+                item.get("underlying-symbol") or item.get("product-code"),
+                item.get("root-symbol"),
+                item.get("expiration-date"),
+                float(strike_price) if strike_price is not None else None,
+                option_type[0] if option_type else None,
+                item.get("streamer-symbol"),
+                float(multiplier) if multiplier is not None else None,
+                json.dumps(item),
+            ))
+        return self._upsert(rows)
+
+    def upsert_option_chain(self, chains):
+        """
+        Stores the options of nested option chains as returned by get_option_chains.
+
+        Each option is stored as a dictionary with symbol, instrument-type, underlying-symbol, root-symbol,
+        expiration-date, strike-price, option-type ("C" or "P"), streamer-symbol and shares-per-contract.
+
+        Args:
+            chains (list): The nested option chain items.
+
+        Returns:
+            int: The number of options stored.
+        """
+        rows = []
+        for chain in chains:
+            underlying_symbol = chain.get("underlying-symbol")
+            root_symbol = chain.get("root-symbol")
+            shares_per_contract = chain.get("shares-per-contract")
+            multiplier = float(shares_per_contract) if shares_per_contract is not None else None
+            for expiration in chain.get("expirations", []):
+                expiration_date = expiration.get("expiration-date")
+                for strike in expiration.get("strikes", []):
+                    strike_price = float(strike["strike-price"])
+                    for option_type, key in (("C", "call"), ("P", "put")):
+                        symbol = strike.get(key)
+                        if not symbol:
+                            continue
+                        option = {
+                            "symbol": symbol,
+                            "instrument-type": "Equity Option",
+                            "underlying-symbol": underlying_symbol,
+                            "root-symbol": root_symbol,
+                            "expiration-date": expiration_date,
+                            "strike-price": strike["strike-price"],
+                            "option-type": option_type,
+                            "streamer-symbol": strike.get(f"{key}-streamer-symbol"),
+                            "shares-per-contract": shares_per_contract,
+                        }
+                        rows.append((symbol, "Equity Option", underlying_symbol, root_symbol, expiration_date,
+                                     strike_price, option_type, option["streamer-symbol"], multiplier,
+                                     json.dumps(option)))
+        return self._upsert(rows)
+
+    def remove_expired(self, today=None):
+        """Deletes instruments that expired before today. Returns the number of instruments deleted."""
+        today = (today or date.today()).isoformat()
+        with self.lock, self.connection:
+            return self.connection.execute("DELETE FROM instruments WHERE expiration_date < ?", (today,)).rowcount
+
+    def refreshed_on(self, source):
+        row = self.connection.execute("SELECT refreshed_on FROM refresh_state WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def _mark_refreshed(self, source, today):
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO refresh_state VALUES (?, ?)", (source, today))
+
+    def refresh(self, underlyings=(), future_product_codes=(), force=False):
+        """
+        Loads the equities and option chains of the underlyings and the futures of the product codes that were not
+        refreshed today yet, and deletes expired contracts.
+
+        Args:
+            underlyings (list): Equity or index symbols whose equity and option chain are loaded.
+            future_product_codes (list): Futures product codes, e.g. "ES".
+            force (bool): Reload sources that were already refreshed today.
+
+        Returns:
+            dict: The number of instruments stored per source that was reloaded.
+        """
+        today = date.today().isoformat()
+        loaded = {}
+        for symbol in underlyings:
+            source = f"option-chain:{symbol}"
+            if not force and self.refreshed_on(source) == today:
+                continue
+            count = self.upsert_instruments(self.instruments.get_equities(symbol))
+            count += self.upsert_option_chain(self.instruments.get_option_chains(symbol))
+            self._mark_refreshed(source, today)
+            loaded[source] = count
+        for product_code in future_product_codes:
+            source = f"futures:{product_code}"
+            if not force and self.refreshed_on(source) == today:
+                continue
+            loaded[source] = self.upsert_instruments(self.instruments.get_futures(product_codes=[product_code]))
+            self._mark_refreshed(source, today)
+        removed = self.remove_expired()
+        if loaded or removed:
+            logger.info("Refreshed instruments %s, removed %d expired", loaded, removed)
+        return loaded
+
+    def _fetch(self, sql, params):
+        return [json.loads(row[0]) for row in self.connection.execute(sql, params)]
+
+    def get(self, symbol):
+        """Returns the instrument with the given symbol, or None."""
+        row = self.connection.execute("SELECT data FROM instruments WHERE symbol = ?", (symbol,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def by_streamer_symbol(self, streamer_symbol):
+        """Returns the instrument with the given streamer symbol, or None."""
+        row = self.connection.execute(
+            "SELECT data FROM instruments WHERE streamer_symbol = ?", (streamer_symbol,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def listings(self):
+        """Returns the stored instruments that are not options, e.g. to build a SymbolSearchIndex."""
+        return self._fetch("SELECT data FROM instruments WHERE strike_price IS NULL ORDER BY symbol", ())
+
+    def multiplier(self, symbol):
+        """Returns the contract multiplier of a symbol, or None if it is unknown."""
+        row = self.connection.execute("SELECT multiplier FROM instruments WHERE symbol = ?", (symbol,)).fetchone()
+        return row[0] if row else None
+
+    def expirations(self, underlying_symbol):
+        """Returns the option expiration dates of an underlying, sorted."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT expiration_date FROM instruments WHERE underlying_symbol = ? AND strike_price IS NOT NULL"
+            " ORDER BY expiration_date", (underlying_symbol,)
+        )]
+
+    def options(self, underlying_symbol, expiration_date=None, option_type=None, min_strike=None, max_strike=None):
+        """
+        Returns the options of an underlying matching all given filters, sorted by expiration and strike.
+
+        Args:
+            underlying_symbol (str): The underlying symbol.
+            expiration_date (str): Only options expiring on this date (YYYY-MM-DD).
+            option_type (str): "C" or "P".
+            min_strike (float): Only strikes at or above this price.
+            max_strike (float): Only strikes at or below this price.
+
+        Returns:
+            list: The option instruments.
+        """
+        clauses = ["underlying_symbol = ?", "strike_price IS NOT NULL"]
+        params = [underlying_symbol]
+        if expiration_date is not None:
+            clauses.append("expiration_date = ?")
+            params.append(expiration_date)
+        if option_type is not None:
+            clauses.append("option_type = ?")
+            params.append(option_type[0])
+        if min_strike is not None:
+            clauses.append("strike_price >= ?")
+            params.append(float(min_strike))
+        if max_strike is not None:
+            clauses.append("strike_price <= ?")
+            params.append(float(max_strike))
+        return self._fetch(
+            f"SELECT data FROM instruments WHERE {' AND '.join(clauses)} ORDER BY expiration_date, strike_price, option_type",
+            params,
+        )
@@ -1,5 +1,7 @@
 import requests
 import json
+import threading
+import time
 from typing import List, Dict, Any
 import urllib
 
@@ -9,9 +11,15 @@ class TastytradeInstruments:
     Implements the Tastytrade Instruments API - https://developer.tastytrade.com/open-api-spec/instruments/
     """
 
+    FUTURE_OPTION_PRODUCTS_TTL = 86400
+
     def __init__(self, session_token: str, api_url: str):
         self.session_token = session_token
         self.api_url = api_url
+        self.future_option_products = {}
+        self.future_option_product_index = None
+        self.future_option_product_index_time = 0
+        self.future_option_products_lock = threading.Lock()
 
     def get_cryptocurrencies(self, symbols: List[str] = None) -> List[dict]:
         """
@@ -280,20 +288,144 @@ class TastytradeInstruments:
                 f"Error getting future option products: {response.status_code} - {response.content}"
             )
 
-    """
-    TBD: Get a future option product by exchange and root symbol 
-    /instruments/future-option-products/{exchange}/{root_symbol}
-    """
+    def get_future_option_product_index(self, refresh=False):
+        """
+        Returns all future option products indexed by (exchange, root symbol).
 
-    """
-    TBD: Get a future option product by exchange and root symbol
-    /instruments/future-option-products/{exchange}/{root_symbol}
-    """
+        The product list is downloaded with get_future_option_products once and cached for
+        FUTURE_OPTION_PRODUCTS_TTL seconds, so later lookups do not download and scan the list again.
 
-    """
-    TBD: /instruments/future-options and /instruments/future-options/{symbol}
-        Returns a set of future option(s) given an array of one or more symbols.
-    """
+        Args:
+            refresh (bool): Download the product list even if the cached one is still valid.
+
+        Returns:
+            dict: Future option product objects keyed by (exchange, root symbol).
+
+        Raises:
+            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+        """
+        with self.future_option_products_lock:
+            expired = time.monotonic() - self.future_option_product_index_time > self.FUTURE_OPTION_PRODUCTS_TTL
+            if refresh or self.future_option_product_index is None or expired:
+                self.future_option_product_index = {
+                    (product.get("exchange"), product.get("root-symbol")): product
+                    for product in self.get_future_option_products()
+                }
+                self.future_option_product_index_time = time.monotonic()
+                # The fresh index supersedes products fetched one by one
+                self.future_option_products = {}
+            return self.future_option_product_index
+
+    def get_future_option_product(self, exchange: str, root_symbol: str) -> dict:
+        """
+        Returns a future option product by exchange and root symbol.
+
+        The product is taken from the product index if it was loaded and has not expired, otherwise it is fetched
+        from the /instruments/future-option-products/{exchange}/{root_symbol} API endpoint and cached for
+        FUTURE_OPTION_PRODUCTS_TTL seconds as well.
+
+        Args:
+            exchange (str): The exchange of the product, e.g. "CME".
+            root_symbol (str): The option root symbol, e.g. "EW4".
+
+        Returns:
+            dict: The future option product object, as returned by the API.
+
+        Raises:
+            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+        """
+        key = (exchange, root_symbol)
+        with self.future_option_products_lock:
+            now = time.monotonic()
+            index = self.future_option_product_index
+            if index is not None and now - self.future_option_product_index_time <= self.FUTURE_OPTION_PRODUCTS_TTL:
+                product = index.get(key)
+                if product is not None:
+                    return product
+            cached = self.future_option_products.get(key)
+            if cached is not None and now - cached[1] <= self.FUTURE_OPTION_PRODUCTS_TTL:
+                return cached[0]
+
+        headers = {"Authorization": f"{self.session_token}"}
+        response = requests.get(
+            f"{self.api_url}/instruments/future-option-products/{exchange}/{root_symbol}",
+            headers=headers,
+        )
+
+        if response.status_code == 200:
+            response_data = json.loads(response.content)
+            product = response_data["data"]
+            with self.future_option_products_lock:
+                self.future_option_products[key] = (product, time.monotonic())
+            return product
+        else:
+            raise Exception(
+                f"Error getting future option product {exchange}/{root_symbol}: {response.status_code} - {response.content}"
+            )
+
+    def get_future_options(self, symbols, option_root_symbol=None, expiration_date=None, option_type=None,
+                           strike_price=None, batch_size=100):
+        """
+        Makes GET requests to the /instruments/future-options API endpoint for the specified future option symbols,
+        and returns a list of future option objects.
+
+        Args:
+            symbols (Union[str, List[str]]): A single future option symbol or a list of future option symbols. If a
+                single symbol is passed, the /instruments/future-options/{symbol} endpoint will be used. A list is
+                requested from the /instruments/future-options endpoint in batches of batch_size symbols.
+            option_root_symbol (str): Optional. The option root symbol to filter by, e.g. "EW4".
+            expiration_date (str): Optional. The expiration date to filter by, in YYYY-MM-DD format.
+            option_type (str): Optional. "C" or "P".
+            strike_price (str): Optional. The strike price to filter by.
+            batch_size (int): The maximum number of symbols per request.
+
+        Returns:
+            list: List of future option objects, as returned by the API.
+
+        Raises:
+            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+        """
+        headers = {"Authorization": f"{self.session_token}"}
+
+        if isinstance(symbols, str):
+            response = requests.get(
+                f"{self.api_url}/instruments/future-options/{urllib.parse.quote(symbols, safe='')}",
+                headers=headers,
+            )
+            if response.status_code == 200:
+                response_data = json.loads(response.content)
+                return [response_data["data"]]
+            else:
+                raise Exception(
+                    f"Error getting future option {symbols}: {response.status_code} - {response.content}"
+                )
+
+        params = {}
+        if option_root_symbol:
+            params["option-root-symbol"] = option_root_symbol
+        if expiration_date:
+            params["expiration-date"] = expiration_date
+        if option_type:
+            params["option-type"] = option_type
+        if strike_price is not None:
+            params["strike-price"] = strike_price
+
+        symbols = list(symbols or [])
+        batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)] or [[]]
+        future_options = []
+        for batch in batches:
+            batch_params = dict(params, **{"symbol[]": batch}) if batch else params
+            response = requests.get(
+                f"{self.api_url}/instruments/future-options", headers=headers, params=batch_params
+            )
+            if response.status_code == 200:
+                response_data = json.loads(response.content)
+                future_options.extend(response_data["data"]["items"])
+            else:
+                raise Exception(
+                    f"Error getting future options: {response.status_code} - {response.content}"
+                )
+        return future_options
 
     def get_future_products(self):
         """
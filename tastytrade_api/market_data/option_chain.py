@@ -0,0 +1,183 @@
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, see the "analytics" extra
+    np = None
+
+CALL = 0
+PUT = 1
+
+
+class OptionChain:
+    """
+    Columnar option chain of one underlying root, built once from a nested get_option_chains item.
+
+    Each row is one (expiration, strike) pair; rows are sorted by expiration and then strike, so the strikes of an
+    expiration are a contiguous, sorted slice that binary searches run on. Calls and puts share the row: per-contract
+    values such as streamed greeks or quotes fit an array of shape (len(chain), 2), indexed by row and CALL or PUT,
+    see new_column() and locate().
+
+    Example:
+        chain = OptionChain.from_response(instruments.get_option_chains("SPY"))[0]
+        expiration = chain.expiration_for_dte(30)
+        rows = chain.strike_range(expiration, 390, 410)
+        chain.call_streamer_symbols[rows]
+
+    Attributes:
+        underlying_symbol (str): The underlying symbol.
+        root_symbol (str): The option root symbol.
+        shares_per_contract (int): The contract multiplier.
+        expiration_dates (numpy.ndarray): datetime64[D] expiration of each row.
+        strikes (numpy.ndarray): float64 strike price of each row.
+        call_symbols, put_symbols (numpy.ndarray): Option symbols of each row (None where missing).
+        call_streamer_symbols, put_streamer_symbols (numpy.ndarray): Streamer symbols of each row.
+        expirations (numpy.ndarray): The sorted unique expirations (datetime64[D]).
+
+    Args:
+        chain (dict): One item of the get_option_chains response.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+
+    def __init__(self, chain):
+        if np is None:
+            raise ImportError("OptionChain requires numpy, install it with: pip install tastytrade-api[analytics]")
+        self.underlying_symbol = chain.get("underlying-symbol")
+        self.root_symbol = chain.get("root-symbol")
+        self.shares_per_contract = chain.get("shares-per-contract")
+
+        expiration_dates = []
+        strikes = []
+        columns = {"call": [], "put": [], "call-streamer-symbol": [], "put-streamer-symbol": []}
+        for expiration in chain.get("expirations", []):
+            for strike in expiration.get("strikes", []):
+                expiration_dates.append(expiration["expiration-date"])
+                strikes.append(float(strike["strike-price"]))
+                for key, values in columns.items():
+                    values.append(strike.get(key))
+
+        expiration_dates = np.array(expiration_dates, dtype="datetime64[D]")
+        strikes = np.array(strikes, dtype=np.float64)
+        order = np.lexsort((strikes, expiration_dates))
+        self.expiration_dates = expiration_dates[order]
+        self.strikes = strikes[order]
+        self.call_symbols = np.array(columns["call"], dtype=object)[order]
+        self.put_symbols = np.array(columns["put"], dtype=object)[order]
+        self.call_streamer_symbols = np.array(columns["call-streamer-symbol"], dtype=object)[order]
+        self.put_streamer_symbols = np.array(columns["put-streamer-symbol"], dtype=object)[order]
+
+        self.expirations, starts = np.unique(self.expiration_dates, return_index=True)
+        self.expiration_starts = np.append(starts, len(self.strikes))
+
+        self.index = {}
+        for side, symbols in ((CALL, self.call_symbols), (PUT, self.put_symbols),
+                              (CALL, self.call_streamer_symbols), (PUT, self.put_streamer_symbols)):
+            for row, symbol in enumerate(symbols):
+                if symbol is not None:
+                    self.index[symbol] = (row, side)
+
+    @classmethod
+    def from_response(cls, items):
+        """Returns an OptionChain per item of a get_option_chains response, e.g. one per root symbol."""
+        return [cls(item) for item in items]
+
+    def __len__(self):
+        return len(self.strikes)
+
+    def _bounds(self, expiration):
+        position = np.searchsorted(self.expirations, np.datetime64(expiration, "D"))
+        if position == len(self.expirations) or self.expirations[position] != np.datetime64(expiration, "D"):
+            raise KeyError(f"No expiration {expiration} in the {self.root_symbol} chain")
+        return int(self.expiration_starts[position]), int(self.expiration_starts[position + 1])
+
+    def days_to_expiration(self, today=None):
+        """Returns the days to expiration of each row as an int array."""
+        today = np.datetime64(today or date.today(), "D")
+        return (self.expiration_dates - today).astype(np.int64)
+
+    def expiration_for_dte(self, target_dte, today=None):
+        """
+        Returns the expiration closest to a target number of days to expiration.
+
+        Ties are resolved towards the later expiration.
+
+        Returns:
+            numpy.datetime64: The expiration, or None if the chain is empty.
+        """
+        if not len(self.expirations):
+            return None
+        today = np.datetime64(today or date.today(), "D")
+        target = today + np.timedelta64(int(target_dte), "D")
+        position = int(np.searchsorted(self.expirations, target))
+        candidates = self.expirations[max(position - 1, 0):position + 1]
+        distances = np.abs((candidates - target).astype(np.int64))
+        # argmin returns the first minimum, search the reversed distances to prefer the later expiration
+        return candidates[len(distances) - 1 - int(np.argmin(distances[::-1]))]
+
+    def strikes_for(self, expiration):
+        """Returns the sorted strikes of an expiration (a view, do not modify)."""
+        start, end = self._bounds(expiration)
+        return self.strikes[start:end]
+
+    def nearest_strike(self, expiration, price):
+        """
+        Returns the row of the strike closest to a price, e.g. the at-the-money strike for the underlying price.
+
+        Raises:
+            KeyError: If the expiration is not in the chain.
+        """
+        start, end = self._bounds(expiration)
+        strikes = self.strikes[start:end]
+        position = int(np.searchsorted(strikes, price))
+        if position == len(strikes) or (position > 0 and price - strikes[position - 1] <= strikes[position] - price):
+            position -= 1
+        return start + position
+
+    def strike_range(self, expiration, low, high):
+        """Returns the rows of an expiration with strikes from low to high inclusive, as a slice."""
+        start, end = self._bounds(expiration)
+        strikes = self.strikes[start:end]
+        return slice(start + int(np.searchsorted(strikes, low, "left")),
+                     start + int(np.searchsorted(strikes, high, "right")))
+
+    def filter(self, min_dte=None, max_dte=None, min_strike=None, max_strike=None, today=None):
+        """Returns the rows matching all given bounds (inclusive) as an index array."""
+        mask = np.ones(len(self), dtype=bool)
+        if min_dte is not None or max_dte is not None:
+            dte = self.days_to_expiration(today)
+            if min_dte is not None:
+                mask &= dte >= min_dte
+            if max_dte is not None:
+                mask &= dte <= max_dte
+        if min_strike is not None:
+            mask &= self.strikes >= min_strike
+        if max_strike is not None:
+            mask &= self.strikes <= max_strike
+        return np.flatnonzero(mask)
+
+    def new_column(self, fill=float("nan")):
+        """Returns a (len(chain), 2) float array for per-contract values, indexed by row and CALL or PUT."""
+        return np.full((len(self), 2), fill)
+
+    def locate(self, symbols):
+        """
+        Returns the rows and sides of option or streamer symbols, to scatter streamed values into a column.
+
+        Unknown symbols get row -1, so they can be masked out with ``rows >= 0``.
+
+        Example:
+            rows, sides = chain.locate(event_symbols)
+            known = rows >= 0
+            deltas[rows[known], sides[known]] = event_deltas[known]
+
+        Returns:
+            tuple: (rows, sides) int arrays.
+        """
+        index = self.index
+        rows = np.empty(len(symbols), dtype=np.intp)
+        sides = np.empty(len(symbols), dtype=np.intp)
+        for position, symbol in enumerate(symbols):
+            rows[position], sides[position] = index.get(symbol, (-1, CALL))
+        return rows, sides
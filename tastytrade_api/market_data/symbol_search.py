@@ -0,0 +1,142 @@
+import bisect
+import itertools
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolSearchIndex:
+    """
+    In-process prefix search over symbols and descriptions, for autocompletion without a request per keystroke.
+
+    Symbols and description words are kept in sorted lists, so a prefix search is two binary searches and a
+    slice. Queries without local matches fall back to TastytradeInstruments.get_symbol_data once; the results
+    are added to the index and misses are remembered.
+
+    Example:
+        index = SymbolSearchIndex.from_active_equities(instruments)
+        index.search("AAP")  # [{"symbol": "AAP", ...}, {"symbol": "AAPL", ...}, ...]
+
+    Args:
+        entries (list): Symbol objects with at least "symbol" and optionally "description", e.g. equities or
+            get_symbol_data results.
+        instruments (TastytradeInstruments): Optional client used for the fallback search.
+    """
+
+    def __init__(self, entries=(), instruments=None):
+        self.instruments = instruments
+        self.entries = {}
+        self.symbols = []
+        self.words = []
+        self.words_set = set()
+        self.misses = set()
+        self.lock = threading.Lock()
+        self.add(entries)
+
+    @classmethod
+    def from_active_equities(cls, instruments, per_page=1000):
+        """Builds an index of all active equities, paging through get_active_equities."""
+        entries = []
+        page_offset = 0
+        while True:
+            response = instruments.get_active_equities(per_page=per_page, page_offset=page_offset)
+            entries.extend(response["data"]["items"])
+            page_offset += 1
+            if page_offset >= response.get("pagination", {}).get("total-pages", 1):
+                break
+        return cls(entries, instruments)
+
+    @classmethod
+    def from_instrument_master(cls, master, instruments=None):
+        """Builds an index of the equities, futures and other non-option instruments of an InstrumentMaster."""
+        return cls(master.listings(), instruments)
+
+    def add(self, entries):
+        """Adds symbol objects to the index, replacing entries with the same symbol."""
+        with self.lock:
+            symbols = []
+            words = set()
+            replaced = set()
+            for entry in entries:
+                symbol = entry["symbol"].upper()
+                old = self.entries.get(symbol)
+                if old is None:
+                    symbols.append(symbol)
+                else:
+                    old_words = _description_words(old, symbol)
+                    replaced.update(old_words)
+                    words.difference_update(old_words)
+                self.entries[symbol] = entry
+                words.update(_description_words(entry, symbol))
+            # Words of replaced descriptions must no longer match their symbol
+            replaced.difference_update(words)
+            replaced.intersection_update(self.words_set)
+            if replaced:
+                self.words_set.difference_update(replaced)
+                self.words = [word for word in self.words if word not in replaced]
+            if symbols:
+                # Sorting a sorted list with a sorted tail is a linear merge
+                self.symbols = self.symbols + sorted(symbols)
+                self.symbols.sort()
+            words.difference_update(self.words_set)
+            if words:
+                self.words_set.update(words)
+                self.words = self.words + sorted(words)
+                self.words.sort()
+
+    def _prefix(self, keys, prefix, limit):
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + "\uffff", start)
+        return keys[start:min(end, start + limit)]
+
+    def search(self, query, limit=10, descriptions=True, fallback=True):
+        """
+        Returns the entries whose symbol, or a word of whose description, starts with the query.
+
+        Symbol matches come first, in symbol order, followed by description matches.
+
+        Args:
+            query (str): The prefix, case-insensitive.
+            limit (int): Maximum number of entries returned.
+            descriptions (bool): Also match description words.
+            fallback (bool): Ask get_symbol_data if nothing matches locally.
+
+        Returns:
+            list: The matching entries.
+        """
+        prefix = query.strip().upper()
+        if not prefix:
+            return []
+        symbols = self._prefix(self.symbols, prefix, limit)
+        if descriptions and len(symbols) < limit:
+            seen = set(symbols)
+            start = bisect.bisect_left(self.words, (prefix,))
+            for word, symbol in itertools.islice(self.words, start, None):
+                if not word.startswith(prefix) or len(symbols) >= limit:
+                    break
+                if symbol not in seen:
+                    seen.add(symbol)
+                    symbols.append(symbol)
+        if not symbols and fallback:
+            return self._fallback(prefix, limit)
+        entries = self.entries
+        return [entries[symbol] for symbol in symbols]
+
+    def _fallback(self, prefix, limit):
+        if self.instruments is None or prefix in self.misses:
+            return []
+        try:
+            results = self.instruments.get_symbol_data(prefix)
+        except Exception as error:
+            logger.warning("Symbol search for %s failed: %s", prefix, error)
+            return []
+        if not results:
+            self.misses.add(prefix)
+            return []
+        self.add(results)
+        return results[:limit]
+
+
+def _description_words(entry, symbol):
+    return {(word, symbol) for word in (entry.get("description") or "").upper().split()}
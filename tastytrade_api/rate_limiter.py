@@ -0,0 +1,46 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket used to keep concurrent API requests under a request rate.
+
+    A single instance can be shared by several clients so they draw from the same budget.
+
+    Args:
+        rate (float): Requests allowed per second on average.
+        burst (int): Maximum number of requests that can be sent back to back. Defaults to rate.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Blocks until the requested number of tokens is available and takes them.
+
+        Args:
+            tokens (int): The number of tokens (requests) to take.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        return False
@@ -0,0 +1,204 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_ORDER_STATUSES = {"Filled", "Cancelled", "Expired", "Rejected", "Removed", "Partially Removed"}
+
+
+class AccountEvent:
+    """
+    A message received from the account streamer.
+
+    Messages of known types are decoded into the subclasses below, which expose the commonly used fields as
+    attributes. Unknown message types are returned as plain AccountEvent objects without further parsing.
+
+    Attributes:
+        type (str): The message type, e.g. "Order" or "AccountBalance". None for action responses.
+        action (str): The action a response refers to, e.g. "heartbeat" or "connect". None for notifications.
+        timestamp (int): The message timestamp in milliseconds since the epoch, if present.
+        data: The message payload, as returned by the API. The typed subclasses are only used for dictionary
+            payloads (and lists for PublicWatchlists); anything else, e.g. "data": null, decodes as AccountEvent.
+    """
+
+    __slots__ = ("type", "action", "timestamp", "data")
+
+    # Payload types a class can decode; other payloads are left to a plain AccountEvent
+    _payload_types = (object,)
+
+    def __init__(self, type, action, timestamp, data):
+        self.type = type
+        self.action = action
+        self.timestamp = timestamp
+        self.data = data
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(type={self.type!r}, action={self.action!r}, timestamp={self.timestamp!r})"
+
+
+class OrderEvent(AccountEvent):
+    """An Order or ComplexOrder notification."""
+
+    __slots__ = ("id", "account_number", "status", "underlying_symbol", "order_type", "time_in_force", "price",
+                 "price_effect", "size", "legs", "updated_at")
+    _payload_types = (dict,)
+
+    def __init__(self, type, action, timestamp, data):
+        super().__init__(type, action, timestamp, data)
+        self.id = data.get("id")
+        self.account_number = data.get("account-number")
+        self.status = data.get("status")
+        self.underlying_symbol = data.get("underlying-symbol")
+        self.order_type = data.get("order-type")
+        self.time_in_force = data.get("time-in-force")
+        self.price = data.get("price")
+        self.price_effect = data.get("price-effect")
+        self.size = data.get("size")
+        self.legs = data.get("legs", [])
+        self.updated_at = data.get("updated-at")
+
+
+class PositionEvent(AccountEvent):
+    """A CurrentPosition notification."""
+
+    __slots__ = ("account_number", "symbol", "instrument_type", "underlying_symbol", "quantity",
+                 "quantity_direction", "average_open_price", "multiplier", "updated_at")
+    _payload_types = (dict,)
+
+    def __init__(self, type, action, timestamp, data):
+        super().__init__(type, action, timestamp, data)
+        self.account_number = data.get("account-number")
+        self.symbol = data.get("symbol")
+        self.instrument_type = data.get("instrument-type")
+        self.underlying_symbol = data.get("underlying-symbol")
+        self.quantity = data.get("quantity")
+        self.quantity_direction = data.get("quantity-direction")
+        self.average_open_price = data.get("average-open-price")
+        self.multiplier = data.get("multiplier")
+        self.updated_at = data.get("updated-at")
+
+
+class AccountBalanceEvent(AccountEvent):
+    """An AccountBalance notification."""
+
+    __slots__ = ("account_number", "cash_balance", "net_liquidating_value", "equity_buying_power",
+                 "derivative_buying_power", "maintenance_requirement", "updated_at")
+    _payload_types = (dict,)
+
+    def __init__(self, type, action, timestamp, data):
+        super().__init__(type, action, timestamp, data)
+        self.account_number = data.get("account-number")
+        self.cash_balance = data.get("cash-balance")
+        self.net_liquidating_value = data.get("net-liquidating-value")
+        self.equity_buying_power = data.get("equity-buying-power")
+        self.derivative_buying_power = data.get("derivative-buying-power")
+        self.maintenance_requirement = data.get("maintenance-requirement")
+        self.updated_at = data.get("updated-at")
+
+
+class QuoteAlertEvent(AccountEvent):
+    """A QuoteAlert notification."""
+
+    __slots__ = ("alert_external_id", "symbol", "field", "operator", "threshold", "triggered_at")
+    _payload_types = (dict,)
+
+    def __init__(self, type, action, timestamp, data):
+        super().__init__(type, action, timestamp, data)
+        self.alert_external_id = data.get("alert-external-id")
+        self.symbol = data.get("symbol")
+        self.field = data.get("field")
+        self.operator = data.get("operator")
+        self.threshold = data.get("threshold")
+        self.triggered_at = data.get("triggered-at")
+
+
+class PublicWatchlistsEvent(AccountEvent):
+    """A PublicWatchlists notification."""
+
+    __slots__ = ("watchlists",)
+    _payload_types = (list, dict)
+
+    def __init__(self, type, action, timestamp, data):
+        super().__init__(type, action, timestamp, data)
+        self.watchlists = data if isinstance(data, list) else [data]
+
+
+EVENT_TYPES = {
+    "Order": OrderEvent,
+    "ComplexOrder": OrderEvent,
+    "CurrentPosition": PositionEvent,
+    "Position": PositionEvent,
+    "AccountBalance": AccountBalanceEvent,
+    "QuoteAlert": QuoteAlertEvent,
+    "PublicWatchlists": PublicWatchlistsEvent,
+}
+
+
+def decode_message(message):
+    """
+    Decodes an account streamer message into the event class registered for its type in EVENT_TYPES.
+
+    Args:
+        message (Union[str, bytes, dict]): The raw JSON message, or the already parsed dictionary.
+
+    Returns:
+        AccountEvent: The decoded message.
+    """
+    if not isinstance(message, dict):
+        message = json.loads(message)
+        if not isinstance(message, dict):
+            return AccountEvent(None, None, None, message)
+    message_type = message.get("type")
+    data = message.get("data", message)
+    event_class = EVENT_TYPES.get(message_type, AccountEvent)
+    if not isinstance(data, event_class._payload_types):
+        logger.warning("Unexpected %s message payload: %r", message_type, data)
+        event_class = AccountEvent
+    return event_class(message_type, message.get("action"), message.get("timestamp"), data)
+
+
+class AccountEventDispatcher:
+    """
+    Dispatch table of account streamer event handlers keyed by message type.
+
+    Example:
+        dispatcher = AccountEventDispatcher()
+        dispatcher.register("Order", lambda event: print(event.id, event.status))
+        dispatcher.dispatch(decode_message(message))
+    """
+
+    def __init__(self):
+        self.handlers = {}
+
+    def register(self, message_type, handler):
+        """
+        Registers a handler for a message type.
+
+        Args:
+            message_type (str): The message type, e.g. "Order". None registers a handler for action responses.
+            handler (callable): Called with the decoded AccountEvent.
+        """
+        self.handlers.setdefault(message_type, []).append(handler)
+
+    def unregister(self, message_type, handler):
+        self.handlers[message_type].remove(handler)
+
+    def dispatch(self, event):
+        """
+        Calls the handlers registered for the event's type.
+
+        Args:
+            event (AccountEvent): The decoded event.
+
+        Returns:
+            bool: True if at least one handler was registered for the type.
+        """
+        handlers = self.handlers.get(event.type)
+        if not handlers:
+            return False
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Handler for %s message failed", event.type)
+        return True
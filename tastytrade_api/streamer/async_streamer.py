@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+import time
+
+import websockets
+
+from .account_events import AccountEventDispatcher, decode_message
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTastytradeStreamer:
+    """
+    asyncio implementation of the account streamer.
+
+    It runs on the caller's event loop, so it can share the loop with the dxfeed clients instead of
+    starting a websocket thread and a heartbeat thread per instance like TastytradeStreamer does.
+
+    Example:
+        async with AsyncTastytradeStreamer(session_token, websocket_url) as streamer:
+            await streamer.connect_account(["5WT00000"])
+            async for event in streamer:
+                print(event.type, event.data)
+    """
+
+    def __init__(self, session_token, websocket_url, heartbeat_interval=30, latency=None, auto_reconnect=True,
+                 reconnect_delay=1, on_reconnect=None, max_reconnect_delay=30):
+        """
+        Args:
+            session_token (str): The session token used to authenticate.
+            websocket_url (str): The URL of the account streamer.
+            heartbeat_interval (int): The interval between heartbeat messages in seconds.
+            latency (LatencyRecorder): Optional recorder for decode and message timestamp to receive latencies.
+            auto_reconnect (bool): Reconnect and resubscribe when the connection drops while iterating.
+            reconnect_delay (float): Seconds to wait before the first reconnect attempt. The delay doubles with
+                every further failed attempt, up to max_reconnect_delay.
+            on_reconnect (callable): Optional callback called with the streamer after it reconnected and resubscribed,
+                before further messages are received, e.g. AccountStateStore.start_resync.
+            max_reconnect_delay (float): The longest wait between reconnect attempts in seconds.
+        """
+        self.session_token = session_token
+        self.websocket_url = websocket_url
+        self.heartbeat_interval = heartbeat_interval
+        self.latency = latency
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_reconnect = on_reconnect
+        self.websocket = None
+        self.heartbeat_task = None
+        self.closed = False
+        self.subscriptions = {}
+        self.dispatcher = AccountEventDispatcher()
+
+    async def connect(self):
+        """Opens the websocket connection and schedules the heartbeat on the running loop."""
+        self.closed = False
+        self.websocket = await websockets.connect(self.websocket_url)
+        self.heartbeat_task = asyncio.ensure_future(self.send_heartbeats())
+        logger.info("WebSocket opened")
+
+    async def close(self):
+        """Stops the heartbeat and closes the websocket connection. Iteration stops instead of reconnecting."""
+        self.closed = True
+        await self._disconnect()
+
+    async def _disconnect(self):
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            await asyncio.gather(self.heartbeat_task, return_exceptions=True)
+            self.heartbeat_task = None
+        if self.websocket is not None:
+            await self.websocket.close()
+            self.websocket = None
+        logger.info("WebSocket closed")
+
+    async def reconnect(self):
+        """Opens a new connection and replays the subscriptions sent on the previous one."""
+        await self._disconnect()
+        await self.connect()
+        for action, value in list(self.subscriptions.items()):
+            await self.send(action, value)
+        logger.info("Reconnected and resubscribed to %s", ", ".join(self.subscriptions) or "nothing")
+        if self.on_reconnect is not None:
+            self.on_reconnect(self)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def send(self, action, value=""):
+        """
+        Sends an action message to the streamer.
+
+        Args:
+            action (str): The action, e.g. "heartbeat" or "connect".
+            value: The action value.
+        """
+        await self.websocket.send(json.dumps({"auth-token": self.session_token, "action": action, "value": value}))
+        if action == "connect":
+            # Each connect message adds accounts, so the replay on reconnect must cover all of them
+            accounts = self.subscriptions.get("connect", [])
+            self.subscriptions[action] = accounts + [account for account in value if account not in accounts]
+        elif action != "heartbeat":
+            self.subscriptions[action] = value
+        logger.debug("Sent %s message", action)
+
+    async def send_heartbeats(self):
+        while True:
+            await self.send("heartbeat")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    async def connect_account(self, account_numbers):
+        """Subscribes to account level updates.
+
+        Args:
+            account_numbers (list): A list of account numbers to subscribe to.
+        """
+        await self.send("connect", account_numbers)
+
+    async def public_watchlists_subscribe(self):
+        """Subscribes to public watchlist updates."""
+        await self.send("public-watchlists-subscribe")
+
+    async def quote_alerts_subscribe(self):
+        """Subscribes to quote alert messages."""
+        await self.send("quote-alerts-subscribe")
+
+    async def user_message_subscribe(self, user_external_id):
+        """Subscribes to user-level messages.
+
+        Args:
+            user_external_id (str): The user's external-id returned in the POST /sessions response.
+        """
+        await self.send("user-message-subscribe", user_external_id)
+
+    async def receive(self):
+        """
+        Waits for the next message.
+
+        Returns:
+            AccountEvent: The decoded message.
+
+        Raises:
+            websockets.ConnectionClosed: If the connection was closed.
+        """
+        message = await self.websocket.recv()
+        if self.latency is None or not self.latency.enabled:
+            return decode_message(message)
+
+        received_ns = time.perf_counter_ns()
+        received_wall_ns = time.time_ns()
+        event = decode_message(message)
+        message_type = event.type or event.action or "unknown"
+        self.latency.record_since(message_type, "decode", received_ns)
+        self.latency.record_event_time(message_type, event.timestamp, received_wall_ns)
+        return event
+
+    def add_handler(self, message_type, handler):
+        """Registers a handler for a message type, called by run().
+
+        Args:
+            message_type (str): The message type, e.g. "Order", "CurrentPosition" or "AccountBalance".
+            handler (callable): Called with the decoded AccountEvent.
+        """
+        self.dispatcher.register(message_type, handler)
+
+    async def run(self):
+        """Receives messages until the connection is closed and passes them to the registered handlers."""
+        async for event in self:
+            self.dispatcher.dispatch(event)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        failures = 0
+        while True:
+            if self.closed:
+                raise StopAsyncIteration
+            try:
+                if self.websocket is None:
+                    await self.reconnect()
+                return await self.receive()
+            except websockets.ConnectionClosedOK:
+                raise StopAsyncIteration
+            except (websockets.ConnectionClosedError, websockets.InvalidHandshake, asyncio.TimeoutError,
+                    OSError) as error:
+                if not self.auto_reconnect:
+                    raise
+                delay = min(self.reconnect_delay * 2 ** failures, self.max_reconnect_delay)
+                failures += 1
+                logger.warning("Account streamer connection lost: %s, reconnecting in %ss", error, delay)
+                await self._disconnect()
+                await asyncio.sleep(delay)
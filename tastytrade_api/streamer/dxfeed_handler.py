@@ -1,25 +1,38 @@
 import asyncio
 import json
+import time
 import websockets
 import logging
 
+from .latency import event_type_of
+
 logger = logging.getLogger(__name__)
 
 class CometdWebsocketClient:
-    def __init__(self, url, auth_token, data_queue, on_handshake_success=None):
+    def __init__(self, url, auth_token, data_queue, on_handshake_success=None, publisher=None, latency=None):
         """
         Initialize a new instance of the class.
 
         :param url: The URL to connect to.
         :param auth_token: The authentication token to use.
-        :param data_queue: The queue to put data into.
+        :param data_queue: The queue to put data into. May be None when only publishing.
         :param on_handshake_success: Optional function to call on successful handshake.
+        :param publisher: Optional SharedRingWriter that receives every data message, so other
+            local processes can read the stream with a SharedRingReader.
+        :param latency: Optional LatencyRecorder. When given, decode, enqueue and exchange
+            (eventTime to socket receive) latencies are recorded per event type.
          """
         self.url = url
         self.auth_token = auth_token
         self.on_handshake_success = on_handshake_success
         self.message_id = 0
         self.data_queue = data_queue
+        self.publisher = publisher
+        self.publish_dropped = 0
+        self.latency = latency
+        self.event_time_fields = {}
+        self.received_ns = 0
+        self.received_wall_ns = 0
     
     def next_id(self):
         self.message_id += 1
@@ -47,7 +60,17 @@ class CometdWebsocketClient:
             # Process data messages from the listen method
             async for message_data in self.listen(websocket):
              #   print("Received data:", message_data)
-                await self.data_queue.put(message_data)
+                if self.publisher is not None:
+                    try:
+                        self.publisher.publish(message_data)
+                    except ValueError as error:
+                        # An oversized message must not end the stream for the data queue
+                        self.publish_dropped += 1
+                        logger.warning("Dropped message from the shared ring: %s", error)
+                if self.data_queue is not None:
+                    await self.data_queue.put(message_data)
+                if self.latency is not None and self.latency.enabled:
+                    self.latency.record_since(event_type_of(message_data), "enqueue", self.received_ns)
 
 
             # Make sure the heartbeat task is canceled
@@ -134,6 +157,9 @@ class CometdWebsocketClient:
         """
         while True:
             message = await websocket.recv()
+            if self.latency is not None and self.latency.enabled:
+                self.received_ns = time.perf_counter_ns()
+                self.received_wall_ns = time.time_ns()
             async for data_message in self.handle_message(message):
                 yield data_message
            
@@ -171,6 +197,8 @@ class CometdWebsocketClient:
             
             elif channel == "/service/data":
                 if data[0].get("data"):
+                    if self.latency is not None and self.latency.enabled:
+                        self.record_decode_latency(data[0]['data'])
                     yield data[0]['data']
                 else:
                     logger.warning("Data message has no data field")
@@ -179,6 +207,34 @@ class CometdWebsocketClient:
             logger.warning(f"Unexpected message format: {message}")
 
 
+    def record_decode_latency(self, message_data):
+        """
+        Records the decode latency of a data message and the eventTime to receive latency of its events.
+
+        The field layout of each event type is taken from the header sent with the first message of a
+        subscription, e.g. [["Quote", ["eventSymbol", "eventTime", ...]], [values...]].
+
+        :param message_data: The data of a /service/data message.
+        """
+        event_type = event_type_of(message_data)
+        self.latency.record_since(event_type, "decode", self.received_ns)
+        if len(message_data) < 2:
+            return
+        header = message_data[0]
+        if isinstance(header, list):
+            fields = header[1]
+            if "eventTime" in fields:
+                self.event_time_fields[event_type] = (fields.index("eventTime"), len(fields))
+        layout = self.event_time_fields.get(event_type)
+        if layout is None:
+            return
+        index, stride = layout
+        values = message_data[1]
+        for position in range(index, len(values), stride):
+            event_time = values[position]
+            if isinstance(event_time, (int, float)):
+                self.latency.record_event_time(event_type, event_time, self.received_wall_ns)
+
     async def process_handshake(self, handshake_data):
         """
         Process the handshake data received from the server.
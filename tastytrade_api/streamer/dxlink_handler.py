@@ -0,0 +1,241 @@
+import asyncio
+import json
+import websockets
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Field order of the Quote event matches dx_mapping.Quote, so rows can be passed to Quote.from_list
+DEFAULT_EVENT_FIELDS = {
+    "Quote": ["eventType", "eventSymbol", "eventTime", "sequence", "timeNanoPart", "bidTime", "bidExchangeCode",
+              "bidPrice", "bidSize", "askTime", "askExchangeCode", "askPrice", "askSize"],
+    "Trade": ["eventType", "eventSymbol", "eventTime", "time", "sequence", "exchangeCode", "price", "size",
+              "dayVolume", "dayTurnover", "tickDirection", "extendedTradingHours"],
+    "Greeks": ["eventType", "eventSymbol", "eventTime", "time", "sequence", "price", "volatility", "delta",
+               "gamma", "theta", "rho", "vega"],
+}
+
+
+class DXLinkWebsocketClient:
+    """
+    Client for the DXLink websocket protocol, the successor of the CometD based dxfeed protocol.
+
+    Unlike the CometD handshake, DXLink lets the client negotiate the feed setup: the COMPACT data format,
+    an explicit list of fields per event type and an aggregation period, so the server conflates ticks
+    before sending them.
+    """
+
+    FEED_CHANNEL = 1
+
+    def __init__(self, url, auth_token, data_queue, on_feed_ready=None, aggregation_period=None,
+                 data_format="COMPACT", event_fields=None, keepalive_timeout=60):
+        """
+        Initialize a new instance of the class.
+
+        :param url: The URL to connect to.
+        :param auth_token: The dxfeed token, as returned by TastytradeAuth.get_dxfeed_token.
+        :param data_queue: The queue to put FEED_DATA payloads into.
+        :param on_feed_ready: Optional coroutine function called with this client once the feed channel is configured.
+        :param aggregation_period: Accepted aggregation period in seconds, e.g. 0.25. None lets the server decide.
+        :param data_format: "COMPACT" or "FULL".
+        :param event_fields: Mapping of event type to the list of fields to receive. Defaults to DEFAULT_EVENT_FIELDS.
+        :param keepalive_timeout: Keepalive timeout in seconds announced to the server.
+        """
+        self.url = url
+        self.auth_token = auth_token
+        self.data_queue = data_queue
+        self.on_feed_ready = on_feed_ready
+        self.aggregation_period = aggregation_period
+        self.data_format = data_format
+        self.event_fields = event_fields or DEFAULT_EVENT_FIELDS
+        self.keepalive_timeout = keepalive_timeout
+        self.feed_config = None
+        self.websocket = None
+
+    async def connect(self):
+        """
+        Connect to the websocket server, authorize, open and configure the feed channel, then put every
+        FEED_DATA payload on the data queue.
+        """
+        async with websockets.connect(self.url) as websocket:
+            self.websocket = websocket
+            await self.send_setup(websocket)
+            keepalive = asyncio.create_task(self.send_keepalive(websocket))
+
+            async for message_data in self.listen(websocket):
+                await self.data_queue.put(message_data)
+
+            keepalive.cancel()
+            await asyncio.gather(keepalive, return_exceptions=True)
+
+    async def send(self, websocket, message):
+        await websocket.send(json.dumps(message))
+
+    async def send_setup(self, websocket):
+        """
+        Sends the SETUP message that opens the DXLink session.
+
+        :param websocket: The WebSocket connection to send the message to.
+        """
+        await self.send(websocket, {
+            "type": "SETUP",
+            "channel": 0,
+            "keepaliveTimeout": self.keepalive_timeout,
+            "acceptKeepaliveTimeout": self.keepalive_timeout,
+            "version": "0.1-tastytrade-api",
+        })
+
+    async def send_auth(self, websocket):
+        """Sends the AUTH message with the dxfeed token."""
+        await self.send(websocket, {"type": "AUTH", "channel": 0, "token": self.auth_token})
+
+    async def send_channel_request(self, websocket):
+        """Requests the feed channel."""
+        await self.send(websocket, {
+            "type": "CHANNEL_REQUEST",
+            "channel": self.FEED_CHANNEL,
+            "service": "FEED",
+            "parameters": {"contract": "AUTO"},
+        })
+
+    async def send_feed_setup(self, websocket):
+        """
+        Sends the FEED_SETUP message with the requested data format, event fields and aggregation period.
+
+        The server answers with FEED_CONFIG, which holds the settings actually in effect.
+        """
+        feed_setup = {
+            "type": "FEED_SETUP",
+            "channel": self.FEED_CHANNEL,
+            "acceptDataFormat": self.data_format,
+            "acceptEventFields": self.event_fields,
+        }
+        if self.aggregation_period is not None:
+            feed_setup["acceptAggregationPeriod"] = self.aggregation_period
+        await self.send(websocket, feed_setup)
+
+    async def send_subscription_message(self, websocket, event_type, symbols, remove=False):
+        """
+        Adds or removes subscriptions on the feed channel.
+
+        :param websocket: The websocket to send the subscription message to.
+        :param event_type: The event type to subscribe to.
+        :param symbols: A symbol or a list of symbols.
+        :param remove: Remove the subscriptions instead of adding them.
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        entries = [{"type": event_type, "symbol": symbol} for symbol in symbols]
+        await self.send(websocket, {
+            "type": "FEED_SUBSCRIPTION",
+            "channel": self.FEED_CHANNEL,
+            "remove" if remove else "add": entries,
+        })
+
+    async def send_keepalive(self, websocket):
+        while True:
+            await asyncio.sleep(self.keepalive_timeout / 2)
+            await self.send(websocket, {"type": "KEEPALIVE", "channel": 0})
+
+    async def listen(self, websocket):
+        """
+        Continuously listens for messages from the given WebSocket and yields FEED_DATA payloads.
+
+        :param websocket: The WebSocket to listen on.
+        :yields: The data of each FEED_DATA message.
+        """
+        while True:
+            message = await websocket.recv()
+            data = await self.handle_message(message)
+            if data is not None:
+                yield data
+
+    async def handle_message(self, message):
+        """
+        Handle an incoming DXLink message and advance the session setup.
+
+        Args:
+            message (str): The incoming message as a JSON string.
+
+        Returns:
+            The payload of a FEED_DATA message, otherwise None.
+        """
+        data = json.loads(message)
+        message_type = data.get("type")
+
+        if message_type == "FEED_DATA":
+            return data.get("data")
+
+        elif message_type == "AUTH_STATE":
+            if data.get("state") == "UNAUTHORIZED":
+                await self.send_auth(self.websocket)
+            elif data.get("state") == "AUTHORIZED":
+                logger.debug("DXLink authorized")
+                await self.send_channel_request(self.websocket)
+
+        elif message_type == "CHANNEL_OPENED" and data.get("channel") == self.FEED_CHANNEL:
+            await self.send_feed_setup(self.websocket)
+
+        elif message_type == "FEED_CONFIG":
+            first_config = self.feed_config is None
+            self.process_feed_config(data)
+            if first_config and self.on_feed_ready:
+                await self.on_feed_ready(self)
+
+        elif message_type == "ERROR":
+            logger.error("DXLink error: %s - %s", data.get("error"), data.get("message"))
+
+        elif message_type not in ("SETUP", "KEEPALIVE", "CHANNEL_CLOSED"):
+            logger.warning(f"Unexpected message: {message}")
+
+        return None
+
+    def process_feed_config(self, config):
+        """
+        Stores the settings confirmed by the server. FEED_CONFIG is sent again whenever the field list of an
+        event type is confirmed, so event fields are merged rather than replaced.
+
+        :param config: The FEED_CONFIG message.
+        """
+        if self.feed_config is None:
+            self.feed_config = {"eventFields": {}}
+        event_fields = self.feed_config["eventFields"]
+        self.feed_config.update(config)
+        event_fields.update(config.get("eventFields") or {})
+        self.feed_config["eventFields"] = event_fields
+        logger.debug("Feed configured: aggregation period %s, format %s",
+                     config.get("aggregationPeriod"), config.get("dataFormat"))
+
+    def fields_for(self, event_type):
+        """Returns the field list in effect for an event type, as confirmed by FEED_CONFIG if available."""
+        if self.feed_config:
+            fields = self.feed_config["eventFields"].get(event_type)
+            if fields:
+                return fields
+        return self.event_fields.get(event_type, [])
+
+    def rows(self, feed_data):
+        """
+        Splits a COMPACT FEED_DATA payload into one list of values per event. FULL payloads are already
+        a list of dictionaries and need no splitting.
+
+        The payload looks like ["Quote", ["Quote", "SPY", ..., "Quote", "AAPL", ...]]; each row is returned
+        without the leading eventType value, so Quote rows can be passed to dx_mapping.Quote.from_list.
+
+        Args:
+            feed_data (list): The payload of a FEED_DATA message.
+
+        Returns:
+            list: Tuples of (event_type, row).
+        """
+        result = []
+        for position in range(0, len(feed_data) - 1, 2):
+            event_type, values = feed_data[position], feed_data[position + 1]
+            fields = self.fields_for(event_type)
+            stride = len(fields)
+            if not stride:
+                continue
+            skip = 1 if fields[0] == "eventType" else 0
+            for start in range(0, len(values) - stride + 1, stride):
+                result.append((event_type, values[start + skip:start + stride]))
+        return result
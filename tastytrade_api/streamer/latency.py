@@ -0,0 +1,206 @@
+import asyncio
+import collections
+import threading
+import time
+
+# Values below this many microseconds get their own bucket, above it each power of two is split into
+# _SUB_BUCKETS buckets, which keeps the relative error of the reported percentiles under 12.5%.
+_LINEAR_LIMIT = 16
+_SUB_BUCKETS = 8
+_BUCKET_COUNT = _LINEAR_LIMIT + 40 * _SUB_BUCKETS
+
+
+def _bucket_index(micros):
+    if micros < _LINEAR_LIMIT:
+        return micros
+    shift = micros.bit_length() - 4
+    index = _LINEAR_LIMIT + (shift - 1) * _SUB_BUCKETS + (micros >> shift) - _SUB_BUCKETS
+    return min(index, _BUCKET_COUNT - 1)
+
+
+def _bucket_upper_bound(index):
+    if index < _LINEAR_LIMIT:
+        return index
+    shift = (index - _LINEAR_LIMIT) // _SUB_BUCKETS + 1
+    mantissa = (index - _LINEAR_LIMIT) % _SUB_BUCKETS + _SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear histogram of latencies in microseconds.
+
+    Recording is a few integer operations and a list increment, so it is cheap enough to call on every message.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, micros):
+        """
+        Records a single latency.
+
+        Args:
+            micros (int): The latency in microseconds. Negative values (clock skew) are recorded as 0.
+        """
+        if micros < 0:
+            micros = 0
+        self.counts[_bucket_index(micros)] += 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def percentile(self, percent):
+        """
+        Returns the upper bound of the bucket holding the given percentile, in microseconds.
+
+        Args:
+            percent (float): The percentile, between 0 and 100.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts[:-1]):
+            seen += bucket_count
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), self.max)
+        # The last bucket also holds every larger value, so its only known bound is the maximum
+        return self.max
+
+    def summary(self):
+        """Returns a dictionary with the count, mean, p50, p99 and max latency in microseconds."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class LatencyRecorder:
+    """
+    Collects per event type, per pipeline stage latency histograms for the streaming clients.
+
+    Stages recorded by the clients:
+        - ``exchange``: event's own eventTime (or message timestamp) to socket receive
+        - ``decode``: socket receive to decoded message
+        - ``enqueue``: decoded message to placed on the data queue
+        - ``queue``: placed on the data queue to taken by the consumer (see LatencyQueue)
+        - ``dispatch``: socket receive to message callback returned (account streamer)
+
+    Instrumentation is off when no recorder is passed to a client, and can be paused by setting ``enabled``
+    to False.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def record(self, event_type, stage, micros):
+        """
+        Records a latency for an event type and stage.
+
+        Args:
+            event_type (str): The event or message type, e.g. "Quote" or "Order".
+            stage (str): The pipeline stage.
+            micros (int): The latency in microseconds.
+        """
+        key = (event_type, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(key, LatencyHistogram())
+        histogram.record(micros)
+
+    def record_since(self, event_type, stage, start_ns):
+        """
+        Records the time elapsed since a time.perf_counter_ns() timestamp.
+
+        Args:
+            event_type (str): The event or message type.
+            stage (str): The pipeline stage.
+            start_ns (int): The start timestamp from time.perf_counter_ns().
+        """
+        self.record(event_type, stage, (time.perf_counter_ns() - start_ns) // 1000)
+
+    def record_event_time(self, event_type, event_time_ms, received_wall_ns):
+        """
+        Records the delay between an event's own timestamp and its arrival.
+
+        Args:
+            event_type (str): The event or message type.
+            event_time_ms (int): The event's timestamp in milliseconds since the epoch. Zero values are ignored.
+            received_wall_ns (int): The time.time_ns() timestamp at socket receive.
+        """
+        if event_time_ms:
+            self.record(event_type, "exchange", received_wall_ns // 1000 - int(event_time_ms) * 1000)
+
+    def snapshot(self):
+        """
+        Returns the current statistics.
+
+        Returns:
+            dict: Mapping of event type to a mapping of stage to the histogram summary
+            (count, mean, p50, p99, max in microseconds).
+        """
+        result = {}
+        with self.lock:
+            items = list(self.histograms.items())
+        for (event_type, stage), histogram in items:
+            result.setdefault(event_type, {})[stage] = histogram.summary()
+        return result
+
+    def reset(self):
+        """Discards all recorded latencies."""
+        with self.lock:
+            self.histograms = {}
+
+
+def event_type_of(data):
+    """
+    Returns the event type of a dxfeed data message.
+
+    Args:
+        data (list): The data of a /service/data message, either ["Quote", [...]] or [["Quote", [fields]], [...]].
+    """
+    head = data[0] if data else None
+    if isinstance(head, list):
+        head = head[0] if head else None
+    return head if isinstance(head, str) else "unknown"
+
+
+class LatencyQueue(asyncio.Queue):
+    """
+    asyncio.Queue that records how long each dxfeed data message waited before the consumer took it.
+
+    Use it as the data_queue of CometdWebsocketClient to measure the ``queue`` stage; consumers are unchanged.
+
+    Args:
+        recorder (LatencyRecorder): The recorder to report to.
+        maxsize (int): The maximum queue size, as for asyncio.Queue.
+    """
+
+    def __init__(self, recorder, maxsize=0):
+        self.recorder = recorder
+        super().__init__(maxsize)
+
+    def _init(self, maxsize):
+        self._queue = collections.deque()
+
+    def _put(self, item):
+        self._queue.append((time.perf_counter_ns(), item))
+
+    def _get(self):
+        put_ns, item = self._queue.popleft()
+        if self.recorder.enabled and item is not None:
+            self.recorder.record_since(event_type_of(item), "queue", put_ns)
+        return item
@@ -0,0 +1,194 @@
+import logging
+import marshal
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+logger = logging.getLogger(__name__)
+
+# Header: magic, slot count, slot size, head (sequence number of the next event to be written)
+_HEADER = struct.Struct("<IIIxxxxQ")
+# Slot header: sequence number + 1 of the event stored in the slot (0 while being written), payload length
+_SLOT_HEADER = struct.Struct("<QI4x")
+_MAGIC = 0x54545242  # "TTRB"
+_HEAD_OFFSET = 16
+
+
+class RingOverrunError(Exception):
+    """Raised by a reader that fell more than a full ring behind the publisher."""
+
+    def __init__(self, missed):
+        super().__init__(f"Reader overrun, {missed} events were overwritten before they could be read")
+        self.missed = missed
+
+
+class SharedRingWriter:
+    """
+    Single-writer ring buffer in shared memory used to fan out decoded streamer events to local processes.
+
+    Events are serialized with ``marshal`` (they are plain lists/strings/numbers as produced by the
+    dxfeed decoder) and written into fixed-size slots. The writer never waits for readers: each reader
+    keeps its own cursor and detects overruns when the writer laps it.
+
+    Args:
+        name (str): The name of the shared memory block. Readers attach using the same name.
+        slot_count (int): Number of slots in the ring.
+        slot_size (int): Size of a slot in bytes, including the 16 byte slot header. The default fits batched
+            dxfeed messages of a few dozen quotes; larger messages are rejected by publish().
+    """
+
+    def __init__(self, name, slot_count=16384, slot_size=4096):
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"slot_size must be larger than {_SLOT_HEADER.size} bytes")
+        self.name = name
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.max_payload = slot_size - _SLOT_HEADER.size
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER.size + slot_count * slot_size)
+        self.buf = self.shm.buf
+        _HEADER.pack_into(self.buf, 0, _MAGIC, slot_count, slot_size, 0)
+        self.head = 0
+
+    def publish(self, event):
+        """
+        Writes an event into the next slot of the ring.
+
+        Args:
+            event: The decoded event, e.g. the data list of a /service/data message.
+
+        Raises:
+            ValueError: If the serialized event does not fit into a slot.
+        """
+        payload = marshal.dumps(event)
+        size = len(payload)
+        if size > self.max_payload:
+            raise ValueError(f"Event of {size} bytes does not fit into a {self.max_payload} byte slot")
+
+        seq = self.head
+        offset = _HEADER.size + (seq % self.slot_count) * self.slot_size
+        buf = self.buf
+        # Invalidate the slot first so readers copying it concurrently notice the torn read
+        _SLOT_HEADER.pack_into(buf, offset, 0, 0)
+        start = offset + _SLOT_HEADER.size
+        buf[start:start + size] = payload
+        _SLOT_HEADER.pack_into(buf, offset, seq + 1, size)
+        self.head = seq + 1
+        struct.pack_into("<Q", buf, _HEAD_OFFSET, self.head)
+
+    def close(self):
+        """Detaches from the shared memory block without removing it."""
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        """Detaches from and removes the shared memory block. Attached readers keep their mapping."""
+        self.close()
+        self.shm.unlink()
+
+
+class SharedRingReader:
+    """
+    Attaches to a ring created by SharedRingWriter and reads events with a private cursor.
+
+    Args:
+        name (str): The name of the shared memory block to attach to.
+        from_start (bool): Start with the oldest event still in the ring instead of the next new event.
+        raise_on_overrun (bool): Raise RingOverrunError when events were overwritten before they could be read.
+            If False, the reader skips to the oldest available event and counts the loss in ``missed``.
+    """
+
+    def __init__(self, name, from_start=False, raise_on_overrun=False):
+        self.name = name
+        self.shm = _attach(name)
+        self.buf = self.shm.buf
+        magic, self.slot_count, self.slot_size, head = _HEADER.unpack_from(self.buf, 0)
+        if magic != _MAGIC:
+            self.shm.close()
+            raise ValueError(f"Shared memory block '{name}' is not a streamer ring buffer")
+        self.raise_on_overrun = raise_on_overrun
+        self.missed = 0
+        self.cursor = max(0, head - self.slot_count + 1) if from_start else head
+
+    def head(self):
+        """Returns the sequence number of the next event the writer will publish."""
+        return struct.unpack_from("<Q", self.buf, _HEAD_OFFSET)[0]
+
+    def lag(self):
+        """Returns the number of published events this reader has not consumed yet."""
+        return self.head() - self.cursor
+
+    def read_bytes(self):
+        """
+        Returns the serialized payload of the next event, or None if the reader is caught up.
+
+        Raises:
+            RingOverrunError: If the event at the cursor was overwritten and raise_on_overrun is set.
+        """
+        buf = self.buf
+        while True:
+            seq = self.cursor
+            offset = _HEADER.size + (seq % self.slot_count) * self.slot_size
+            stored, size = _SLOT_HEADER.unpack_from(buf, offset)
+            if stored == seq + 1:
+                start = offset + _SLOT_HEADER.size
+                payload = bytes(buf[start:start + size])
+                if _SLOT_HEADER.unpack_from(buf, offset)[0] == stored:
+                    self.cursor = seq + 1
+                    return payload
+            elif self.head() <= seq:
+                return None
+            self._skip_overrun()
+
+    def read(self):
+        """
+        Returns the next event, or None if the reader is caught up.
+
+        Raises:
+            RingOverrunError: If events were overwritten before they could be read and raise_on_overrun is set.
+        """
+        payload = self.read_bytes()
+        if payload is None:
+            return None
+        return marshal.loads(payload)
+
+    def read_batch(self, max_events=1024):
+        """
+        Returns up to max_events events that are currently available.
+
+        Args:
+            max_events (int): The maximum number of events to return.
+
+        Returns:
+            list: The events, oldest first.
+        """
+        events = []
+        while len(events) < max_events:
+            event = self.read()
+            if event is None:
+                break
+            events.append(event)
+        return events
+
+    def _skip_overrun(self):
+        oldest = max(0, self.head() - self.slot_count + 1)
+        missed = max(1, oldest - self.cursor)
+        self.missed += missed
+        self.cursor = max(oldest, self.cursor + 1)
+        logger.warning("Ring reader '%s' overrun, skipped %d events", self.name, missed)
+        if self.raise_on_overrun:
+            raise RingOverrunError(missed)
+
+    def close(self):
+        """Detaches from the shared memory block."""
+        self.buf = None
+        self.shm.close()
+
+
+def _attach(name):
+    # Only the writer owns the block: a tracked reader would unlink it when its process exits
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if shared_memory._USE_POSIX:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
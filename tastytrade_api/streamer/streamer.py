@@ -6,13 +6,24 @@ import threading
 
 import functools
 
+from .account_events import AccountEventDispatcher, decode_message
 
 logger = logging.getLogger(__name__)
 
 class TastytradeStreamer:
     """A class to handle the streaming of data from the Tastytrade API using WebSockets."""
 
-    def __init__(self, session_token, websocket_url, message_callback=None, error_callback=None, open_callback=None, close_callback=None):
+    def __init__(self, session_token, websocket_url, message_callback=None, error_callback=None, open_callback=None, close_callback=None, latency=None):
+        """
+        Args:
+            session_token (str): The session token used to authenticate.
+            websocket_url (str): The URL of the account streamer.
+            message_callback, error_callback, open_callback, close_callback: Optional WebSocketApp callbacks.
+            latency (LatencyRecorder): Optional recorder for decode, dispatch and message timestamp to receive
+                latencies per message type. No instrumentation is installed when omitted. A custom
+                message_callback parses messages itself, so only its total time is recorded, as the
+                "dispatch" stage of the "message" type.
+        """
         self.session_token = session_token
         self.websocket_url = websocket_url
         self.ws = None
@@ -20,11 +31,29 @@ class TastytradeStreamer:
         self.error_callback = error_callback or self.on_error
         self.open_callback = open_callback or self.on_open
         self.close_callback = close_callback or self.on_close
+        self.latency = latency
+        self.dispatcher = AccountEventDispatcher()
+
+    def add_handler(self, message_type, handler):
+        """Registers a handler for a message type with the default message callback.
+
+        Args:
+            message_type (str): The message type, e.g. "Order", "CurrentPosition" or "AccountBalance".
+            handler (callable): Called with the decoded AccountEvent.
+        """
+        self.dispatcher.register(message_type, handler)
 
     def on_message(self, ws, message):
-        """Default callback function for handling received messages."""
-        data = json.loads(message)
-        logger.info("Received message: %s", data)
+        """Default callback function for handling received messages.
+
+        Decodes the message into a typed AccountEvent once and passes it to the handlers registered for its type.
+        """
+        self.dispatch_event(decode_message(message))
+
+    def dispatch_event(self, event):
+        """Passes a decoded AccountEvent to the handlers registered for its type."""
+        if not self.dispatcher.dispatch(event):
+            logger.info("Received message: %s", event.data)
 
     def on_error(self, ws, error):
         """Default callback function for handling errors."""
@@ -40,13 +69,13 @@ class TastytradeStreamer:
 
     def connect(self):
         def send_wrapper(ws, message):
-            print(f"Sent message: {message}")
+            logger.debug("Sent message: %s", message)
             return WebSocketApp.send(self.ws, message)
         
         """Connects to the WebSocket and sets the provided callback functions."""
         self.ws = WebSocketApp(
             self.websocket_url,
-            on_message=self.message_callback,
+            on_message=self.message_callback if self.latency is None else self.on_message_instrumented,
             on_error=self.error_callback,
             on_close=self.close_callback,
             on_open=self.open_callback,
@@ -57,6 +86,26 @@ class TastytradeStreamer:
         websocket_thread.daemon = True
         websocket_thread.start()
 
+    def on_message_instrumented(self, ws, message):
+        """Wraps the message callback to record latencies when a LatencyRecorder was given."""
+        if not self.latency.enabled:
+            return self.message_callback(ws, message)
+
+        received_ns = time.perf_counter_ns()
+        if self.message_callback != self.on_message:
+            self.message_callback(ws, message)
+            self.latency.record_since("message", "dispatch", received_ns)
+            return
+
+        # Decode here instead of in on_message, so the message is parsed once and the decode is timed by type
+        received_wall_ns = time.time_ns()
+        event = decode_message(message)
+        message_type = event.type or event.action or "unknown"
+        self.latency.record_since(message_type, "decode", received_ns)
+        self.latency.record_event_time(message_type, event.timestamp, received_wall_ns)
+        self.dispatch_event(event)
+        self.latency.record_since(message_type, "dispatch", received_ns)
+
     def send_heartbeat(self):
         """Sends a heartbeat message to the server."""
         heartbeat_message = json.dumps({"auth-token": self.session_token,"action": "heartbeat", "value": ""})
@@ -0,0 +1,148 @@
+import threading
+
+from .symbology import from_streamer_symbol, parse_option_symbol, to_streamer_symbol
+
+_symbols = {}
+_streamer_symbols = {}
+_by_id = []
+_lock = threading.Lock()
+
+
+class Symbol:
+    """
+    Interned instrument symbol with a precomputed hash and a small integer id.
+
+    Symbol("SPY") always returns the same object, so Symbols compare by identity, and their hash is the hash of
+    the API symbol string: a Symbol can be used as a dictionary key interchangeably with its plain string. The
+    id is assigned in interning order and never reused, so columnar stores can index arrays by it and map back
+    with Symbol.by_id(). Interned symbols live for the lifetime of the process.
+
+    Example:
+        spy_call = Symbol("SPY   230616C00400000")
+        spy_call.streamer  # ".SPY230616C400"
+        Symbol.from_streamer(".SPY230616C400") is spy_call  # True
+        quotes = [None] * Symbol.count()  # array indexed by spy_call.id
+
+    Args:
+        symbol (str): The API symbol, e.g. "SPY", "SPY   230616C00400000" or "/ESZ3".
+        streamer_symbol (str): Optional dxfeed streamer symbol. Needed for futures and future options, whose
+            streamer symbols carry the exchange; derived from the API symbol otherwise.
+
+    Raises:
+        ValueError: If the symbol is already interned with a different streamer symbol.
+    """
+
+    __slots__ = ("symbol", "id", "hash", "streamer_symbol")
+
+    def __new__(cls, symbol, streamer_symbol=None):
+        if isinstance(symbol, Symbol):
+            return symbol
+        interned = _symbols.get(symbol)
+        if interned is None:
+            with _lock:
+                interned = _symbols.get(symbol)
+                if interned is None:
+                    interned = object.__new__(cls)
+                    interned.symbol = symbol
+                    interned.hash = hash(symbol)
+                    interned.id = len(_by_id)
+                    interned.streamer_symbol = None
+                    _by_id.append(interned)
+                    _symbols[symbol] = interned
+        if streamer_symbol is not None and interned.streamer_symbol != streamer_symbol:
+            with _lock:
+                if interned.streamer_symbol is None:
+                    interned.streamer_symbol = streamer_symbol
+                    _streamer_symbols[streamer_symbol] = interned
+                elif interned.streamer_symbol != streamer_symbol:
+                    raise ValueError(f"{symbol!r} is already interned with streamer symbol "
+                                     f"{interned.streamer_symbol!r}, not {streamer_symbol!r}")
+        return interned
+
+    @classmethod
+    def from_streamer(cls, streamer_symbol):
+        """
+        Returns the Symbol of a dxfeed streamer symbol, e.g. a quote's eventSymbol.
+
+        Raises:
+            ValueError: For futures and future options whose Symbol was not interned with this streamer symbol,
+                as their API symbol cannot be derived from it.
+        """
+        interned = _streamer_symbols.get(streamer_symbol)
+        if interned is None:
+            if streamer_symbol.startswith(("/", "./")):
+                raise ValueError(f"Futures streamer symbol not interned: {streamer_symbol!r}")
+            interned = cls(from_streamer_symbol(streamer_symbol), streamer_symbol)
+        return interned
+
+    @classmethod
+    def from_instrument(cls, instrument):
+        """Returns the Symbol of an instrument object, taking its "streamer-symbol" field if present."""
+        return cls(instrument["symbol"], instrument.get("streamer-symbol"))
+
+    @staticmethod
+    def by_id(symbol_id):
+        """Returns the Symbol with the given id."""
+        return _by_id[symbol_id]
+
+    @staticmethod
+    def count():
+        """Returns the number of interned symbols, i.e. the length an array indexed by id needs."""
+        return len(_by_id)
+
+    @property
+    def streamer(self):
+        """
+        The dxfeed streamer symbol.
+
+        Raises:
+            ValueError: For futures and future options interned without a streamer symbol.
+        """
+        if self.streamer_symbol is None:
+            streamer_symbol = to_streamer_symbol(self.symbol)
+            with _lock:
+                self.streamer_symbol = streamer_symbol
+                _streamer_symbols[streamer_symbol] = self
+        return self.streamer_symbol
+
+    @property
+    def is_option(self):
+        """True for equity (OCC) option symbols."""
+        symbol = self.symbol
+        return len(symbol) == 21 and symbol[12] in "CP" and symbol[13:].isdigit()
+
+    @property
+    def occ(self):
+        """The OCC option symbol without root padding, e.g. "SPY230616C00400000", or None for non-options."""
+        return self.symbol.replace(" ", "") if self.is_option else None
+
+    @property
+    def components(self):
+        """The parsed OptionSymbol of an equity option, or None for non-options."""
+        return parse_option_symbol(self.symbol) if self.is_option else None
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        if other.__class__ is Symbol:
+            return self is other
+        if isinstance(other, str):
+            return self.symbol == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        return self.symbol < str(other)
+
+    def __str__(self):
+        return self.symbol
+
+    def __repr__(self):
+        return f"Symbol({self.symbol!r})"
+
+    def __reduce__(self):
+        return Symbol, (self.symbol, self.streamer_symbol)
@@ -1,3 +1,21 @@
+import numbers
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+MONTH_CODES = "FGHJKMNQUVXZ"
+
+OptionSymbol = namedtuple("OptionSymbol", ["underlying", "expiration_date", "option_type", "strike_price"])
+FutureSymbol = namedtuple("FutureSymbol", ["product_code", "month_code", "year"])
+FutureOptionSymbol = namedtuple(
+    "FutureOptionSymbol", ["future_symbol", "option_product_code", "expiration_date", "option_type", "strike_price"]
+)
+
+_FUTURE_SYMBOL = re.compile(r"^/([A-Z0-9]+?)([FGHJKMNQUVXZ])(\d{1,2})$")
+_FUTURE_OPTION_SYMBOL = re.compile(r"^\.(/\S+)\s+(\S+)\s+(\d{6})([CP])(\S+)$")
+_STREAMER_OPTION_SYMBOL = re.compile(r"^\.([A-Z0-9/.]+?)(\d{6})([CP])(\d+(?:\.\d+)?)$")
+
+
 def to_tastytrade_option_symbol(symbol: str, strike_price: float, option_type: str, expiration_date: str) -> str:
     """
     Generate Tastytrade option symbol based on input parameters.
@@ -16,8 +34,8 @@ def to_tastytrade_option_symbol(symbol: str, strike_price: float, option_type: s
         "AAPL  220121C00130000"
     """
  
-    # convert strike price to 8-digit integer (multiply by 1000 and convert to int)
-    strike_price_int = int(strike_price * 1000)
+    # convert strike price to 8-digit integer (multiply by 1000 and round, int() truncates 4.35 * 1000 to 4349)
+    strike_price_int = round(strike_price * 1000)
     
     # format expiration date to yymmdd format
     expiration_date_formatted = expiration_date[2:].replace('-', '')
@@ -49,8 +67,7 @@ def to_tastytrade_future_symbol(product_code: str, expiration_date: str) -> str:
         "/CLZ22"
     """
     year, month = expiration_date.split('-')
-    month_codes = "FGHJKMNQUVXZ"
-    month_code = month_codes[int(month)-1]
+    month_code = MONTH_CODES[int(month)-1]
     last_digit_of_year = year[-1]
 
     # Combine the product code, month code, and year code to form the Tastytrade future symbol
@@ -84,11 +101,202 @@ def to_tastytrade_future_option_symbol(symbol: str, future_month: str, option_pr
     # Convert option type to C or P
     option_type_formatted = option_type[0].upper()
 
-    # Convert strike price to 8-digit integer (multiply by 1000 and convert to int)
-    strike_price_int = int(strike_price * 1000)
+    # Convert strike price to 8-digit integer (multiply by 1000 and round)
+    strike_price_int = round(strike_price * 1000)
 
     # Combine all parts to form Tastytrade future option symbol
     future_option_symbol = f"./{symbol}{future_month} {option_product_code} {expiration_date_formatted}{option_type_formatted}{strike_price_int:05d}"
 
     return future_option_symbol
 
+
+def _is_scalar(value):
+    # Numpy scalars and 0-d arrays are single values too
+    return isinstance(value, (str, numbers.Number)) or getattr(value, "ndim", None) == 0 or not hasattr(value, "__len__")
+
+
+def _broadcast(values, count):
+    return [values] * count if _is_scalar(values) else values
+
+
+def to_tastytrade_option_symbols(symbols, strike_prices, option_types, expiration_dates) -> list:
+    """
+    Generate Tastytrade option symbols for many contracts at once.
+
+    Each argument is either a sequence with one value per contract or a single value shared by all contracts.
+    Padded roots and formatted expirations are computed once per distinct value.
+
+    Args:
+        symbols (Union[str, list]): Ticker symbols of the underlying assets.
+        strike_prices (Union[float, list]): Strike prices of the options.
+        option_types (Union[str, list]): Types of the options, "call"/"put" or "C"/"P".
+        expiration_dates (Union[str, list]): Expiration dates of the options in yyyy-mm-dd format.
+
+    Returns:
+        list: Tastytrade option symbols, as returned by to_tastytrade_option_symbol.
+
+    Raises:
+        ValueError: If the sequences have different lengths.
+
+    Example:
+        >>> to_tastytrade_option_symbols("SPY", [400.0, 405.0], "call", "2023-06-16")
+        ["SPY   230616C00400000", "SPY   230616C00405000"]
+    """
+    lengths = {len(values) for values in (symbols, strike_prices, option_types, expiration_dates)
+               if not _is_scalar(values)}
+    if len(lengths) > 1:
+        raise ValueError(f"Option symbol columns have different lengths: {sorted(lengths)}")
+    count = lengths.pop() if lengths else 1
+    roots = {}
+    expirations = {}
+    option_symbols = []
+    for symbol, strike_price, option_type, expiration_date in zip(
+            _broadcast(symbols, count), _broadcast(strike_prices, count), _broadcast(option_types, count),
+            _broadcast(expiration_dates, count)):
+        root = roots.get(symbol)
+        if root is None:
+            root = roots[symbol] = symbol.ljust(6)
+        expiration = expirations.get(expiration_date)
+        if expiration is None:
+            expiration = expirations[expiration_date] = expiration_date[2:].replace('-', '')
+        option_symbols.append(f"{root}{expiration}{option_type[0].upper()}{round(strike_price * 1000):08d}")
+    return option_symbols
+
+
+def parse_option_symbol(option_symbol: str) -> OptionSymbol:
+    """
+    Parse a Tastytrade (OCC) option symbol into its components.
+
+    Args:
+        option_symbol (str): Option symbol in the format "SYMBOLYYMMDDTXXXXXXXX".
+
+    Returns:
+        OptionSymbol: (underlying, expiration_date in yyyy-mm-dd format, option_type "C" or "P", strike_price).
+
+    Raises:
+        ValueError: If the symbol is not an option symbol.
+
+    Example:
+        >>> parse_option_symbol("AAPL  220121C00130000")
+        OptionSymbol(underlying='AAPL', expiration_date='2022-01-21', option_type='C', strike_price=130.0)
+    """
+    if len(option_symbol) != 21 or option_symbol[12] not in "CP" or not option_symbol[13:].isdigit():
+        raise ValueError(f"Not an option symbol: {option_symbol!r}")
+    expiration = option_symbol[6:12]
+    return OptionSymbol(
+        option_symbol[:6].rstrip(),
+        f"20{expiration[:2]}-{expiration[2:4]}-{expiration[4:]}",
+        option_symbol[12],
+        int(option_symbol[13:]) / 1000,
+    )
+
+
+def parse_option_symbols(option_symbols) -> list:
+    """
+    Parse many Tastytrade option symbols, see parse_option_symbol.
+
+    Underlyings and expiration dates are formatted once per distinct value.
+    """
+    roots = {}
+    expirations = {}
+    parsed = []
+    for option_symbol in option_symbols:
+        if len(option_symbol) != 21 or option_symbol[12] not in "CP" or not option_symbol[13:].isdigit():
+            raise ValueError(f"Not an option symbol: {option_symbol!r}")
+        root = option_symbol[:6]
+        underlying = roots.get(root)
+        if underlying is None:
+            underlying = roots[root] = root.rstrip()
+        expiration = option_symbol[6:12]
+        expiration_date = expirations.get(expiration)
+        if expiration_date is None:
+            expiration_date = expirations[expiration] = f"20{expiration[:2]}-{expiration[2:4]}-{expiration[4:]}"
+        parsed.append(OptionSymbol(underlying, expiration_date, option_symbol[12], int(option_symbol[13:]) / 1000))
+    return parsed
+
+
+def parse_future_symbol(future_symbol: str) -> FutureSymbol:
+    """
+    Parse a Tastytrade futures symbol into its components.
+
+    Args:
+        future_symbol (str): Futures symbol in the format "/PRODUCTCODEMY", e.g. "/CLZ2" or "/ESZ23".
+
+    Returns:
+        FutureSymbol: (product_code, month_code, year digits).
+
+    Raises:
+        ValueError: If the symbol is not a futures symbol.
+    """
+    match = _FUTURE_SYMBOL.match(future_symbol)
+    if match is None:
+        raise ValueError(f"Not a futures symbol: {future_symbol!r}")
+    return FutureSymbol(*match.groups())
+
+
+def parse_future_option_symbol(future_option_symbol: str) -> FutureOptionSymbol:
+    """
+    Parse a Tastytrade future option symbol into its components.
+
+    Args:
+        future_option_symbol (str): Future option symbol in the format
+            "./FUTURE OPTION_PRODUCT_CODE YYMMDDC/PSTRIKE" as generated by to_tastytrade_future_option_symbol,
+            e.g. "./CLZ2 LO1X2 221104C91000".
+
+    Returns:
+        FutureOptionSymbol: (future_symbol, option_product_code, expiration_date in yyyy-mm-dd format,
+        option_type "C" or "P", strike_price as a float, with the encoder's thousandths scaling undone).
+
+    Raises:
+        ValueError: If the symbol is not a future option symbol.
+    """
+    match = _FUTURE_OPTION_SYMBOL.match(future_option_symbol)
+    if match is None:
+        raise ValueError(f"Not a future option symbol: {future_option_symbol!r}")
+    future_symbol, option_product_code, expiration, option_type, strike_price = match.groups()
+    try:
+        strike_price = float(strike_price) / 1000
+    except ValueError:
+        raise ValueError(f"Not a future option symbol: {future_option_symbol!r}") from None
+    return FutureOptionSymbol(future_symbol, option_product_code,
+                              f"20{expiration[:2]}-{expiration[2:4]}-{expiration[4:]}", option_type, strike_price)
+
+
+@lru_cache(maxsize=65536)
+def to_streamer_symbol(symbol: str) -> str:
+    """
+    Convert a Tastytrade equity or equity option symbol to the dxfeed streamer symbol. Results are memoized.
+
+    Futures and future options have exchange-specific streamer symbols; use the "streamer-symbol" field of the
+    instrument (e.g. from InstrumentMaster) for them.
+
+    Raises:
+        ValueError: If the symbol is a futures or future option symbol.
+
+    Example:
+        >>> to_streamer_symbol("SPY   230616C00400500")
+        ".SPY230616C400.5"
+    """
+    if symbol.startswith(("/", "./")):
+        raise ValueError(f"Streamer symbols of futures need instrument data: {symbol!r}")
+    if len(symbol) != 21 or symbol[12] not in "CP" or not symbol[13:].isdigit():
+        return symbol
+    strike = int(symbol[13:])
+    strike_text = str(strike // 1000) if strike % 1000 == 0 else f"{strike / 1000:.3f}".rstrip("0")
+    return f".{symbol[:6].rstrip()}{symbol[6:13]}{strike_text}"
+
+
+@lru_cache(maxsize=65536)
+def from_streamer_symbol(streamer_symbol: str) -> str:
+    """
+    Convert a dxfeed equity or equity option streamer symbol back to the Tastytrade symbol. Results are memoized.
+
+    Example:
+        >>> from_streamer_symbol(".SPY230616C400.5")
+        "SPY   230616C00400500"
+    """
+    match = _STREAMER_OPTION_SYMBOL.match(streamer_symbol)
+    if match is None:
+        return streamer_symbol
+    root, expiration, option_type, strike_price = match.groups()
+    return f"{root.ljust(6)}{expiration}{option_type}{round(float(strike_price) * 1000):08d}"
@@ -1,15 +1,61 @@
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+
+class BulkOrderResult:
+    """
+    The outcome of one request of a bulk order operation.
+
+    Attributes:
+        index (int): The position of the request in the input.
+        request: The order (for submissions) or order id (for cancellations).
+        response (dict): The API response if the request succeeded, otherwise None.
+        error (Exception): The error raised by the request, otherwise None.
+    """
+
+    __slots__ = ("index", "request", "response", "error")
+
+    def __init__(self, index, request, response=None, error=None):
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"BulkOrderResult(index={self.index}, ok={self.ok}, error={self.error!r})"
+
 
 class TastytradeOrder:
-    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/accounts'):
+    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/accounts',
+                 max_workers: int = 8, rate_limiter=None, tracer=None):
+        """
+        Args:
+            session_token (str): The session token used to authenticate API requests.
+            api_url (str): The base URL of the API.
+            max_workers (int): The number of concurrent requests used by the bulk methods, and the size of the
+                connection pool.
+            rate_limiter (RateLimiter): Optional rate limiter every bulk request waits for.
+            tracer (OrderTracer): Optional tracer stamping create, replace and cancel requests.
+        """
         self.api_url = api_url
         self.session_token = session_token
         self.headers = {
             "Authorization": f"{self.session_token}"
         }
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.tracer = tracer
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-        
     
     def reconfirm_order(self, account_number, order_id):
         """
@@ -27,7 +73,7 @@ class TastytradeOrder:
             Exception: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/reconfirm"
-        response = requests.post(url, headers=self.headers)
+        response = self.session.post(url, headers=self.headers)
         
         if response.status_code == 201:
             response_data = response.json()
@@ -54,7 +100,7 @@ class TastytradeOrder:
             Exception: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/dry-run"
-        response = requests.post(url, headers=self.headers, json=order_data)
+        response = self.session.post(url, headers=self.headers, json=order_data)
         
         if response.status_code == 201:
             response_data = response.json()
@@ -80,7 +126,7 @@ class TastytradeOrder:
             Exception: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         
         if response.status_code == 200:
             response_data = response.json()
@@ -106,13 +152,8 @@ class TastytradeOrder:
             Exception: If there was an error in the DELETE request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.delete(url, headers=self.headers)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            return response_data
-        else:
-            raise Exception(f"Error cancelling order: {response.status_code} - {response.content}")
+        return self._send_traced("cancel", account_number, 200, "cancelling", self.session.delete, url,
+                                 headers=self.headers)
         
     def replace_order(self, account_number, order_id, order_data):
         """
@@ -133,13 +174,8 @@ class TastytradeOrder:
             Exception: If there was an error in the PUT request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.put(url, headers=self.headers, json=order_data)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            return response_data
-        else:
-            raise Exception(f"Error replacing order: {response.status_code} - {response.content}")
+        return self._send_traced("replace", account_number, 200, "replacing", self.session.put, url,
+                                 headers=self.headers, json=order_data)
 
     def edit_order(self, account_number, order_id, order_data):
         """
@@ -160,7 +196,7 @@ class TastytradeOrder:
             Exception: If there was an error in the PATCH request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.patch(url, headers=self.headers, json=order_data)
+        response = self.session.patch(url, headers=self.headers, json=order_data)
         
         if response.status_code == 200:
             response_data = response.json()
@@ -186,7 +222,7 @@ class TastytradeOrder:
             Exception: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/live"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         
         if response.status_code == 200:
             response_data = response.json()
@@ -237,7 +273,7 @@ class TastytradeOrder:
             "start-at": start_at,
             "end-at": end_at
         }
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         
         if response.status_code == 200:
             response_data = response.json()
@@ -267,13 +303,8 @@ class TastytradeOrder:
             "Authorization": f"{self.session_token}",
             "Content-Type": "application/json"
         }
-        response = requests.post(url, headers=headers, json=order)
-        
-        if response.status_code == 201:
-            response_data = response.json()
-            return response_data
-        else:
-            raise Exception(f"Error creating order: {response.status_code} - {response.content}")
+        return self._send_traced("create", account_number, 201, "creating", self.session.post, url,
+                                 headers=headers, json=order)
         
     def dry_run_new_order(self, account_number, order_data):
         """
@@ -293,7 +324,7 @@ class TastytradeOrder:
             Exception: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/dry-run"
-        response = requests.post(url, headers=self.headers, json=order_data)
+        response = self.session.post(url, headers=self.headers, json=order_data)
         
         if response.status_code == 201:
             response_data = response.json()
@@ -318,7 +349,7 @@ class TastytradeOrder:
             Exception: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/customers/{customer_id}/orders/live"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
 
         if response.status_code == 200:
             response_data = response.json()
@@ -370,10 +401,149 @@ class TastytradeOrder:
             "start-at": start_at,
             "end-at": end_at
         }
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         if response.status_code == 200:
             response_data = response.json()
             orders = response_data["data"]["items"]
             return orders
         else:
-            raise Exception(f"Error getting customer orders: {response.status_code} - {response.content}")
\ No newline at end of file
+            raise Exception(f"Error getting customer orders: {response.status_code} - {response.content}")
+
+    def create_order_from_template(self, account_number, template, price=None, quantity=1, symbols=None):
+        """
+        Creates an order from a pre-encoded OrderTemplate, patching in only the variable fields.
+
+        Args:
+            account_number (int): The account number for which to create the order.
+            template (OrderTemplate): The order template.
+            price: The limit price, if the template has one.
+            quantity (int): The multiplier applied to the template's leg quantities.
+            symbols (list): Optional leg symbols replacing the template's symbols.
+
+        Returns:
+            dict: Dictionary containing the response data, as returned by the API.
+
+        Raises:
+            Exception: If there was an error in the POST request or if the status code is not 201 CREATED.
+        """
+        url = f"{self.api_url}/accounts/{account_number}/orders"
+        headers = {
+            "Authorization": f"{self.session_token}",
+            "Content-Type": "application/json"
+        }
+        return self._send_traced("create", account_number, 201, "creating", self.session.post, url,
+                                 headers=headers, data=template.render(price, quantity, symbols))
+
+    def replace_order_from_template(self, account_number, order_id, template, price=None, quantity=1, symbols=None):
+        """
+        Replaces a live order with one rendered from a pre-encoded OrderTemplate.
+
+        Args:
+            account_number (int): The account number for the order to replace.
+            order_id (int): The ID of the order to replace.
+            template (OrderTemplate): The order template.
+            price: The limit price, if the template has one.
+            quantity (int): The multiplier applied to the template's leg quantities.
+            symbols (list): Optional leg symbols replacing the template's symbols.
+
+        Returns:
+            dict: Dictionary containing the response data, as returned by the API.
+
+        Raises:
+            Exception: If there was an error in the PUT request or if the status code is not 200 OK.
+        """
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
+        headers = {
+            "Authorization": f"{self.session_token}",
+            "Content-Type": "application/json"
+        }
+        return self._send_traced("replace", account_number, 200, "replacing", self.session.put, url,
+                                 headers=headers, data=template.render(price, quantity, symbols))
+
+    def _send_traced(self, operation, account_number, expected_status, verb, send, *args, **kwargs):
+        # Sends an order request, stamping it on the tracer if one is set
+        trace = self.tracer.start(operation, account_number) if self.tracer is not None else None
+        try:
+            response = send(*args, **kwargs)
+            response_data = response.json() if response.status_code == expected_status else None
+        except Exception as error:
+            # A request that never got a usable response still ends its trace
+            if trace is not None:
+                self.tracer.response(trace, error=error)
+            raise
+
+        if response.status_code == expected_status:
+            if trace is not None:
+                self.tracer.response(trace, response_data)
+            return response_data
+        if trace is not None:
+            self.tracer.response(trace, error=response.status_code)
+        raise Exception(f"Error {verb} order: {response.status_code} - {response.content}")
+
+    def _run_bulk(self, function, requests_list):
+        def run(item):
+            index, request = item
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                return BulkOrderResult(index, request, response=function(request))
+            except Exception as error:
+                return BulkOrderResult(index, request, error=error)
+
+        if not requests_list:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests_list))) as executor:
+            return list(executor.map(run, enumerate(requests_list)))
+
+    def create_orders(self, account_number, orders):
+        """
+        Submits several orders concurrently over the pooled connection.
+
+        Args:
+            account_number (int): The account number for which to create the orders.
+            orders (list): The order details to be created, as accepted by create_order.
+
+        Returns:
+            list: A BulkOrderResult per order, in input order. Failed submissions carry the error instead of
+            raising, so the other orders are not affected.
+        """
+        return self._run_bulk(lambda order: self.create_order(account_number, order), list(orders))
+
+    def cancel_orders(self, account_number, order_ids):
+        """
+        Requests cancellation of several orders concurrently over the pooled connection.
+
+        Args:
+            account_number (int): The account number of the orders.
+            order_ids (list): The IDs of the orders to cancel.
+
+        Returns:
+            list: A BulkOrderResult per order id, in input order.
+        """
+        return self._run_bulk(lambda order_id: self.cancel_order(account_number, order_id), list(order_ids))
+
+    def cancel_all_orders(self, account_number, underlying_symbol=None, status=None):
+        """
+        Cancels the live orders of an account, optionally filtered by underlying symbol and status.
+
+        Args:
+            account_number (int): The account number of the orders.
+            underlying_symbol (Union[str, List[str]]): Only cancel orders on this underlying symbol (or these symbols).
+            status (Union[str, List[str]]): Only cancel orders with this status (or these statuses), e.g. "Live".
+
+        Returns:
+            list: A BulkOrderResult per cancelled order.
+        """
+        if isinstance(underlying_symbol, str):
+            underlying_symbol = [underlying_symbol]
+        if isinstance(status, str):
+            status = [status]
+
+        live_orders = self.get_live_orders(account_number)["data"]["items"]
+        order_ids = [
+            order["id"] for order in live_orders
+            if order.get("cancellable", True)
+            and (underlying_symbol is None or order.get("underlying-symbol") in underlying_symbol)
+            and (status is None or order.get("status") in status)
+        ]
+        return self.cancel_orders(account_number, order_ids)
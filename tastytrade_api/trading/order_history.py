@@ -0,0 +1,195 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from ..streamer.account_events import TERMINAL_ORDER_STATUSES
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    account_number TEXT NOT NULL,
+    status TEXT,
+    underlying_symbol TEXT,
+    received_at TEXT,
+    updated_at TEXT,
+    terminal INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_account_received ON orders (account_number, received_at);
+CREATE INDEX IF NOT EXISTS orders_account_open ON orders (account_number, terminal, received_at);
+CREATE INDEX IF NOT EXISTS orders_underlying ON orders (underlying_symbol, received_at);
+CREATE INDEX IF NOT EXISTS orders_status ON orders (status, received_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account_number TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    synced_at REAL
+);
+"""
+
+
+class OrderHistoryStore:
+    """
+    Local SQLite table of account orders with indexes for queries by account, date, underlying symbol and status.
+
+    Args:
+        path (str): The database file. Defaults to an in-memory database.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        self.connection.close()
+
+    def upsert(self, orders):
+        """
+        Inserts orders or replaces the stored version of orders already present.
+
+        Args:
+            orders (list): Orders as returned by the API.
+        """
+        rows = [
+            (
+                order["id"],
+                str(order.get("account-number")),
+                order.get("status"),
+                order.get("underlying-symbol"),
+                order.get("received-at"),
+                order.get("updated-at"),
+                1 if order.get("status") in TERMINAL_ORDER_STATUSES else 0,
+                json.dumps(order),
+            )
+            for order in orders
+        ]
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def high_water_mark(self, account_number):
+        """Returns the latest updated-at value synced for an account, or None before the first sync."""
+        row = self.connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE account_number = ?", (str(account_number),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_high_water_mark(self, account_number, high_water_mark):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (str(account_number), high_water_mark, time.time())
+            )
+
+    def earliest_open_order(self, account_number):
+        """Returns the received-at value of the oldest stored order that is not in a terminal status, or None."""
+        row = self.connection.execute(
+            "SELECT MIN(received_at) FROM orders WHERE account_number = ? AND terminal = 0", (str(account_number),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def query(self, account_number=None, start_at=None, end_at=None, underlying_symbol=None, status=None, limit=None):
+        """
+        Returns stored orders matching all given filters, newest first.
+
+        Args:
+            account_number (str): Only orders of this account.
+            start_at (str): Only orders received at or after this date-time (or date, e.g. "2023-06-01").
+            end_at (str): Only orders received before this date-time (or date).
+            underlying_symbol (str): Only orders on this underlying symbol.
+            status (Union[str, List[str]]): Only orders with this status (or these statuses).
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list: Orders as returned by the API.
+        """
+        clauses = []
+        params = []
+        if account_number is not None:
+            clauses.append("account_number = ?")
+            params.append(str(account_number))
+        if start_at is not None:
+            clauses.append("received_at >= ?")
+            params.append(start_at)
+        if end_at is not None:
+            clauses.append("received_at < ?")
+            params.append(end_at)
+        if underlying_symbol is not None:
+            clauses.append("underlying_symbol = ?")
+            params.append(underlying_symbol)
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        sql = "SELECT data FROM orders"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY received_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self.connection.execute(sql, params)]
+
+
+class OrderHistorySync:
+    """
+    Incrementally copies an account's order history into an OrderHistoryStore.
+
+    The first sync downloads the whole history. Later syncs request only orders since the account's high-water
+    mark (the latest updated-at seen), or since the oldest order still open locally if that is earlier, so orders
+    that changed after they were stored are refreshed too.
+
+    Args:
+        order_client (TastytradeOrder): Client used to page through get_orders.
+        store (OrderHistoryStore): The local store.
+        per_page (int): Orders requested per page.
+    """
+
+    def __init__(self, order_client, store, per_page=250):
+        self.order_client = order_client
+        self.store = store
+        self.per_page = per_page
+
+    def sync(self, account_number, start_at=None):
+        """
+        Fetches new and changed orders of an account and upserts them into the store.
+
+        Args:
+            account_number (str): The account to sync.
+            start_at (str): Optional date-time to start from on the first sync.
+
+        Returns:
+            int: The number of orders fetched.
+        """
+        high_water_mark = self.store.high_water_mark(account_number)
+        earliest_open = self.store.earliest_open_order(account_number)
+        candidates = [value for value in (high_water_mark, earliest_open) if value]
+        if candidates:
+            start_at = min(candidates)
+
+        fetched = 0
+        latest = high_water_mark
+        page_offset = 0
+        while True:
+            response = self.order_client.get_orders(
+                account_number, per_page=self.per_page, page_offset=page_offset, sort="Asc", start_at=start_at
+            )
+            orders = response["data"]["items"]
+            if orders:
+                self.store.upsert(orders)
+                fetched += len(orders)
+                page_latest = max(order.get("updated-at") or "" for order in orders)
+                if page_latest and (latest is None or page_latest > latest):
+                    latest = page_latest
+            total_pages = response.get("pagination", {}).get("total-pages", 1)
+            page_offset += 1
+            if not orders or page_offset >= total_pages:
+                break
+
+        if latest is not None:
+            self.store.set_high_water_mark(account_number, latest)
+        logger.info("Synced %d orders for account %s since %s", fetched, account_number, start_at)
+        return fetched
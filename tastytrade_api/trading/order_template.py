@@ -0,0 +1,120 @@
+import json
+from decimal import Decimal
+
+REQUIRED_ORDER_FIELDS = ("order-type", "time-in-force", "legs")
+REQUIRED_LEG_FIELDS = ("instrument-type", "symbol", "quantity", "action")
+
+_PRICE = "price"
+_QUANTITY = "quantity"
+_SYMBOL = "symbol"
+
+
+class OrderTemplate:
+    """
+    An order whose invariant part is validated and JSON encoded once.
+
+    At send time only the price, the quantity and optionally the leg symbols are patched into the pre-encoded
+    body, which skips rebuilding and re-encoding the order dictionary. Leg quantities of the template are ratios:
+    rendering with quantity=3 sends three times each leg's quantity.
+
+    Example:
+        template = OrderTemplate({
+            "order-type": "Limit", "time-in-force": "Day", "price": "1.00", "price-effect": "Debit",
+            "legs": [{"instrument-type": "Equity Option", "symbol": "SPY   230616C00400000",
+                      "quantity": 1, "action": "Buy to Open"}],
+        })
+        order_client.create_order_from_template(account_number, template, price="1.25", quantity=2)
+
+    Args:
+        order (dict): The order, as accepted by TastytradeOrder.create_order.
+
+    Raises:
+        ValueError: If the order is missing required fields.
+    """
+
+    def __init__(self, order):
+        for field in REQUIRED_ORDER_FIELDS:
+            if field not in order:
+                raise ValueError(f"Order template is missing '{field}'")
+        if not order["legs"]:
+            raise ValueError("Order template has no legs")
+        for leg in order["legs"]:
+            for field in REQUIRED_LEG_FIELDS:
+                if field not in leg:
+                    raise ValueError(f"Order template leg is missing '{field}'")
+
+        self.order = order
+        self.has_price = "price" in order
+        self.quote_price = isinstance(order.get("price"), str)
+        self.ratios = [_ratio(leg["quantity"]) for leg in order["legs"]]
+        self.symbols = [leg["symbol"] for leg in order["legs"]]
+        self.encoded_symbols = [json.dumps(symbol).encode() for symbol in self.symbols]
+
+        markers = {}
+        body = dict(order)
+        if self.has_price:
+            body["price"] = self._marker(markers, _PRICE, None)
+        legs = []
+        for index, leg in enumerate(order["legs"]):
+            leg = dict(leg)
+            leg["quantity"] = self._marker(markers, _QUANTITY, index)
+            leg["symbol"] = self._marker(markers, _SYMBOL, index)
+            legs.append(leg)
+        body["legs"] = legs
+
+        encoded = json.dumps(body, separators=(",", ":"))
+        self.parts = []
+        self.slots = []
+        position = 0
+        for marker, slot in sorted(((encoded.index(f'"{marker}"'), slot) for marker, slot in markers.items())):
+            self.parts.append(encoded[position:marker].encode())
+            self.slots.append(slot)
+            position = encoded.index('"', marker + 1) + 1
+        self.parts.append(encoded[position:].encode())
+
+    @staticmethod
+    def _marker(markers, field, index):
+        marker = f"\x00{field}:{index}\x00"
+        markers[json.dumps(marker)[1:-1]] = (field, index)
+        return marker
+
+    def render(self, price=None, quantity=1, symbols=None):
+        """
+        Returns the encoded order body with the variable fields patched in.
+
+        Args:
+            price (Union[str, Decimal, float]): The limit price. Required if the template has a price.
+            quantity (int): The multiplier applied to each leg's quantity ratio.
+            symbols (list): Optional leg symbols replacing the template's symbols, one per leg.
+
+        Returns:
+            bytes: The JSON encoded order.
+        """
+        if self.has_price:
+            if price is None:
+                raise ValueError("Order template needs a price")
+            price = str(Decimal(str(price)))
+            encoded_price = f'"{price}"'.encode() if self.quote_price else price.encode()
+        if symbols is None:
+            encoded_symbols = self.encoded_symbols
+        else:
+            if len(symbols) != len(self.ratios):
+                raise ValueError(f"Expected {len(self.ratios)} symbols, got {len(symbols)}")
+            encoded_symbols = [json.dumps(symbol).encode() for symbol in symbols]
+
+        parts = self.parts
+        chunks = [parts[0]]
+        for position, (field, index) in enumerate(self.slots, 1):
+            if field == _PRICE:
+                chunks.append(encoded_price)
+            elif field == _QUANTITY:
+                chunks.append(str(self.ratios[index] * quantity).encode())
+            else:
+                chunks.append(encoded_symbols[index])
+            chunks.append(parts[position])
+        return b"".join(chunks)
+
+
+def _ratio(quantity):
+    quantity = Decimal(str(quantity))
+    return int(quantity) if quantity == quantity.to_integral_value() else quantity
@@ -0,0 +1,199 @@
+import collections
+import json
+import logging
+import threading
+import time
+import uuid
+
+from ..streamer.account_events import TERMINAL_ORDER_STATUSES
+from ..streamer.latency import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class OrderTrace:
+    """
+    Timestamps of a single order request, from submission to the terminal status reported by the account streamer.
+
+    All timestamps are time.perf_counter_ns() values, None until the stage is reached.
+    """
+
+    __slots__ = ("trace_id", "operation", "account_number", "order_id", "submitted_ns", "response_ns",
+                 "first_event_ns", "first_event_status", "terminal_ns", "status", "error")
+
+    def __init__(self, operation, account_number):
+        self.trace_id = uuid.uuid4().hex
+        self.operation = operation
+        self.account_number = account_number
+        self.order_id = None
+        self.submitted_ns = time.perf_counter_ns()
+        self.response_ns = None
+        self.first_event_ns = None
+        self.first_event_status = None
+        self.terminal_ns = None
+        self.status = None
+        self.error = None
+
+    def to_dict(self):
+        """Returns the trace with stage latencies in microseconds, as written to the trace log."""
+
+        def micros(end):
+            return (end - self.submitted_ns) // 1000 if end is not None else None
+
+        return {
+            "trace-id": self.trace_id,
+            "operation": self.operation,
+            "account-number": self.account_number,
+            "order-id": self.order_id,
+            "status": self.status,
+            "error": self.error,
+            "response-us": micros(self.response_ns),
+            "first-event-us": micros(self.first_event_ns),
+            "first-event-status": self.first_event_status,
+            "terminal-us": micros(self.terminal_ns),
+        }
+
+
+class OrderTracer:
+    """
+    Correlates order requests with account streamer Order events and records per-stage latency histograms.
+
+    Pass the tracer to TastytradeOrder(tracer=...) to trace create, replace and cancel requests, and feed it the
+    account streamer events, e.g. ``streamer.add_handler("Order", tracer.on_event)``. Latencies are recorded in a
+    LatencyRecorder keyed by operation ("create", "replace", "cancel") and stage:
+
+        - ``ack``: submit to HTTP response
+        - ``first_event``: submit to the first streamer event of the order
+        - ``fill``: submit to the Filled status
+        - ``terminal``: submit to any terminal status (filled, cancelled, rejected, ...)
+
+    Traces are keyed by order id and operation, so a cancel or replace of an order that is still traced keeps the
+    create trace running, and both receive the order's events. Order events are also kept for max_event_age
+    seconds, because the streamer can report an order before the HTTP response of its request arrives.
+
+    Args:
+        recorder (LatencyRecorder): The recorder for the histograms. A new one is created if omitted.
+        trace_log: Optional callable receiving each finished trace as a dictionary, or a file-like object that
+            gets one JSON line per trace.
+        max_pending (int): Maximum number of orders with unfinished traces kept; the oldest are dropped beyond it.
+        max_event_age (float): Seconds an order event is kept for traces whose response has not arrived yet.
+    """
+
+    def __init__(self, recorder=None, trace_log=None, max_pending=10000, max_event_age=30.0):
+        self.recorder = recorder or LatencyRecorder()
+        self.trace_log = trace_log
+        self.max_pending = max_pending
+        self.max_event_age_ns = int(max_event_age * 1e9)
+        self.pending = collections.OrderedDict()
+        self.early_events = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def start(self, operation, account_number):
+        """
+        Starts a trace right before an order request is sent.
+
+        Args:
+            operation (str): "create", "replace" or "cancel".
+            account_number (str): The account of the order.
+
+        Returns:
+            OrderTrace: The new trace.
+        """
+        return OrderTrace(operation, account_number)
+
+    def response(self, trace, response_data=None, error=None):
+        """
+        Records the HTTP response of a traced request.
+
+        Args:
+            trace (OrderTrace): The trace returned by start().
+            response_data (dict): The parsed response of a successful request.
+            error: The status code or error of a failed request.
+        """
+        trace.response_ns = time.perf_counter_ns()
+        self.recorder.record(trace.operation, "ack", (trace.response_ns - trace.submitted_ns) // 1000)
+        if error is not None or not response_data:
+            trace.error = str(error)
+            self.finish(trace)
+            return
+
+        data = response_data.get("data", {})
+        order = data.get("order", data)
+        trace.order_id = order.get("id")
+        trace.status = order.get("status")
+        if trace.order_id is None:
+            self.finish(trace)
+            return
+
+        with self.lock:
+            self.pending.setdefault(trace.order_id, {})[trace.operation] = trace
+            while len(self.pending) > self.max_pending:
+                self.pending.popitem(last=False)
+            # Events the streamer delivered between the request and its response
+            early = [event for event in self.early_events.get(trace.order_id, ()) if event[0] >= trace.submitted_ns]
+        for event_ns, status in early:
+            self._apply(trace, event_ns, status)
+
+    def on_event(self, event):
+        """
+        Processes an account streamer event. Non-order events are ignored.
+
+        Args:
+            event (AccountEvent): The decoded event, typically an OrderEvent.
+        """
+        if event.type != "Order" or not isinstance(event.data, dict):
+            return
+        event_ns = time.perf_counter_ns()
+        order_id = event.data.get("id")
+        status = event.data.get("status")
+        with self.lock:
+            self.early_events.setdefault(order_id, []).append((event_ns, status))
+            self.early_events.move_to_end(order_id)
+            self._expire_events(event_ns)
+            traces = list(self.pending.get(order_id, {}).values())
+        for trace in traces:
+            self._apply(trace, event_ns, status)
+
+    def _expire_events(self, now_ns):
+        # Orders are kept in order of their latest event, so expired ones are at the front
+        cutoff = now_ns - self.max_event_age_ns
+        while self.early_events:
+            order_id, events = next(iter(self.early_events.items()))
+            if events[-1][0] >= cutoff:
+                break
+            del self.early_events[order_id]
+
+    def _apply(self, trace, event_ns, status):
+        trace.status = status
+        if trace.first_event_ns is None:
+            trace.first_event_ns = event_ns
+            trace.first_event_status = status
+            self.recorder.record(trace.operation, "first_event", (event_ns - trace.submitted_ns) // 1000)
+        if status in TERMINAL_ORDER_STATUSES and trace.terminal_ns is None:
+            trace.terminal_ns = event_ns
+            self.recorder.record(trace.operation, "terminal", (event_ns - trace.submitted_ns) // 1000)
+            if status == "Filled":
+                self.recorder.record(trace.operation, "fill", (event_ns - trace.submitted_ns) // 1000)
+            with self.lock:
+                traces = self.pending.get(trace.order_id)
+                if traces is not None and traces.get(trace.operation) is trace:
+                    del traces[trace.operation]
+                    if not traces:
+                        del self.pending[trace.order_id]
+            self.finish(trace)
+
+    def finish(self, trace):
+        if self.trace_log is None:
+            return
+        record = trace.to_dict()
+        try:
+            if callable(self.trace_log):
+                self.trace_log(record)
+            else:
+                self.trace_log.write(json.dumps(record) + "\n")
+        except Exception:
+            logger.exception("Could not write order trace %s", trace.trace_id)
+
+    def snapshot(self):
+        """Returns the latency histogram summaries, keyed by operation and stage (microseconds)."""
+        return self.recorder.snapshot()
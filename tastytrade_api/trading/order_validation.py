@@ -0,0 +1,295 @@
+import logging
+import threading
+import time
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_UP
+
+logger = logging.getLogger(__name__)
+
+MULTIPLIERS = {"Equity": 1, "Equity Option": 100, "Cryptocurrency": 1}
+PRICED_ORDER_TYPES = {"Limit", "Stop Limit"}
+
+
+class OrderValidationResult:
+    """
+    The outcome of a local order validation.
+
+    Attributes:
+        order (dict): The order, with quantities and price rounded if rounding was allowed.
+        errors (list): Reasons the order would be rejected.
+        adjustments (list): Descriptions of the roundings applied to the order.
+        needs_dry_run (bool): True if buying power could not be confirmed locally with the configured margin of
+            safety, so the order should go through a server dry run first.
+    """
+
+    __slots__ = ("order", "errors", "adjustments", "needs_dry_run")
+
+    def __init__(self, order):
+        self.order = order
+        self.errors = []
+        self.adjustments = []
+        self.needs_dry_run = False
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"OrderValidationResult(ok={self.ok}, errors={self.errors}, needs_dry_run={self.needs_dry_run})"
+
+
+class OrderValidator:
+    """
+    Validates orders locally against cached quantity precisions, tick sizes and buying power, so the server dry run
+    is only needed for orders whose cost is close to the available buying power.
+
+    Args:
+        account_number (str): The account the orders are for.
+        instruments (TastytradeInstruments): Client used to load quantity precisions and tick sizes.
+        positions_client (TastytradeAccountPositions): Client used to load balances.
+        account_client (TastytradeAccount): Optional client used to load margin requirements.
+        margin_of_safety (float): Fraction of buying power kept as a buffer. Orders costing more than
+            (1 - margin_of_safety) of the buying power are flagged for a server dry run.
+        balance_ttl (float): Seconds cached balances and margin requirements stay valid.
+        tick_size_retry (float): Seconds before tick sizes that could not be loaded are requested again.
+    """
+
+    def __init__(self, account_number, instruments, positions_client, account_client=None, margin_of_safety=0.1,
+                 balance_ttl=30, tick_size_retry=300):
+        self.account_number = account_number
+        self.instruments = instruments
+        self.positions_client = positions_client
+        self.account_client = account_client
+        self.margin_of_safety = Decimal(str(margin_of_safety))
+        self.balance_ttl = balance_ttl
+        self.precisions = None
+        self.tick_sizes = {}
+        self.tick_size_retry = tick_size_retry
+        self.tick_size_misses = {}
+        self.buying_power = None
+        self.buying_power_time = 0
+        self.lock = threading.Lock()
+
+    def quantity_precision(self, instrument_type, symbol):
+        """Returns the number of decimals allowed in quantities of a symbol."""
+        if self.precisions is None:
+            precisions = {}
+            data = self.instruments.get_quantity_decimal_precisions()
+            for item in data.get("items", []) if isinstance(data, dict) else data:
+                key = (item.get("instrument-type"), item.get("symbol"))
+                precisions[key] = int(item.get("value", 0))
+            self.precisions = precisions
+        precision = self.precisions.get((instrument_type, symbol))
+        if precision is None:
+            precision = self.precisions.get((instrument_type, None), 0)
+        return precision
+
+    def set_tick_sizes(self, key, tick_sizes):
+        """
+        Sets the tick sizes of a symbol or option root, e.g. from instrument data already loaded by the caller.
+
+        Args:
+            key (str): The equity, future or option underlying symbol.
+            tick_sizes (list): The "tick-sizes" list of the instrument, e.g. [{"value": "0.05", "threshold": "3"},
+                {"value": "0.1"}].
+        """
+        self.tick_sizes[key] = sorted(
+            ((Decimal(str(tick["threshold"])) if tick.get("threshold") is not None else None, Decimal(str(tick["value"])))
+             for tick in tick_sizes),
+            key=lambda tick: (tick[0] is None, tick[0] or 0),
+        )
+
+    def _load_tick_sizes(self, instrument_type, symbol, underlying_symbol):
+        try:
+            if instrument_type == "Equity":
+                key = symbol
+                tick_sizes = self.instruments.get_equities(symbol)[0].get("tick-sizes")
+            elif instrument_type == "Equity Option":
+                key = underlying_symbol
+                tick_sizes = self.instruments.get_option_chains(underlying_symbol)[0].get("tick-sizes")
+            elif instrument_type == "Future":
+                key = symbol
+                tick_size = self.instruments.get_futures(symbol)[0].get("tick-size")
+                tick_sizes = [{"value": tick_size}] if tick_size else None
+            else:
+                return None
+        except Exception as error:
+            logger.warning("Could not load tick sizes for %s: %s", symbol, error)
+            return None
+        if tick_sizes:
+            self.set_tick_sizes(key, tick_sizes)
+        return self.tick_sizes.get(key)
+
+    def tick_size(self, instrument_type, symbol, underlying_symbol, price):
+        """Returns the tick size that applies to a price, or None if it is unknown."""
+        key = underlying_symbol if instrument_type == "Equity Option" else symbol
+        tick_sizes = self.tick_sizes.get(key)
+        if tick_sizes is None:
+            missed_at = self.tick_size_misses.get(key)
+            if missed_at is not None and time.monotonic() - missed_at < self.tick_size_retry:
+                return None
+            tick_sizes = self._load_tick_sizes(instrument_type, symbol, underlying_symbol)
+            if not tick_sizes:
+                # Remember the miss, so validate() does not block on the same lookup for every order
+                self.tick_size_misses[key] = time.monotonic()
+                return None
+        for threshold, value in tick_sizes:
+            if threshold is None or price < threshold:
+                return value
+        return tick_sizes[-1][1]
+
+    def available_buying_power(self, instrument_type):
+        """Returns the cached buying power for an instrument type, refreshing it when older than balance_ttl."""
+        with self.lock:
+            if self.buying_power is None or time.monotonic() - self.buying_power_time > self.balance_ttl:
+                balances = self.positions_client.get_account_balances(self.account_number)
+                buying_power = {
+                    "equity": _decimal(balances.get("equity-buying-power")),
+                    "derivative": _decimal(balances.get("derivative-buying-power")),
+                }
+                if self.account_client is not None:
+                    requirements = self.account_client.get_margin_requirements(self.account_number)
+                    option_buying_power = _decimal(requirements.get("option-buying-power"))
+                    if option_buying_power is not None and buying_power["derivative"] is not None:
+                        buying_power["derivative"] = min(buying_power["derivative"], option_buying_power)
+                self.buying_power = buying_power
+                self.buying_power_time = time.monotonic()
+            return self.buying_power["equity" if instrument_type == "Equity" else "derivative"]
+
+    def invalidate_balances(self):
+        """Forces the next validation to reload balances, e.g. after a fill."""
+        self.buying_power = None
+
+    def validate(self, order, allow_rounding=True):
+        """
+        Validates an order locally.
+
+        Args:
+            order (dict): The order, as accepted by TastytradeOrder.create_order.
+            allow_rounding (bool): Round quantities down to the allowed precision and the price to the tick size
+                (down for debits, up for credits) instead of rejecting the order.
+
+        Returns:
+            OrderValidationResult: The validation outcome. The input order is not modified.
+        """
+        order = dict(order, legs=[dict(leg) for leg in order.get("legs", [])])
+        result = OrderValidationResult(order)
+        legs = order["legs"]
+        if not legs:
+            result.errors.append("Order has no legs")
+            return result
+
+        for leg in legs:
+            self._validate_quantity(leg, result, allow_rounding)
+        if result.errors:
+            return result
+
+        first_leg = legs[0]
+        instrument_type = first_leg.get("instrument-type")
+        underlying_symbol = order.get("underlying-symbol") or _underlying_of(first_leg)
+        price = _decimal(order.get("price"))
+
+        if order.get("order-type") in PRICED_ORDER_TYPES:
+            if price is None or price < 0:
+                result.errors.append("Limit orders need a non-negative price")
+                return result
+            price = self._validate_price(order, price, instrument_type, first_leg.get("symbol"), underlying_symbol,
+                                         result, allow_rounding)
+            if result.errors:
+                return result
+
+        self._check_buying_power(order, price, instrument_type, result)
+        return result
+
+    def _validate_quantity(self, leg, result, allow_rounding):
+        quantity = _decimal(leg.get("quantity"))
+        if quantity is None or quantity <= 0:
+            result.errors.append(f"Leg {leg.get('symbol')} has an invalid quantity {leg.get('quantity')!r}")
+            return
+        precision = self.quantity_precision(leg.get("instrument-type"), leg.get("symbol"))
+        rounded = quantity.quantize(Decimal(1).scaleb(-precision), rounding=ROUND_DOWN)
+        if rounded == quantity:
+            return
+        if not allow_rounding or rounded <= 0:
+            result.errors.append(f"Leg {leg.get('symbol')} quantity {quantity} exceeds {precision} decimals")
+            return
+        leg["quantity"] = _number(rounded)
+        result.adjustments.append(f"Rounded {leg.get('symbol')} quantity {quantity} to {rounded}")
+
+    def _validate_price(self, order, price, instrument_type, symbol, underlying_symbol, result, allow_rounding):
+        tick = self.tick_size(instrument_type, symbol, underlying_symbol, price)
+        if tick is None or tick <= 0:
+            return price
+        ticks = price / tick
+        if ticks == ticks.to_integral_value():
+            return price
+        if not allow_rounding:
+            result.errors.append(f"Price {price} is not a multiple of the tick size {tick}")
+            return price
+        rounding = ROUND_UP if order.get("price-effect") == "Credit" else ROUND_DOWN
+        rounded = ticks.to_integral_value(rounding=rounding) * tick
+        order["price"] = str(rounded)
+        result.adjustments.append(f"Rounded price {price} to {rounded} (tick size {tick})")
+        return rounded
+
+    def _check_buying_power(self, order, price, instrument_type, result):
+        multiplier = MULTIPLIERS.get(instrument_type)
+        if order.get("price-effect") != "Debit" or price is None or multiplier is None:
+            # Credits, market orders and futures need the server's margin calculation
+            result.needs_dry_run = True
+            return
+        size = min(_decimal(leg["quantity"]) for leg in order["legs"])
+        cost = price * size * multiplier
+        buying_power = self.available_buying_power(instrument_type)
+        if buying_power is None:
+            result.needs_dry_run = True
+        elif cost > buying_power:
+            result.errors.append(f"Order cost {cost} exceeds buying power {buying_power}")
+        elif cost > buying_power * (1 - self.margin_of_safety):
+            result.needs_dry_run = True
+
+    def submit(self, order_client, order, allow_rounding=True):
+        """
+        Validates an order and submits it, running a server dry run first only when needs_dry_run is set.
+
+        Args:
+            order_client (TastytradeOrder): The order client to submit with.
+            order (dict): The order to submit.
+            allow_rounding (bool): See validate().
+
+        Returns:
+            dict: The create_order response.
+
+        Raises:
+            Exception: If the order fails local validation or the dry run reports errors.
+        """
+        result = self.validate(order, allow_rounding)
+        if not result.ok:
+            raise Exception(f"Order rejected by local validation: {'; '.join(result.errors)}")
+        if result.needs_dry_run:
+            dry_run = order_client.dry_run_new_order(self.account_number, result.order)
+            errors = dry_run.get("data", {}).get("errors") or []
+            if errors:
+                raise Exception(f"Order rejected by dry run: {errors}")
+        response = order_client.create_order(self.account_number, result.order)
+        self.invalidate_balances()
+        return response
+
+
+def _decimal(value):
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def _number(value):
+    return int(value) if value == value.to_integral_value() else str(value)
+
+
+def _underlying_of(leg):
+    symbol = leg.get("symbol") or ""
+    if leg.get("instrument-type") == "Equity Option":
+        return symbol[:6].strip()
+    return symbol
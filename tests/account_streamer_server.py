@@ -0,0 +1,64 @@
+"""
+Local stand-in for the account streamer websocket endpoint, used by the async streamer tests.
+
+It records the action messages of each connection and exposes the server side sockets, so tests can push
+notifications and drop connections.
+"""
+import asyncio
+import json
+from http import HTTPStatus
+
+import websockets
+
+
+class AccountStreamerStandIn:
+    """
+    Local websocket server recording the messages of each connection.
+
+    Attributes:
+        reject (int): Number of upcoming opening handshakes to refuse with HTTP 503.
+        rejected (int): Number of refused handshakes.
+    """
+
+    def __init__(self):
+        self.connections = []
+        self.sockets = []
+        self.reject = 0
+        self.rejected = 0
+
+    async def process_request(self, path, request_headers):
+        if self.reject:
+            self.reject -= 1
+            self.rejected += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, [], b"unavailable"
+        return None
+
+    async def handler(self, websocket):
+        messages = []
+        self.connections.append(messages)
+        self.sockets.append(websocket)
+        try:
+            async for message in websocket:
+                messages.append(json.loads(message))
+        except websockets.ConnectionClosed:
+            pass
+
+    def actions(self, connection):
+        return [message["action"] for message in self.connections[connection]]
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self.handler, "127.0.0.1", 0, process_request=self.process_request)
+        self.url = f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *args):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def wait_until(condition, timeout=5):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.01)
@@ -0,0 +1,51 @@
+"""
+Throughput benchmark of CometdWebsocketClient and Quote.from_list against the local stand-in server.
+
+Run with: python -m tests.benchmark_dxfeed [seconds] [symbol_count]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import time
+
+from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+from tastytrade_api.streamer.dx_mapping import Quote
+from tests.cometd_server import CometdStandInServer, synthetic_symbols
+
+
+async def run(seconds, symbol_count):
+    symbols = synthetic_symbols(symbol_count)
+
+    async def on_handshake_success(client):
+        for symbol in symbols:
+            await client.send_subscription_message(client.websocket, "Quote", symbol)
+
+    async with CometdStandInServer(rate=None) as server:
+        queue = asyncio.Queue()
+        client = CometdWebsocketClient(server.url, "token", queue, on_handshake_success)
+        connect_task = asyncio.create_task(client.connect())
+
+        await queue.get()
+        received = 0
+        quotes = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            message = await queue.get()
+            received += 1
+            quotes += len(Quote.from_list(message))
+        elapsed = time.perf_counter() - start
+
+        await server.drop_connections()
+        await asyncio.gather(connect_task, return_exceptions=True)
+
+    print(f"symbols: {symbol_count}, messages: {received}, quotes: {quotes}, elapsed: {elapsed:.2f}s")
+    print(f"throughput: {received / elapsed:,.0f} messages/s, {elapsed / max(received, 1) * 1e6:.1f} us/message")
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    symbol_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    asyncio.run(run(seconds, symbol_count))
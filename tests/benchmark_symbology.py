@@ -0,0 +1,53 @@
+"""
+Per-symbol cost of the symbology encoders, parsers and streamer symbol conversions.
+
+Run with: python -m tests.benchmark_symbology [contract_count]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import time
+
+from tastytrade_api.symbology import (
+    from_streamer_symbol,
+    parse_option_symbols,
+    to_streamer_symbol,
+    to_tastytrade_option_symbol,
+    to_tastytrade_option_symbols,
+)
+
+
+def measure(name, count, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {elapsed * 1e9 / count:8.0f} ns/symbol")
+    return result
+
+
+def run(contract_count):
+    strikes = [100 + i * 0.5 for i in range(contract_count)]
+    option_types = ["call" if i % 2 else "put" for i in range(contract_count)]
+
+    measure("to_tastytrade_option_symbol", contract_count, lambda: [
+        to_tastytrade_option_symbol("SPY", strike, option_type, "2023-06-16")
+        for strike, option_type in zip(strikes, option_types)
+    ])
+    symbols = measure("to_tastytrade_option_symbols", contract_count,
+                      lambda: to_tastytrade_option_symbols("SPY", strikes, option_types, "2023-06-16"))
+    measure("parse_option_symbols", contract_count, lambda: parse_option_symbols(symbols))
+    to_streamer_symbol.cache_clear()
+    streamer_symbols = measure("to_streamer_symbol (cold)", contract_count,
+                               lambda: [to_streamer_symbol(symbol) for symbol in symbols])
+    measure("to_streamer_symbol (memoized)", contract_count, lambda: [to_streamer_symbol(symbol) for symbol in symbols])
+    from_streamer_symbol.cache_clear()
+    measure("from_streamer_symbol (cold)", contract_count,
+            lambda: [from_streamer_symbol(symbol) for symbol in streamer_symbols])
+    measure("from_streamer_symbol (memoized)", contract_count,
+            lambda: [from_streamer_symbol(symbol) for symbol in streamer_symbols])
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,155 @@
+"""
+Local stand-in for the dxfeed CometD websocket endpoint, used by the streamer tests and benchmarks.
+
+It speaks the handshake, /meta/connect, /service/sub and /service/data flows of CometdWebsocketClient and
+generates synthetic Quote, Trade and Greeks events for the subscribed symbols.
+"""
+import asyncio
+import itertools
+import json
+import random
+import time
+
+import websockets
+
+EVENT_FIELDS = {
+    "Quote": ["eventSymbol", "eventTime", "sequence", "timeNanoPart", "bidTime", "bidExchangeCode", "bidPrice",
+              "bidSize", "askTime", "askExchangeCode", "askPrice", "askSize"],
+    "Trade": ["eventSymbol", "eventTime", "time", "timeNanoPart", "sequence", "exchangeCode", "price", "change",
+              "size", "dayVolume", "dayTurnover", "tickDirection", "extendedTradingHours"],
+    "Greeks": ["eventSymbol", "eventTime", "eventFlags", "index", "time", "sequence", "price", "volatility",
+               "delta", "gamma", "theta", "rho", "vega"],
+}
+
+
+def synthetic_symbols(count):
+    """Returns count distinct synthetic symbols."""
+    return [f"SYM{i}" for i in range(count)]
+
+
+def synthetic_event(event_type, symbol, sequence):
+    """Returns the values of a synthetic event in the legacy field order of EVENT_FIELDS."""
+    now = int(time.time() * 1000)
+    price = round(100 + random.random() * 10, 2)
+    if event_type == "Quote":
+        return [symbol, now, sequence, 0, now, "Q", price, 100, now, "Q", round(price + 0.01, 2), 200]
+    if event_type == "Trade":
+        return [symbol, now, now, 0, sequence, "Q", price, 0.01, 10, 1000, 100000.0, "UP", False]
+    if event_type == "Greeks":
+        return [symbol, now, 0, 0, now, sequence, price, 0.25, 0.5, 0.01, -0.05, 0.02, 0.1]
+    raise ValueError(f"Unsupported event type {event_type}")
+
+
+class CometdStandInServer:
+    """
+    Minimal CometD/dxfeed server.
+
+    Args:
+        rate (float): Data messages per second per connection, None to send as fast as possible.
+        response_delay (float): Seconds to wait before answering handshake, connect and subscription messages.
+        disconnect_after (int): Close each connection after this many data messages, None to never disconnect.
+        batch_size (int): Events per data message.
+    """
+
+    def __init__(self, rate=1000, response_delay=0, disconnect_after=None, batch_size=1):
+        self.rate = rate
+        self.response_delay = response_delay
+        self.disconnect_after = disconnect_after
+        self.batch_size = batch_size
+        self.server = None
+        self.port = None
+        self.connections = 0
+        self.handshakes = 0
+        self.heartbeats = 0
+        self.messages_sent = 0
+        self.active = set()
+        self.client_ids = itertools.count(1)
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/live/cometd"
+
+    async def start(self):
+        self.server = await websockets.serve(self.handler, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def drop_connections(self):
+        """Closes every open connection, as a server side disconnect."""
+        for websocket in list(self.active):
+            await websocket.close(code=1011, reason="injected disconnect")
+
+    async def reply(self, websocket, message):
+        if self.response_delay:
+            await asyncio.sleep(self.response_delay)
+        await websocket.send(json.dumps([message]))
+
+    async def handler(self, websocket, path=None):
+        self.connections += 1
+        self.active.add(websocket)
+        subscriptions = []
+        publisher = None
+        try:
+            async for raw in websocket:
+                for message in json.loads(raw):
+                    channel = message.get("channel")
+                    if channel == "/meta/handshake":
+                        self.handshakes += 1
+                        await self.reply(websocket, {
+                            "id": message.get("id"), "channel": channel, "successful": True,
+                            "clientId": f"stand-in-{next(self.client_ids)}", "version": "1.0",
+                        })
+                    elif channel == "/meta/connect":
+                        self.heartbeats += 1
+                        await self.reply(websocket, {"id": message.get("id"), "channel": channel, "successful": True})
+                    elif channel == "/service/sub":
+                        for event_type, symbols in message.get("data", {}).get("add", {}).items():
+                            subscriptions.extend((event_type, symbol) for symbol in symbols)
+                        await self.reply(websocket, {"id": message.get("id"), "channel": channel, "successful": True})
+                        if publisher is None:
+                            publisher = asyncio.ensure_future(self.publish(websocket, subscriptions))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.active.discard(websocket)
+            if publisher is not None:
+                publisher.cancel()
+
+    async def publish(self, websocket, subscriptions):
+        interval = 1.0 / self.rate if self.rate else 0
+        sent_header = set()
+        sequence = 0
+        next_send = time.perf_counter()
+        while True:
+            event_type, symbol = subscriptions[sequence % len(subscriptions)]
+            values = []
+            for _ in range(self.batch_size):
+                values.extend(synthetic_event(event_type, symbol, sequence))
+            if event_type in sent_header:
+                data = [event_type, values]
+            else:
+                data = [[event_type, EVENT_FIELDS[event_type]], values]
+                sent_header.add(event_type)
+            await websocket.send(json.dumps([{"channel": "/service/data", "data": data}]))
+            sequence += 1
+            self.messages_sent += 1
+            if self.disconnect_after is not None and sequence >= self.disconnect_after:
+                await websocket.close(code=1011, reason="injected disconnect")
+                return
+            if interval:
+                next_send += interval
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif sequence % 100 == 0:
+                await asyncio.sleep(0)
@@ -0,0 +1,92 @@
+"""
+Local stand-in for the DXLink websocket endpoint, used by the DXLink client tests.
+
+It answers SETUP, AUTH, CHANNEL_REQUEST and FEED_SETUP the way the DXLink server does, confirms only the fields
+it supports (so the confirmed field lists differ from the requested ones) and answers FEED_SUBSCRIPTION with
+one COMPACT FEED_DATA message per event type. Every value is "<symbol>.<field>", so misaligned rows are obvious.
+"""
+import json
+
+import websockets
+
+SUPPORTED_FIELDS = {
+    "Quote": ["eventType", "eventSymbol", "eventTime", "sequence", "bidExchangeCode", "bidPrice", "bidSize",
+              "askExchangeCode", "askPrice", "askSize"],
+    "Greeks": ["eventType", "eventSymbol", "eventTime", "price", "volatility", "delta", "gamma", "theta", "rho",
+               "vega"],
+}
+
+
+class DXLinkStandInServer:
+
+    def __init__(self, token="dxfeed-token"):
+        self.token = token
+        self.received = []
+        self.confirmed_fields = {}
+
+    async def handler(self, websocket):
+        try:
+            async for message in websocket:
+                data = json.loads(message)
+                self.received.append(data)
+                for reply in self.replies(data):
+                    await websocket.send(json.dumps(reply))
+        except websockets.ConnectionClosed:
+            pass
+
+    def replies(self, data):
+        message_type = data.get("type")
+        if message_type == "SETUP":
+            return [{"type": "SETUP", "channel": 0, "keepaliveTimeout": 60, "acceptKeepaliveTimeout": 60,
+                     "version": "stand-in"},
+                    {"type": "AUTH_STATE", "channel": 0, "state": "UNAUTHORIZED"}]
+        if message_type == "AUTH":
+            state = "AUTHORIZED" if data.get("token") == self.token else "UNAUTHORIZED"
+            return [{"type": "AUTH_STATE", "channel": 0, "state": state}]
+        if message_type == "CHANNEL_REQUEST":
+            return [{"type": "CHANNEL_OPENED", "channel": data["channel"], "service": data.get("service"),
+                     "parameters": data.get("parameters")}]
+        if message_type == "FEED_SETUP":
+            # Like the real server, confirm the field list of each event type in its own FEED_CONFIG
+            replies = []
+            for event_type, fields in data.get("acceptEventFields", {}).items():
+                supported = SUPPORTED_FIELDS.get(event_type, fields)
+                self.confirmed_fields[event_type] = [field for field in supported if field in fields]
+                replies.append({"type": "FEED_CONFIG", "channel": data["channel"],
+                                "aggregationPeriod": data.get("acceptAggregationPeriod", 0.1),
+                                "dataFormat": data.get("acceptDataFormat", "COMPACT"),
+                                "eventFields": {event_type: self.confirmed_fields[event_type]}})
+            return replies
+        if message_type == "FEED_SUBSCRIPTION":
+            symbols = {}
+            for entry in data.get("add", []):
+                symbols.setdefault(entry["type"], []).append(entry["symbol"])
+            payload = []
+            for event_type, event_symbols in symbols.items():
+                values = []
+                for symbol in event_symbols:
+                    values.extend(self.event(event_type, symbol))
+                payload.extend([event_type, values])
+            return [{"type": "FEED_DATA", "channel": data["channel"], "data": payload}] if payload else []
+        return []
+
+    def event(self, event_type, symbol):
+        """Returns the COMPACT values of one event, in the confirmed field order."""
+        values = []
+        for field in self.confirmed_fields[event_type]:
+            if field == "eventType":
+                values.append(event_type)
+            elif field == "eventSymbol":
+                values.append(symbol)
+            else:
+                values.append(f"{symbol}.{field}")
+        return values
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self.handler, "127.0.0.1", 0)
+        self.url = f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *args):
+        self.server.close()
+        await self.server.wait_closed()
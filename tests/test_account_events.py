@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json
+import unittest
+from unittest import mock
+
+from tastytrade_api.streamer.account_events import (
+    AccountBalanceEvent,
+    AccountEvent,
+    AccountEventDispatcher,
+    EVENT_TYPES,
+    OrderEvent,
+    PositionEvent,
+    PublicWatchlistsEvent,
+    QuoteAlertEvent,
+    decode_message,
+)
+from tastytrade_api.streamer.latency import LatencyRecorder
+from tastytrade_api.streamer.streamer import TastytradeStreamer
+
+MESSAGES = {
+    "Order": ({"id": 1, "status": "Live", "underlying-symbol": "SPY"}, OrderEvent, "status", "Live"),
+    "ComplexOrder": ({"id": 2, "status": "Live", "orders": []}, OrderEvent, "id", 2),
+    "CurrentPosition": ({"symbol": "SPY", "quantity": 10}, PositionEvent, "quantity", 10),
+    "Position": ({"symbol": "QQQ", "quantity": 5}, PositionEvent, "symbol", "QQQ"),
+    "AccountBalance": ({"cash-balance": "100.0"}, AccountBalanceEvent, "cash_balance", "100.0"),
+    "QuoteAlert": ({"symbol": "SPY", "threshold": "400"}, QuoteAlertEvent, "threshold", "400"),
+    "PublicWatchlists": ([{"name": "Crypto"}], PublicWatchlistsEvent, "watchlists", [{"name": "Crypto"}]),
+}
+
+
+class TestDecodeMessage(unittest.TestCase):
+
+    def test_event_types(self):
+        self.assertEqual(set(MESSAGES), set(EVENT_TYPES))
+        for message_type, (data, event_class, attribute, value) in MESSAGES.items():
+            with self.subTest(message_type):
+                event = decode_message(json.dumps({"type": message_type, "data": data, "timestamp": 1688400000000}))
+                self.assertIs(type(event), event_class)
+                self.assertEqual(event.type, message_type)
+                self.assertEqual(event.timestamp, 1688400000000)
+                self.assertEqual(getattr(event, attribute), value)
+
+    def test_unknown_type(self):
+        event = decode_message(b'{"type": "ExternalTransaction", "data": {"id": 3}}')
+
+        self.assertIs(type(event), AccountEvent)
+        self.assertEqual((event.type, event.data), ("ExternalTransaction", {"id": 3}))
+
+    def test_non_dict_payload(self):
+        for message_type in ("Order", "AccountBalance", "QuoteAlert"):
+            with self.subTest(message_type):
+                with self.assertLogs("tastytrade_api.streamer.account_events", "WARNING"):
+                    event = decode_message(json.dumps({"type": message_type, "data": None}))
+                self.assertIs(type(event), AccountEvent)
+                self.assertEqual((event.type, event.data), (message_type, None))
+        with self.subTest("Not an object"):
+            self.assertEqual(decode_message("[1, 2]").data, [1, 2])
+
+    def test_action_response(self):
+        message = {"status": "ok", "action": "heartbeat", "web-socket-session-id": "abc", "request-id": 4}
+
+        event = decode_message(message)
+
+        self.assertIs(type(event), AccountEvent)
+        self.assertEqual((event.type, event.action), (None, "heartbeat"))
+        self.assertEqual(event.data, message)
+
+
+class TestAccountEventDispatcher(unittest.TestCase):
+
+    def test_dispatch(self):
+        dispatcher = AccountEventDispatcher()
+        received = []
+
+        def failing(event):
+            raise ValueError("handler bug")
+
+        dispatcher.register("Order", failing)
+        dispatcher.register("Order", received.append)
+        event = decode_message({"type": "Order", "data": {"id": 1}})
+
+        with self.assertLogs("tastytrade_api.streamer.account_events", "ERROR"):
+            self.assertTrue(dispatcher.dispatch(event))
+        self.assertEqual(received, [event])
+        with self.subTest("Unhandled type"):
+            self.assertFalse(dispatcher.dispatch(decode_message({"type": "AccountBalance", "data": {}})))
+        with self.subTest("Unregister"):
+            dispatcher.unregister("Order", received.append)
+            with self.assertLogs("tastytrade_api.streamer.account_events", "ERROR"):
+                dispatcher.dispatch(event)
+            self.assertEqual(received, [event])
+
+
+class TestStreamerOnMessage(unittest.TestCase):
+
+    def setUp(self):
+        self.streamer = TastytradeStreamer("token", "wss://localhost")
+
+    def test_handlers_get_typed_events(self):
+        orders, responses = [], []
+        self.streamer.add_handler("Order", orders.append)
+        self.streamer.add_handler(None, responses.append)
+
+        self.streamer.on_message(None, json.dumps({"type": "Order", "data": {"id": 1, "status": "Filled"}}))
+        self.streamer.on_message(None, json.dumps({"action": "connect", "status": "ok", "value": ["5WT00001"]}))
+
+        self.assertEqual([(type(event), event.status) for event in orders], [(OrderEvent, "Filled")])
+        self.assertEqual([event.action for event in responses], ["connect"])
+
+    def test_unhandled_message_logged(self):
+        with self.assertLogs("tastytrade_api.streamer.streamer", "INFO") as logs:
+            self.streamer.on_message(None, json.dumps({"type": "QuoteAlert", "data": {"symbol": "SPY"}}))
+
+        self.assertIn("SPY", logs.output[0])
+
+    def test_instrumented_decodes_once(self):
+        streamer = TastytradeStreamer("token", "wss://localhost", latency=LatencyRecorder())
+        orders = []
+        streamer.add_handler("Order", orders.append)
+        message = json.dumps({"type": "Order", "timestamp": 1688400000000, "data": {"id": 1}})
+
+        with mock.patch("tastytrade_api.streamer.account_events.json.loads", wraps=json.loads) as loads:
+            streamer.on_message_instrumented(None, message)
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual([event.id for event in orders], [1])
+        self.assertTrue({"decode", "dispatch"} <= set(streamer.latency.snapshot()["Order"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import json
+import unittest
+import requests_mock
+
+from tastytrade_api.account.account_state import AccountStateStore
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.streamer.account_events import AccountEvent
+from tastytrade_api.streamer.async_streamer import AsyncTastytradeStreamer
+from tastytrade_api.trading.order import TastytradeOrder
+from tests.account_streamer_server import AccountStreamerStandIn, wait_until
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+
+
+def order(order_id, status="Live", underlying="SPY"):
+    return {"id": order_id, "account-number": ACCOUNT, "status": status, "underlying-symbol": underlying}
+
+
+def position(symbol, quantity, underlying="SPY"):
+    return {"account-number": ACCOUNT, "symbol": symbol, "quantity": quantity, "underlying-symbol": underlying}
+
+
+class TestAccountStateStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = AccountStateStore(
+            ACCOUNT,
+            TastytradeOrder("token", API_URL),
+            TastytradeAccountPositions("token", API_URL),
+        )
+        self.changes = []
+        self.store.add_listener(lambda kind, key, old, new: self.changes.append((kind, key)))
+
+    def mock_snapshot(self, mock, orders, positions, balances):
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/orders/live", json={"data": {"items": orders}})
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/positions", json={"data": {"items": positions}})
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/balances", json={"data": balances})
+
+    @requests_mock.Mocker()
+    def test_load_snapshot(self, mock):
+        self.mock_snapshot(mock, [order(1), order(2, underlying="QQQ")], [position("SPY", "10")], {"cash-balance": "100"})
+
+        self.store.load_snapshot()
+
+        with self.subTest("Check orders"):
+            self.assertEqual(set(self.store.orders), {1, 2})
+            self.assertEqual(self.store.orders_for_underlying("QQQ"), [order(2, underlying="QQQ")])
+        with self.subTest("Check positions"):
+            self.assertEqual(self.store.get_position("SPY")["quantity"], "10")
+        with self.subTest("Check balances"):
+            self.assertEqual(self.store.balances, {"cash-balance": "100"})
+        with self.subTest("Check no callbacks"):
+            self.assertEqual(self.changes, [])
+
+    def test_apply_events(self):
+        self.store.apply(AccountEvent("Order", None, 1, order(1)))
+        self.store.apply(AccountEvent("CurrentPosition", None, 2, position("SPY", "5")))
+        self.store.apply(AccountEvent("Order", None, 3, order(1, status="Filled")))
+        self.store.apply(AccountEvent("CurrentPosition", None, 4, position("SPY", "0")))
+        self.store.apply(AccountEvent("Order", None, 5, dict(order(9), **{"account-number": "OTHER"})))
+
+        with self.subTest("Check filled order removed"):
+            self.assertIsNone(self.store.get_order(1))
+            self.assertEqual(self.store.orders_for_underlying("SPY"), [])
+        with self.subTest("Check closed position removed"):
+            self.assertIsNone(self.store.get_position("SPY"))
+            self.assertEqual(self.store.positions_by_underlying, {})
+        with self.subTest("Check callbacks"):
+            self.assertEqual(self.changes, [("order", 1), ("position", "SPY"), ("order", 1), ("position", "SPY")])
+
+    def test_apply_complex_order(self):
+        complex_order = {"id": 50, "type": "OTOCO", "trigger-order": order(51), "orders": [order(52), order(53)]}
+        self.store.apply(AccountEvent("ComplexOrder", None, 1, complex_order))
+        complex_order["orders"][0] = order(52, status="Cancelled")
+        self.store.apply(AccountEvent("ComplexOrder", None, 2, complex_order))
+
+        self.assertEqual(set(self.store.orders), {51, 53})
+        self.assertEqual(self.changes[-3:], [("order", 52), ("order", 53), ("order", 51)])
+
+    def test_apply_message(self):
+        self.store.apply_message('{"type": "AccountBalance", "data": {"account-number": "5WT00001", "cash-balance": "5"}}')
+
+        self.store.apply(AccountEvent("Order", None, 1, None))
+
+        self.assertEqual(self.store.balances["cash-balance"], "5")
+        self.assertEqual(self.changes, [("balances", ACCOUNT)])
+
+    @requests_mock.Mocker()
+    def test_resync(self, mock):
+        self.mock_snapshot(mock, [order(1), order(2)], [position("SPY", "10"), position("QQQ", "1", "QQQ")], {"cash-balance": "1"})
+        self.store.load_snapshot()
+        self.store.begin_resync()
+        self.store.apply(AccountEvent("Order", None, 1, dict(order(3), **{"updated-at": "2023-01-01T10:00:00Z"})))
+        self.store.apply(AccountEvent("Order", None, 2, dict(order(2, status="Routed"), **{"updated-at": "2023-01-01T09:00:00Z"})))
+
+        self.mock_snapshot(
+            mock,
+            [dict(order(2), **{"updated-at": "2023-01-01T09:30:00Z"})],
+            [position("SPY", "12"), position("QQQ", "1", "QQQ")],
+            {"cash-balance": "1"},
+        )
+        with self.subTest("Check buffered while resyncing"):
+            self.assertIsNone(self.store.get_order(3))
+        self.store.resync()
+
+        with self.subTest("Check synthetic changes"):
+            self.assertEqual(self.changes, [("order", 1), ("order", 2), ("position", "SPY"), ("order", 3)])
+        with self.subTest("Check converged state"):
+            self.assertEqual(set(self.store.orders), {2, 3})
+            self.assertEqual(self.store.get_order(2)["status"], "Live")
+            self.assertEqual(self.store.get_position("SPY")["quantity"], "12")
+        with self.subTest("Check buffer released"):
+            self.assertIsNone(self.store.buffer)
+
+    @requests_mock.Mocker()
+    def test_resync_drops_stale_complex_order_components(self, mock):
+        def updated(item, updated_at):
+            return dict(item, **{"updated-at": updated_at})
+
+        self.mock_snapshot(mock, [], [], {"cash-balance": "1"})
+        self.store.load_snapshot()
+        self.store.begin_resync()
+        complex_order = {"id": 60, "type": "OCO", "orders": [
+            # Older than the snapshot, although its string sorts after the snapshot's
+            updated(order(61, status="Routed"), "2023-01-01T09:30:00+01:00"),
+            # Newer than the snapshot, although its string sorts before the snapshot's
+            updated(order(62, status="Cancelled"), "2023-01-01T09:30:00Z"),
+        ]}
+        self.store.apply(AccountEvent("ComplexOrder", None, 1, complex_order))
+        self.store.apply(AccountEvent("Order", None, 2, updated(order(61, status="Received"), "2023-01-01T08:00:00Z")))
+
+        self.mock_snapshot(mock, [updated(order(61), "2023-01-01T09:00:00Z"),
+                                  updated(order(62), "2023-01-01T10:00:00+01:00")], [], {"cash-balance": "1"})
+        self.store.resync()
+
+        self.assertEqual(set(self.store.orders), {61})
+        self.assertEqual(self.store.get_order(61)["status"], "Live")
+        self.assertEqual(self.changes, [("order", 61), ("order", 62), ("order", 62)])
+        with self.subTest("Check whole complex order stale"):
+            complex_order["orders"] = complex_order["orders"][:1]
+            self.assertTrue(self.store._is_stale(AccountEvent("ComplexOrder", None, 3, complex_order)))
+
+
+
+class TestResyncOnReconnect(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.server = await AccountStreamerStandIn().__aenter__()
+        self.addAsyncCleanup(self.server.__aexit__)
+
+        self.store = AccountStateStore(ACCOUNT, TastytradeOrder("token", API_URL),
+                                       TastytradeAccountPositions("token", API_URL))
+        self.changes = []
+        self.store.add_listener(lambda kind, key, old, new: self.changes.append((kind, key)))
+        self.mock_snapshot([order(1)])
+        self.store.load_snapshot()
+
+        self.resyncs = []
+        self.streamer = AsyncTastytradeStreamer(
+            "token", self.server.url, reconnect_delay=0,
+            on_reconnect=lambda streamer: self.resyncs.append(self.store.start_resync(streamer)),
+        )
+        await self.streamer.connect()
+        await self.streamer.connect_account([ACCOUNT])
+        self.consumer = asyncio.ensure_future(self.consume())
+        self.addAsyncCleanup(self.stop)
+
+    async def consume(self):
+        async for event in self.streamer:
+            self.store.apply(event)
+
+    async def stop(self):
+        await self.streamer.close()
+        await asyncio.wait_for(self.consumer, 5)
+
+    def mock_snapshot(self, orders, status_code=200):
+        self.mock.get(f"{API_URL}/accounts/{ACCOUNT}/orders/live", status_code=status_code,
+                      json={"data": {"items": orders}})
+        self.mock.get(f"{API_URL}/accounts/{ACCOUNT}/positions", json={"data": {"items": []}})
+        self.mock.get(f"{API_URL}/accounts/{ACCOUNT}/balances", json={"data": {"cash-balance": "1"}})
+
+    async def drop_connection(self):
+        await wait_until(lambda: "connect" in self.server.actions(0))
+        await self.server.sockets[0].close(code=1011)
+        await wait_until(lambda: len(self.server.connections) == 2 and "connect" in self.server.actions(1))
+        await wait_until(lambda: self.resyncs)
+
+    async def test_reconnect_resubscribes_and_resyncs(self):
+        self.mock_snapshot([order(1), order(2)])
+
+        await self.drop_connection()
+        await self.server.sockets[1].send(json.dumps({"type": "Order", "data": order(3)}))
+        await asyncio.wait(self.resyncs)
+        await wait_until(lambda: self.store.get_order(3) is not None)
+
+        replayed = {message["action"]: message["value"] for message in self.server.connections[1]}
+        self.assertEqual(replayed["connect"], [ACCOUNT])
+        self.assertEqual(set(self.store.orders), {1, 2, 3})
+        self.assertEqual(self.changes, [("order", 2), ("order", 3)])
+        self.assertFalse(self.store.stale)
+
+    async def test_failed_resync_marks_stale(self):
+        self.mock_snapshot([], status_code=500)
+
+        with self.assertLogs("tastytrade_api.account.account_state", "ERROR"):
+            await self.drop_connection()
+            await asyncio.wait(self.resyncs)
+            await asyncio.sleep(0)
+
+        self.assertTrue(self.store.stale)
+        self.assertIsNone(self.store.buffer)
+        self.assertEqual(set(self.store.orders), {1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import json
+import unittest
+
+from tastytrade_api.streamer.account_events import OrderEvent
+from tastytrade_api.streamer.async_streamer import AsyncTastytradeStreamer
+from tests.account_streamer_server import AccountStreamerStandIn, wait_until
+
+
+class TestAsyncTastytradeStreamer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await AccountStreamerStandIn().__aenter__()
+        self.addAsyncCleanup(self.server.__aexit__)
+
+    async def test_connect_and_heartbeat(self):
+        async with AsyncTastytradeStreamer("token", self.server.url, heartbeat_interval=0.02) as streamer:
+            await streamer.connect_account(["5WT00001"])
+            await wait_until(lambda: self.server.actions(0).count("heartbeat") >= 2)
+            await self.server.sockets[0].send(json.dumps({"type": "Order", "data": {"id": 1, "status": "Live"}}))
+
+            event = await streamer.__anext__()
+
+        self.assertIsInstance(event, OrderEvent)
+        self.assertEqual(event.id, 1)
+        connect = next(message for message in self.server.connections[0] if message["action"] == "connect")
+        self.assertEqual(connect, {"auth-token": "token", "action": "connect", "value": ["5WT00001"]})
+
+    async def test_reconnect_resubscribes(self):
+        reconnects = []
+        streamer = AsyncTastytradeStreamer("token", self.server.url, reconnect_delay=0,
+                                           on_reconnect=reconnects.append)
+        await streamer.connect()
+        self.addAsyncCleanup(streamer.close)
+        await streamer.connect_account(["5WT00001"])
+        await streamer.connect_account(["5WT00002", "5WT00001"])
+        await streamer.quote_alerts_subscribe()
+        await wait_until(lambda: len(self.server.connections[0]) == 4)
+
+        receiving = asyncio.ensure_future(streamer.__anext__())
+        await self.server.sockets[0].close(code=1011)
+        await wait_until(lambda: len(self.server.connections) == 2 and len(self.server.connections[1]) == 3)
+        await self.server.sockets[1].send(json.dumps({"type": "Order", "data": {"id": 2}}))
+        event = await asyncio.wait_for(receiving, 5)
+
+        self.assertEqual(event.id, 2)
+        self.assertEqual(reconnects, [streamer])
+        replayed = {message["action"]: message["value"] for message in self.server.connections[1]}
+        self.assertEqual(replayed["connect"], ["5WT00001", "5WT00002"])
+        self.assertIn("quote-alerts-subscribe", replayed)
+
+    async def test_reconnect_backoff_after_rejected_handshakes(self):
+        streamer = AsyncTastytradeStreamer("token", self.server.url, reconnect_delay=0.01, max_reconnect_delay=0.02)
+        await streamer.connect()
+        self.addAsyncCleanup(streamer.close)
+        await streamer.connect_account(["5WT00001"])
+        await wait_until(lambda: len(self.server.connections[0]) == 2)
+
+        self.server.reject = 3
+        with self.assertLogs("tastytrade_api.streamer.async_streamer", "WARNING") as logs:
+            receiving = asyncio.ensure_future(streamer.__anext__())
+            await self.server.sockets[0].close(code=1011)
+            await wait_until(lambda: len(self.server.connections) == 2 and len(self.server.connections[1]) == 2)
+            await self.server.sockets[1].send(json.dumps({"type": "Order", "data": {"id": 3}}))
+            event = await asyncio.wait_for(receiving, 5)
+
+        self.assertEqual(event.id, 3)
+        self.assertEqual(self.server.rejected, 3)
+        self.assertEqual([message.rsplit(" ", 1)[-1] for message in logs.output],
+                         ["0.01s", "0.02s", "0.02s", "0.02s"])
+
+    async def test_close_stops_iteration(self):
+        async with AsyncTastytradeStreamer("token", self.server.url) as streamer:
+            await streamer.connect_account(["5WT00001"])
+
+        with self.subTest("After __aexit__"):
+            with self.assertRaises(StopAsyncIteration):
+                await asyncio.wait_for(streamer.__anext__(), 1)
+
+        await streamer.connect()
+        receiving = asyncio.ensure_future(streamer.__anext__())
+        await asyncio.sleep(0.05)
+        await streamer.close()
+        with self.subTest("While receiving"):
+            with self.assertRaises(StopAsyncIteration):
+                await asyncio.wait_for(receiving, 5)
+        self.assertEqual(len(self.server.connections), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import re
+import tempfile
+import unittest
+import requests_mock
+
+from tastytrade_api.account.balance_backfill import BalanceSnapshotBackfill, trading_dates
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNTS = ["5WT00001", "5WT00002"]
+
+
+class TestBalanceSnapshotBackfill(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.positions_client = TastytradeAccountPositions("token", API_URL)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_trading_dates(self):
+        self.assertEqual(trading_dates("2023-06-15", "2023-06-20", holidays=["2023-06-19"]),
+                         ["2023-06-15", "2023-06-16", "2023-06-20"])
+
+    @requests_mock.Mocker()
+    def test_backfill_cached(self, mock):
+        def snapshot(request, context):
+            account_number = request.path.split("/")[2].upper()
+            snapshot_date = request.qs["snapshot-date"][0]
+            if account_number == "5WT00002" and snapshot_date == "2023-06-16":
+                context.status_code = 500
+                return {}
+            return {"data": {"account-number": account_number, "snapshot-date": snapshot_date,
+                             "net-liquidating-value": snapshot_date[-2:]}}
+
+        mock.get(re.compile(f"{API_URL}/accounts/.*/balance-snapshots"), json=snapshot)
+        backfill = BalanceSnapshotBackfill(self.positions_client, self.directory.name, max_workers=4)
+
+        table = backfill.backfill(ACCOUNTS, "2023-06-14", "2023-06-18")
+
+        with self.subTest("Check table"):
+            self.assertEqual(len(table), 5)
+            self.assertEqual(table.get("5WT00001", "2023-06-15")["net-liquidating-value"], 15.0)
+            self.assertEqual(table.series("5WT00001", "net-liquidating-value"),
+                             [("2023-06-14", 14.0), ("2023-06-15", 15.0), ("2023-06-16", 16.0)])
+            self.assertEqual(list(table.errors), [("5WT00002", "2023-06-16", "EOD")])
+        with self.subTest("Check cached dates not fetched again"):
+            requests_before = mock.call_count
+            table = BalanceSnapshotBackfill(self.positions_client, self.directory.name).backfill(
+                ACCOUNTS, "2023-06-14", "2023-06-18")
+            self.assertEqual(mock.call_count - requests_before, 1)
+            self.assertEqual(len(table), 5)
+            self.assertEqual(list(table.errors), [("5WT00002", "2023-06-16", "EOD")])
+
+    @requests_mock.Mocker()
+    def test_snapshot_of_other_date_not_cached(self, mock):
+        # The API answers with the latest snapshot before the requested date, e.g. for a date without one
+        mock.get(f"{API_URL}/accounts/5WT00001/balance-snapshots", json={"data": {"items": [
+            {"snapshot-date": "2023-06-15", "net-liquidating-value": "15"}]}})
+        backfill = BalanceSnapshotBackfill(self.positions_client, self.directory.name)
+
+        table = backfill.backfill(["5WT00001"], "2023-06-16", "2023-06-16")
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.missing, [("5WT00001", "2023-06-16", "EOD")])
+        self.assertEqual(backfill._cached("5WT00001", "EOD"), {})
+        table = backfill.backfill(["5WT00001"], "2023-06-16", "2023-06-16")
+        self.assertEqual(mock.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+POSITIONS_URL = f"{API_URL}/accounts/{ACCOUNT}/positions"
+
+
+def make_position(symbol, quantity, mark, direction="Long"):
+    return {"symbol": symbol, "instrument-type": "Equity", "quantity": quantity, "quantity-direction": direction,
+            "mark-price": mark}
+
+
+class TestPollPositionChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TastytradeAccountPositions("token", API_URL)
+
+    @requests_mock.Mocker()
+    def test_poll_position_changes(self, mock):
+        first = [make_position("SPY", 10, "400.0"), make_position("QQQ", 5, "300.0"), make_position("IWM", 1, "180.0")]
+        mock.get(POSITIONS_URL, json={"data": {"items": first}})
+
+        delta = self.client.poll_position_changes(ACCOUNT, mark_threshold=1.0, include_marks=True)
+        with self.subTest("Check first poll"):
+            self.assertEqual([position["symbol"] for position in delta.opened], ["SPY", "QQQ", "IWM"])
+
+        with self.subTest("Check unchanged payload"):
+            self.assertFalse(self.client.poll_position_changes(ACCOUNT, mark_threshold=1.0, include_marks=True))
+
+        second = [make_position("SPY", 10, "400.5"), make_position("QQQ", 5, "301.0", "Short"),
+                  make_position("AAPL", 3, "180.0")]
+        mock.get(POSITIONS_URL, json={"data": {"items": second}})
+        delta = self.client.poll_position_changes(ACCOUNT, mark_threshold=1.0, include_marks=True)
+        with self.subTest("Check delta"):
+            self.assertEqual([position["symbol"] for position in delta.opened], ["AAPL"])
+            self.assertEqual([position["symbol"] for position in delta.closed], ["IWM"])
+            self.assertEqual([(old, position["symbol"]) for old, position in delta.quantity_changed], [(5.0, "QQQ")])
+            self.assertEqual([(old, position["symbol"]) for old, position in delta.mark_changed], [(300.0, "QQQ")])
+
+        third = [make_position("SPY", 10, "401.0"), make_position("QQQ", 5, "301.0", "Short"),
+                 make_position("AAPL", 3, "180.0")]
+        mock.get(POSITIONS_URL, json={"data": {"items": third}})
+        delta = self.client.poll_position_changes(ACCOUNT, mark_threshold=1.0, include_marks=True)
+        with self.subTest("Check mark compared to last reported mark"):
+            self.assertEqual([(old, position["symbol"]) for old, position in delta.mark_changed], [(400.0, "SPY")])
+
+
+if __name__ == '__main__':
+    unittest.main()
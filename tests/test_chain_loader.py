@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import os
+import re
+import tempfile
+import threading
+import unittest
+import requests_mock
+
+from tastytrade_api.market_data.chain_loader import ChainLoader
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+
+API_URL = "https://api.tastytrade.com"
+UNDERLYINGS = [f"SYM{i}" for i in range(20)]
+
+
+class TestChainLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "chains.checkpoint")
+        self.instruments = TastytradeInstruments("token", API_URL)
+        self.received = {}
+        self.sink_threads = set()
+        self.failing = {"SYM7"}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def sink(self, symbol, items):
+        self.sink_threads.add(threading.get_ident())
+        self.received[symbol] = items
+
+    @requests_mock.Mocker()
+    def test_load_and_resume(self, mock):
+        def chain(request, context):
+            symbol = request.path.split("/")[2].upper()
+            if symbol in self.failing:
+                context.status_code = 500
+                return {}
+            return {"data": {"items": [{"underlying-symbol": symbol}]}}
+
+        mock.get(re.compile(f"{API_URL}/option-chains/.*/nested"), json=chain)
+        progress = []
+        loader = ChainLoader(self.instruments, self.sink, max_workers=4, checkpoint_path=self.checkpoint_path,
+                             progress=lambda done, total, rate: progress.append((done, total)), retries=0)
+
+        report = loader.load(UNDERLYINGS)
+
+        with self.subTest("Check first load"):
+            self.assertEqual(sorted(report.loaded), sorted(set(UNDERLYINGS) - {"SYM7"}))
+            self.assertEqual(list(report.failed), ["SYM7"])
+            self.assertEqual(self.received["SYM3"], [{"underlying-symbol": "SYM3"}])
+            self.assertEqual(self.sink_threads, {threading.get_ident()})
+            self.assertEqual(progress[-1], (20, 20))
+
+        self.failing = set()
+        report = ChainLoader(self.instruments, self.sink, checkpoint_path=self.checkpoint_path).load(UNDERLYINGS)
+
+        with self.subTest("Check resume"):
+            self.assertEqual(report.loaded, ["SYM7"])
+            self.assertEqual(len(report.skipped), 19)
+
+
+if __name__ == '__main__':
+    unittest.main()
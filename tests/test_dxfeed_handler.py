@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import marshal
+import os
+import unittest
+
+import websockets
+
+from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+from tastytrade_api.streamer.dx_mapping import Quote
+from tastytrade_api.streamer.shared_ring import SharedRingReader, SharedRingWriter
+from tests.cometd_server import CometdStandInServer, synthetic_symbols
+
+
+def subscribe(event_type, symbols):
+    async def on_handshake_success(client):
+        for symbol in symbols:
+            await client.send_subscription_message(client.websocket, event_type, symbol)
+    return on_handshake_success
+
+
+async def take(queue, count, timeout=5):
+    items = []
+    for _ in range(count):
+        items.append(await asyncio.wait_for(queue.get(), timeout))
+    return items
+
+
+class TestCometdWebsocketClient(unittest.IsolatedAsyncioTestCase):
+
+    async def test_quote_stream(self):
+        symbols = synthetic_symbols(3)
+        async with CometdStandInServer(rate=500) as server:
+            queue = asyncio.Queue()
+            client = CometdWebsocketClient(server.url, "token", queue, subscribe("Quote", symbols))
+            connect_task = asyncio.create_task(client.connect())
+            messages = await take(queue, 20)
+            connect_task.cancel()
+            await asyncio.gather(connect_task, return_exceptions=True)
+
+        quotes = [quote for message in messages for quote in Quote.from_list(message)]
+        with self.subTest("Check client id"):
+            self.assertEqual(client.client_id, "stand-in-1")
+        with self.subTest("Check header message"):
+            self.assertEqual(messages[0][0][0], "Quote")
+        with self.subTest("Check quotes"):
+            self.assertEqual(len(quotes), 20)
+            self.assertEqual({quote.symbol for quote in quotes}, set(symbols))
+
+    async def test_reconnect_after_disconnect(self):
+        async with CometdStandInServer(rate=None, disconnect_after=5) as server:
+            queue = asyncio.Queue()
+            client = CometdWebsocketClient(server.url, "token", queue, subscribe("Trade", ["SPY"]))
+
+            with self.assertRaises(websockets.ConnectionClosed):
+                await asyncio.wait_for(client.connect(), 5)
+            with self.assertRaises(websockets.ConnectionClosed):
+                await asyncio.wait_for(client.connect(), 5)
+
+        with self.subTest("Check connections"):
+            self.assertEqual(server.connections, 2)
+        with self.subTest("Check handshakes"):
+            self.assertEqual(server.handshakes, 2)
+        with self.subTest("Check messages"):
+            self.assertEqual(queue.qsize(), 10)
+
+    async def test_slow_responses(self):
+        async with CometdStandInServer(rate=200, response_delay=0.2) as server:
+            queue = asyncio.Queue()
+            client = CometdWebsocketClient(server.url, "token", queue, subscribe("Greeks", ["SPY"]))
+            connect_task = asyncio.create_task(client.connect())
+            message = (await take(queue, 1))[0]
+            connect_task.cancel()
+            await asyncio.gather(connect_task, return_exceptions=True)
+
+        self.assertEqual(message[0][0], "Greeks")
+
+    async def test_oversized_publish_keeps_streaming(self):
+        writer = SharedRingWriter(f"tt-test-dxfeed-{os.getpid()}", slot_count=64, slot_size=512)
+        reader = SharedRingReader(writer.name)
+        try:
+            async with CometdStandInServer(rate=500, batch_size=5) as server:
+                queue = asyncio.Queue()
+                client = CometdWebsocketClient(server.url, "token", queue, subscribe("Quote", synthetic_symbols(5)),
+                                               publisher=writer)
+                connect_task = asyncio.create_task(client.connect())
+                messages = await take(queue, 5)
+                connect_task.cancel()
+                await asyncio.gather(connect_task, return_exceptions=True)
+            # Every message is published before it is queued, so the queue holds all received messages
+            received = messages + [queue.get_nowait() for _ in range(queue.qsize())]
+            published = reader.read_batch()
+        finally:
+            reader.close()
+            writer.unlink()
+
+        with self.subTest("Check queue keeps receiving"):
+            self.assertEqual(len(messages), 5)
+        fitting = [message for message in received if len(marshal.dumps(message)) <= writer.max_payload]
+        with self.subTest("Check drops counted"):
+            self.assertGreater(client.publish_dropped, 0)
+            self.assertEqual(client.publish_dropped, len(received) - len(fitting))
+        with self.subTest("Check messages that fit are published"):
+            self.assertTrue(published)
+            self.assertEqual(published, fitting)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import unittest
+
+from tastytrade_api.streamer.dxlink_handler import DEFAULT_EVENT_FIELDS, DXLinkWebsocketClient
+from tests.dxlink_server import DXLinkStandInServer
+
+EVENT_FIELDS = {"Quote": DEFAULT_EVENT_FIELDS["Quote"], "Greeks": DEFAULT_EVENT_FIELDS["Greeks"]}
+
+
+class TestDXLinkWebsocketClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await DXLinkStandInServer().__aenter__()
+        self.addAsyncCleanup(self.server.__aexit__)
+        self.queue = asyncio.Queue()
+        self.ready = []
+
+    async def on_feed_ready(self, client):
+        self.ready.append(client)
+        await client.send_subscription_message(client.websocket, "Quote", ["SPY", "AAPL"])
+        await client.send_subscription_message(client.websocket, "Greeks", ".SPY230616C400")
+
+    async def run_client(self, token="dxfeed-token"):
+        client = DXLinkWebsocketClient(self.server.url, token, self.queue, on_feed_ready=self.on_feed_ready,
+                                       aggregation_period=0.5, event_fields=EVENT_FIELDS)
+        task = asyncio.ensure_future(client.connect())
+        self.addAsyncCleanup(self.cancel, task)
+        return client
+
+    async def cancel(self, task):
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def test_session_setup(self):
+        client = await self.run_client()
+        for _ in range(2):
+            await asyncio.wait_for(self.queue.get(), 5)
+
+        types = [message["type"] for message in self.server.received]
+        self.assertEqual(types, ["SETUP", "AUTH", "CHANNEL_REQUEST", "FEED_SETUP", "FEED_SUBSCRIPTION",
+                                 "FEED_SUBSCRIPTION"])
+        auth, channel_request, feed_setup = self.server.received[1:4]
+        with self.subTest("AUTH after UNAUTHORIZED"):
+            self.assertEqual(auth["token"], "dxfeed-token")
+        with self.subTest("CHANNEL_REQUEST after AUTHORIZED"):
+            self.assertEqual((channel_request["channel"], channel_request["service"]), (1, "FEED"))
+        with self.subTest("FEED_SETUP after CHANNEL_OPENED"):
+            self.assertEqual(feed_setup["acceptDataFormat"], "COMPACT")
+            self.assertEqual(feed_setup["acceptEventFields"], EVENT_FIELDS)
+            self.assertEqual(feed_setup["acceptAggregationPeriod"], 0.5)
+        with self.subTest("Feed ready once for several FEED_CONFIG messages"):
+            self.assertEqual(self.ready, [client])
+
+    async def test_unauthorized_token(self):
+        await self.run_client(token="expired")
+        await asyncio.sleep(0.2)
+
+        self.assertNotIn("CHANNEL_REQUEST", [message["type"] for message in self.server.received])
+        self.assertEqual(self.ready, [])
+
+    async def test_confirmed_event_fields(self):
+        client = await self.run_client()
+        await asyncio.wait_for(self.queue.get(), 5)
+
+        for event_type in EVENT_FIELDS:
+            with self.subTest(event_type):
+                self.assertNotEqual(self.server.confirmed_fields[event_type], EVENT_FIELDS[event_type])
+                self.assertEqual(client.fields_for(event_type), self.server.confirmed_fields[event_type])
+        self.assertEqual(client.feed_config["aggregationPeriod"], 0.5)
+        self.assertEqual(client.fields_for("Trade"), [])
+
+    async def test_compact_rows(self):
+        client = await self.run_client()
+        quotes = await asyncio.wait_for(self.queue.get(), 5)
+        greeks = await asyncio.wait_for(self.queue.get(), 5)
+
+        rows = client.rows(quotes) + client.rows(greeks)
+
+        self.assertEqual([(event_type, row[0]) for event_type, row in rows],
+                         [("Quote", "SPY"), ("Quote", "AAPL"), ("Greeks", ".SPY230616C400")])
+        for event_type, row in rows:
+            with self.subTest(row[0]):
+                fields = client.fields_for(event_type)[1:]
+                self.assertEqual(len(row), len(fields))
+                self.assertEqual(dict(zip(fields, row))["eventTime"], f"{row[0]}.eventTime")
+                self.assertEqual(row[-1], f"{row[0]}.{fields[-1]}")
+
+
+if __name__ == '__main__':
+    unittest.main()
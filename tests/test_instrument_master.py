@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import os
+import tempfile
+import unittest
+import requests_mock
+
+from tastytrade_api.market_data.instrument_master import InstrumentMaster
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+
+API_URL = "https://api.tastytrade.com"
+
+CHAIN = [{
+    "underlying-symbol": "SPY",
+    "root-symbol": "SPY",
+    "shares-per-contract": 100,
+    "expirations": [
+        {"expiration-date": "2099-06-16", "strikes": [
+            {"strike-price": "400.0", "call": "SPY   990616C00400000", "call-streamer-symbol": ".SPY990616C400",
+             "put": "SPY   990616P00400000", "put-streamer-symbol": ".SPY990616P400"},
+            {"strike-price": "410.0", "call": "SPY   990616C00410000", "call-streamer-symbol": ".SPY990616C410",
+             "put": "SPY   990616P00410000", "put-streamer-symbol": ".SPY990616P410"},
+        ]},
+        {"expiration-date": "2000-06-16", "strikes": [
+            {"strike-price": "100.0", "call": "SPY   000616C00100000", "call-streamer-symbol": ".SPY000616C100"},
+        ]},
+    ],
+}]
+
+
+class TestInstrumentMaster(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "instruments.db")
+        self.master = InstrumentMaster(self.path, TastytradeInstruments("token", API_URL))
+
+    def tearDown(self):
+        self.master.close()
+        self.directory.cleanup()
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_refresh_and_lookups(self, mock):
+        mock.get(f"{API_URL}/option-chains/SPY/nested", json={"data": {"items": CHAIN}})
+        equities = mock.get(f"{API_URL}/instruments/equities/", json={"data": {"items": [
+            {"symbol": "SPY", "instrument-type": "Equity", "streamer-symbol": "SPY"}]}})
+
+        self.assertEqual(self.master.refresh(underlyings=["SPY"]), {"option-chain:SPY": 6})
+        self.assertEqual(equities.last_request.qs, {"symbol": ["SPY"]})
+        with self.subTest("Check daily refresh skipped"):
+            self.assertEqual(self.master.refresh(underlyings=["SPY"]), {})
+            self.assertEqual(mock.call_count, 2)
+
+        with self.subTest("Check expired removed"):
+            self.assertIsNone(self.master.get("SPY   000616C00100000"))
+            self.assertEqual(self.master.expirations("SPY"), ["2099-06-16"])
+        with self.subTest("Check lookups"):
+            self.assertEqual(self.master.get("SPY")["instrument-type"], "Equity")
+            self.assertEqual(self.master.by_streamer_symbol(".SPY990616P410")["symbol"], "SPY   990616P00410000")
+            self.assertEqual(self.master.multiplier("SPY   990616C00400000"), 100)
+            calls = self.master.options("SPY", expiration_date="2099-06-16", option_type="Call", min_strike=405)
+            self.assertEqual([option["symbol"] for option in calls], ["SPY   990616C00410000"])
+        with self.subTest("Check another connection reads the file"):
+            reader = InstrumentMaster(self.path)
+            self.assertEqual(len(reader.options("SPY")), 4)
+            reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
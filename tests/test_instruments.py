@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+
+API_URL = "https://api.tastytrade.com"
+
+PRODUCTS = [
+    {"exchange": "CME", "root-symbol": "EW4", "code": "EW4"},
+    {"exchange": "CME", "root-symbol": "ES", "code": "ES"},
+    {"exchange": "CBOED", "root-symbol": "ES", "code": "ES"},
+]
+
+
+class TestFutureOptions(unittest.TestCase):
+
+    def setUp(self):
+        self.instruments = TastytradeInstruments("token", API_URL)
+
+    @requests_mock.Mocker()
+    def test_future_option_product_index(self, mock):
+        mock.get(f"{API_URL}/instruments/future-option-products", json={"data": {"items": PRODUCTS}})
+
+        index = self.instruments.get_future_option_product_index()
+        self.instruments.get_future_option_product_index()
+
+        self.assertEqual(index[("CBOED", "ES")], PRODUCTS[2])
+        self.assertEqual(self.instruments.get_future_option_product("CME", "EW4"), PRODUCTS[0])
+        self.assertEqual(mock.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_future_option_product_single(self, mock):
+        mock.get(f"{API_URL}/instruments/future-option-products/CME/EW4", json={"data": PRODUCTS[0]})
+
+        self.assertEqual(self.instruments.get_future_option_product("CME", "EW4"), PRODUCTS[0])
+        self.assertEqual(self.instruments.get_future_option_product("CME", "EW4"), PRODUCTS[0])
+        self.assertEqual(mock.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_future_option_product_expires(self, mock):
+        mock.get(f"{API_URL}/instruments/future-option-products", json={"data": {"items": PRODUCTS}})
+        mock.get(f"{API_URL}/instruments/future-option-products/CME/EW4", json={"data": PRODUCTS[0]})
+        self.instruments.get_future_option_product_index()
+        self.instruments.FUTURE_OPTION_PRODUCTS_TTL = -1
+
+        self.assertEqual(self.instruments.get_future_option_product("CME", "EW4"), PRODUCTS[0])
+        self.assertEqual(self.instruments.get_future_option_product("CME", "EW4"), PRODUCTS[0])
+
+        self.assertEqual([request.path for request in mock.request_history],
+                         ["/instruments/future-option-products"] + ["/instruments/future-option-products/cme/ew4"] * 2)
+
+    @requests_mock.Mocker()
+    def test_get_future_options_batches(self, mock):
+        def future_options(request, context):
+            return {"data": {"items": [{"symbol": symbol} for symbol in request.qs["symbol[]"]]}}
+
+        mock.get(f"{API_URL}/instruments/future-options", json=future_options)
+        symbols = [f"./ESZ3 EW4U3 230922C{strike}" for strike in range(4500, 4550, 5)]
+
+        future_options = self.instruments.get_future_options(symbols, batch_size=4)
+
+        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(len(future_options), 10)
+
+    @requests_mock.Mocker()
+    def test_get_future_option_by_symbol(self, mock):
+        mock.get(f"{API_URL}/instruments/future-options/.%2FESZ3%20EW4U3%20230922C4500",
+                 json={"data": {"symbol": "./ESZ3 EW4U3 230922C4500"}})
+
+        self.assertEqual(self.instruments.get_future_options("./ESZ3 EW4U3 230922C4500"),
+                         [{"symbol": "./ESZ3 EW4U3 230922C4500"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import unittest
+
+from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+from tastytrade_api.streamer.latency import LatencyHistogram, LatencyQueue, LatencyRecorder, event_type_of
+from tests.cometd_server import CometdStandInServer, synthetic_symbols
+
+QUOTE = [["Quote", ["eventSymbol", "eventTime"]], ["SPY", 0]]
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().summary(), {"count": 0, "mean": 0, "p50": 0, "p99": 0, "max": 0})
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for micros in range(1, 101):
+            histogram.record(micros)
+
+        summary = histogram.summary()
+        self.assertEqual((summary["count"], summary["mean"], summary["max"]), (100, 50.5, 100))
+        with self.subTest("Within the relative error"):
+            for percent in (25, 50, 75, 90):
+                self.assertGreaterEqual(histogram.percentile(percent), percent)
+                self.assertLessEqual(histogram.percentile(percent), percent * 1.125)
+        with self.subTest("Capped at the maximum"):
+            self.assertEqual(summary["p99"], 100)
+            self.assertEqual(histogram.percentile(100), 100)
+
+    def test_linear_buckets_exact(self):
+        histogram = LatencyHistogram()
+        for micros in range(16):
+            histogram.record(micros)
+        histogram.record(-5)
+
+        self.assertEqual(histogram.percentile(50), 7)
+        self.assertEqual(histogram.counts[0], 2)
+
+    def test_overflow_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.record(10)
+        histogram.record(2 ** 60)
+        histogram.record(2 ** 62)
+
+        self.assertEqual(histogram.counts[-1], 2)
+        self.assertEqual(histogram.percentile(50), 2 ** 62)
+        self.assertEqual(histogram.percentile(1), 10)
+
+
+class TestLatencyRecorder(unittest.TestCase):
+
+    def test_snapshot_by_event_type_and_stage(self):
+        recorder = LatencyRecorder()
+        recorder.record("Quote", "decode", 5)
+        recorder.record("Quote", "decode", 7)
+        recorder.record("Order", "dispatch", 100)
+        recorder.record_event_time("Quote", 0, 10 ** 18)
+
+        snapshot = recorder.snapshot()
+        self.assertEqual(set(snapshot), {"Quote", "Order"})
+        self.assertEqual(snapshot["Quote"]["decode"]["count"], 2)
+        self.assertNotIn("exchange", snapshot["Quote"])
+        recorder.reset()
+        self.assertEqual(recorder.snapshot(), {})
+
+    def test_event_type_of(self):
+        self.assertEqual(event_type_of(QUOTE), "Quote")
+        self.assertEqual(event_type_of(["Trade", ["SPY", 0]]), "Trade")
+        self.assertEqual(event_type_of([]), "unknown")
+
+
+class TestLatencyQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_records_queue_wait(self):
+        recorder = LatencyRecorder()
+        queue = LatencyQueue(recorder)
+        await queue.put(QUOTE)
+        await queue.put(["Quote", ["SPY", 0]])
+        await queue.put(None)
+        await asyncio.sleep(0.01)
+
+        items = [await queue.get() for _ in range(3)]
+
+        self.assertEqual(items, [QUOTE, ["Quote", ["SPY", 0]], None])
+        queued = recorder.snapshot()["Quote"]["queue"]
+        self.assertEqual(queued["count"], 2)
+        self.assertGreaterEqual(queued["p50"], 10000)
+
+    async def test_disabled(self):
+        recorder = LatencyRecorder(enabled=False)
+        queue = LatencyQueue(recorder)
+        queue.put_nowait(QUOTE)
+
+        self.assertEqual(queue.get_nowait(), QUOTE)
+        self.assertEqual(recorder.snapshot(), {})
+
+
+class TestClientInstrumentation(unittest.IsolatedAsyncioTestCase):
+
+    async def test_cometd_stages(self):
+        recorder = LatencyRecorder()
+        queue = LatencyQueue(recorder)
+
+        async def subscribe(client):
+            for symbol in synthetic_symbols(3):
+                await client.send_subscription_message(client.websocket, "Quote", symbol)
+
+        async with CometdStandInServer(rate=500, batch_size=3) as server:
+            client = CometdWebsocketClient(server.url, "token", queue, subscribe, latency=recorder)
+            connect_task = asyncio.create_task(client.connect())
+            for _ in range(20):
+                await asyncio.wait_for(queue.get(), 5)
+            connect_task.cancel()
+            await asyncio.gather(connect_task, return_exceptions=True)
+
+        stages = recorder.snapshot()["Quote"]
+        self.assertEqual(set(stages), {"decode", "enqueue", "exchange", "queue"})
+        self.assertGreaterEqual(stages["decode"]["count"], 20)
+        self.assertEqual(stages["enqueue"]["count"], stages["decode"]["count"])
+        self.assertEqual(stages["exchange"]["count"], 3 * stages["decode"]["count"])
+        self.assertEqual(stages["queue"]["count"], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
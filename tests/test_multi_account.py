@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.account.account_handler import TastytradeAccount
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.account.multi_account import MultiAccountClient
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNTS = ["5WT00001", "5WT00002", "5WT00003"]
+
+
+class TestMultiAccountClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MultiAccountClient(
+            TastytradeAccount("token", API_URL), TastytradeAccountPositions("token", API_URL), max_workers=4
+        )
+
+    @requests_mock.Mocker()
+    def test_fetch_all(self, mock):
+        accounts = [{"account": {"account-number": account_number}} for account_number in ACCOUNTS]
+        mock.get(f"{API_URL}/customers/me/accounts", json={"data": {"items": accounts}})
+        for account_number in ACCOUNTS:
+            mock.get(f"{API_URL}/accounts/{account_number}/balances",
+                     json={"data": {"account-number": account_number, "net-liquidating-value": "100.0"}})
+            mock.get(f"{API_URL}/accounts/{account_number}/positions",
+                     json={"data": {"items": [{"symbol": "SPY", "account-number": account_number}]}})
+            mock.get(f"{API_URL}/margin/accounts/{account_number}/requirements",
+                     json={"data": {"account-number": account_number}})
+            mock.get(f"{API_URL}/accounts/{account_number}/position-limit",
+                     json={"data": {"positionLimit": {"account-number": account_number}}})
+        mock.get(f"{API_URL}/accounts/5WT00002/positions", status_code=500)
+
+        snapshots = self.client.fetch_all()
+
+        with self.subTest("Check all accounts fetched in order"):
+            self.assertEqual(list(snapshots), ACCOUNTS)
+            self.assertEqual(snapshots["5WT00003"].balances["account-number"], "5WT00003")
+            self.assertEqual(snapshots["5WT00001"].positions[0]["symbol"], "SPY")
+            self.assertEqual(snapshots["5WT00001"].position_limit["account-number"], "5WT00001")
+        with self.subTest("Check errors isolated"):
+            self.assertEqual(list(snapshots["5WT00002"].errors), ["positions"])
+            self.assertIsNone(snapshots["5WT00002"].positions)
+            self.assertIsNotNone(snapshots["5WT00002"].balances)
+            self.assertTrue(snapshots["5WT00001"].ok)
+
+    def test_unknown_endpoint(self):
+        with self.assertRaises(ValueError):
+            self.client.fetch_all(ACCOUNTS, endpoints=("orders",))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+import requests_mock
+
+from tastytrade_api.account.account_handler import TastytradeAccount
+from tastytrade_api.account.net_liq_history import NetLiqHistoryStore
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+HISTORY_URL = f"{API_URL}/accounts/{ACCOUNT}/net-liq/history"
+
+
+def make_item(minute, close):
+    value = str(close)
+    return {"time": f"2023-06-01T{14 + minute // 60:02d}:{minute % 60:02d}:00.000Z", "open": value, "high": value,
+            "low": value, "close": value, "total-open": value, "total-high": value, "total-low": value,
+            "total-close": value}
+
+
+class TestNetLiqHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.account_client = TastytradeAccount("token", API_URL)
+        self.store = NetLiqHistoryStore(self.account_client, self.directory.name, initial_time_back="1d")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @requests_mock.Mocker()
+    def test_incremental_update(self, mock):
+        mock.get(HISTORY_URL, json={"data": {"items": [make_item(minute, 100 + minute) for minute in range(0, 60, 5)]}})
+        self.assertEqual(self.store.update(ACCOUNT), 12)
+        self.assertEqual(mock.last_request.qs["time-back"], ["1d"])
+
+        tail = [make_item(55, 200), make_item(60, 201), make_item(65, 202)]
+        mock.get(HISTORY_URL, json={"data": {"items": tail}})
+        self.assertEqual(self.store.update(ACCOUNT), 3)
+
+        with self.subTest("Check tail request"):
+            self.assertEqual(mock.last_request.qs["start-time"], ["2023-06-01t14:55:00z"])
+        with self.subTest("Check reload from disk"):
+            points = NetLiqHistoryStore(self.account_client, self.directory.name).query(ACCOUNT)
+            self.assertEqual(len(points), 14)
+            self.assertEqual([point["close"] for point in points[-3:]], [200.0, 201.0, 202.0])
+        with self.subTest("Check range query"):
+            start = datetime(2023, 6, 1, 14, 10, tzinfo=timezone.utc)
+            points = self.store.query(ACCOUNT, start=start, end="2023-06-01T14:20:00Z")
+            self.assertEqual([point["close"] for point in points], [110.0, 115.0])
+
+    @requests_mock.Mocker()
+    def test_downsample(self, mock):
+        mock.get(HISTORY_URL, json={"data": {"items": [make_item(minute, 100 + minute) for minute in range(0, 120, 5)]}})
+        self.store.update(ACCOUNT)
+
+        buckets = self.store.query(ACCOUNT, interval="1h")
+
+        self.assertEqual([bucket["time"].hour for bucket in buckets], [14, 15])
+        self.assertEqual([(bucket["open"], bucket["high"], bucket["low"], bucket["close"]) for bucket in buckets],
+                         [(100.0, 155.0, 100.0, 155.0), (160.0, 215.0, 160.0, 215.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
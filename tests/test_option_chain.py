@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+from datetime import date
+
+from tastytrade_api.market_data import option_chain
+from tastytrade_api.market_data.option_chain import CALL, PUT, OptionChain
+
+
+def make_strikes(expiration_code, strikes):
+    return [{
+        "strike-price": f"{strike}.0",
+        "call": f"SPY   {expiration_code}C00{strike}000",
+        "call-streamer-symbol": f".SPY{expiration_code}C{strike}",
+        "put": f"SPY   {expiration_code}P00{strike}000",
+        "put-streamer-symbol": f".SPY{expiration_code}P{strike}",
+    } for strike in strikes]
+
+
+CHAIN = {
+    "underlying-symbol": "SPY",
+    "root-symbol": "SPY",
+    "shares-per-contract": 100,
+    "expirations": [
+        {"expiration-date": "2023-07-21", "strikes": make_strikes("230721", [410, 390, 400])},
+        {"expiration-date": "2023-06-16", "strikes": make_strikes("230616", [395, 400, 405, 410])},
+        {"expiration-date": "2023-06-30", "strikes": make_strikes("230630", [400])},
+    ],
+}
+TODAY = date(2023, 6, 1)
+
+
+@unittest.skipIf(option_chain.np is None, "numpy is not installed")
+class TestOptionChain(unittest.TestCase):
+
+    def setUp(self):
+        self.chain = OptionChain(CHAIN)
+
+    def test_sorted_columns(self):
+        self.assertEqual([str(expiration) for expiration in self.chain.expirations],
+                         ["2023-06-16", "2023-06-30", "2023-07-21"])
+        self.assertEqual(self.chain.strikes_for("2023-07-21").tolist(), [390.0, 400.0, 410.0])
+        self.assertEqual(self.chain.call_symbols[0], "SPY   230616C00395000")
+
+    def test_queries(self):
+        with self.subTest("Check nearest strike"):
+            row = self.chain.nearest_strike("2023-06-16", 402.4)
+            self.assertEqual(self.chain.strikes[row], 400.0)
+            self.assertEqual(self.chain.strikes[self.chain.nearest_strike("2023-06-16", 500)], 410.0)
+        with self.subTest("Check strike range"):
+            rows = self.chain.strike_range("2023-06-16", 400, 405)
+            self.assertEqual(self.chain.put_streamer_symbols[rows].tolist(), [".SPY230616P400", ".SPY230616P405"])
+        with self.subTest("Check target DTE"):
+            self.assertEqual(str(self.chain.expiration_for_dte(10, TODAY)), "2023-06-16")
+            self.assertEqual(str(self.chain.expiration_for_dte(22, TODAY)), "2023-06-30")
+            self.assertEqual(str(self.chain.expiration_for_dte(45, TODAY)), "2023-07-21")
+        with self.subTest("Check vectorized filter"):
+            rows = self.chain.filter(min_dte=20, max_strike=400, today=TODAY)
+            self.assertEqual(self.chain.strikes[rows].tolist(), [400.0, 390.0, 400.0])
+        with self.subTest("Check unknown expiration"):
+            with self.assertRaises(KeyError):
+                self.chain.strikes_for("2023-06-23")
+
+    def test_locate(self):
+        deltas = self.chain.new_column()
+        rows, sides = self.chain.locate([".SPY230630C400", "SPY   230616P00410000", ".UNKNOWN"])
+        known = rows >= 0
+        deltas[rows[known], sides[known]] = [0.5, -0.7]
+
+        self.assertEqual(known.tolist(), [True, True, False])
+        self.assertEqual(deltas[4, CALL], 0.5)
+        self.assertEqual(deltas[3, PUT], -0.7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json
+import unittest
+import requests_mock
+
+from tastytrade_api.trading.order import TastytradeOrder
+from tastytrade_api.trading.order_template import OrderTemplate
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+
+
+class TestTastytradeOrderBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TastytradeOrder("token", API_URL, max_workers=4)
+
+    @requests_mock.Mocker()
+    def test_create_orders_partial_failure(self, mock):
+        def create(request, context):
+            order = request.json()
+            if order["price"] == "bad":
+                context.status_code = 422
+                return {"error": {"code": "invalid_price"}}
+            context.status_code = 201
+            return {"data": {"order": {"id": int(order["price"])}}}
+
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", json=create)
+
+        results = self.client.create_orders(ACCOUNT, [{"price": str(i)} for i in range(5)] + [{"price": "bad"}])
+
+        with self.subTest("Check input order"):
+            self.assertEqual([result.index for result in results], list(range(6)))
+            self.assertEqual([result.response["data"]["order"]["id"] for result in results[:5]], list(range(5)))
+        with self.subTest("Check failure reported"):
+            self.assertFalse(results[5].ok)
+            self.assertIn("422", str(results[5].error))
+
+    @requests_mock.Mocker()
+    def test_cancel_all_orders_filters(self, mock):
+        live_orders = [
+            {"id": 1, "status": "Live", "underlying-symbol": "SPY", "cancellable": True},
+            {"id": 2, "status": "Received", "underlying-symbol": "SPY", "cancellable": True},
+            {"id": 3, "status": "Live", "underlying-symbol": "QQQ", "cancellable": True},
+            {"id": 4, "status": "Live", "underlying-symbol": "SPY", "cancellable": False},
+        ]
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/orders/live", json={"data": {"items": live_orders}})
+        for order in live_orders:
+            mock.delete(f"{API_URL}/accounts/{ACCOUNT}/orders/{order['id']}", json={"data": {"id": order["id"]}})
+
+        results = self.client.cancel_all_orders(ACCOUNT, underlying_symbol="SPY", status="Live")
+
+        self.assertEqual([result.request for result in results], [1])
+        self.assertTrue(results[0].ok)
+
+
+class TestOrderTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.order = {
+            "order-type": "Limit",
+            "time-in-force": "Day",
+            "price": "1.00",
+            "price-effect": "Debit",
+            "legs": [
+                {"instrument-type": "Equity Option", "symbol": "SPY   230616C00400000", "quantity": 1, "action": "Buy to Open"},
+                {"instrument-type": "Equity Option", "symbol": "SPY   230616C00410000", "quantity": 2, "action": "Sell to Open"},
+            ],
+        }
+        self.template = OrderTemplate(self.order)
+
+    def test_render(self):
+        body = json.loads(self.template.render(price="1.25", quantity=3))
+
+        expected = dict(self.order, price="1.25")
+        expected["legs"] = [dict(self.order["legs"][0], quantity=3), dict(self.order["legs"][1], quantity=6)]
+        self.assertEqual(body, expected)
+
+    def test_render_symbols(self):
+        body = json.loads(self.template.render(price=2, symbols=["QQQ   230616C00300000", "QQQ   230616C00310000"]))
+
+        self.assertEqual([leg["symbol"] for leg in body["legs"]], ["QQQ   230616C00300000", "QQQ   230616C00310000"])
+        self.assertEqual(body["price"], "2")
+
+    def test_invalid_template(self):
+        with self.assertRaises(ValueError):
+            OrderTemplate(dict(self.order, legs=[]))
+
+    @requests_mock.Mocker()
+    def test_create_order_from_template(self, mock):
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", status_code=201, json={"data": {"order": {"id": 7}}})
+        client = TastytradeOrder("token", API_URL)
+
+        response = client.create_order_from_template(ACCOUNT, self.template, price="1.05")
+
+        self.assertEqual(response["data"]["order"]["id"], 7)
+        self.assertEqual(mock.last_request.json()["price"], "1.05")
+        self.assertEqual(mock.last_request.headers["Content-Type"], "application/json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.trading.order import TastytradeOrder
+from tastytrade_api.trading.order_history import OrderHistoryStore, OrderHistorySync
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+
+
+def make_order(order_id, status, underlying_symbol, updated_at):
+    return {
+        "id": order_id,
+        "account-number": ACCOUNT,
+        "status": status,
+        "underlying-symbol": underlying_symbol,
+        "received-at": f"2023-06-0{order_id}T14:00:00.000+00:00",
+        "updated-at": updated_at,
+    }
+
+
+class TestOrderHistorySync(unittest.TestCase):
+
+    def setUp(self):
+        self.store = OrderHistoryStore()
+        self.sync = OrderHistorySync(TastytradeOrder("token", API_URL), self.store, per_page=2)
+
+    def tearDown(self):
+        self.store.close()
+
+    @requests_mock.Mocker()
+    def test_incremental_sync(self, mock):
+        first_pages = [
+            [make_order(1, "Filled", "SPY", "2023-06-01T14:00:01.000+00:00"),
+             make_order(2, "Live", "QQQ", "2023-06-02T14:00:01.000+00:00")],
+            [make_order(3, "Cancelled", "SPY", "2023-06-03T14:00:01.000+00:00")],
+        ]
+
+        def first_sync(request, context):
+            page = int(request.qs["page-offset"][0])
+            return {"data": {"items": first_pages[page]}, "pagination": {"total-pages": 2}}
+
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/orders", json=first_sync)
+
+        with self.subTest("Check full sync"):
+            self.assertEqual(self.sync.sync(ACCOUNT), 3)
+            self.assertNotIn("start-at", mock.last_request.qs)
+            self.assertEqual(mock.last_request.qs["sort"], ["asc"])
+            self.assertEqual(self.store.high_water_mark(ACCOUNT), "2023-06-03T14:00:01.000+00:00")
+
+        changed = [make_order(2, "Filled", "QQQ", "2023-06-04T09:00:00.000+00:00")]
+        mock.get(f"{API_URL}/accounts/{ACCOUNT}/orders",
+                 json={"data": {"items": changed}, "pagination": {"total-pages": 1}})
+
+        with self.subTest("Check incremental sync starts at the oldest open order"):
+            self.assertEqual(self.sync.sync(ACCOUNT), 1)
+            self.assertEqual(mock.last_request.qs["start-at"], ["2023-06-02t14:00:00.000+00:00"])
+            self.assertEqual(self.store.high_water_mark(ACCOUNT), "2023-06-04T09:00:00.000+00:00")
+
+        with self.subTest("Check queries"):
+            self.assertEqual([order["id"] for order in self.store.query(ACCOUNT, underlying_symbol="SPY")], [3, 1])
+            self.assertEqual([order["id"] for order in self.store.query(ACCOUNT, status="Filled")], [2, 1])
+            self.assertEqual([order["id"] for order in self.store.query(ACCOUNT, start_at="2023-06-02")], [3, 2])
+            self.assertIsNone(self.store.earliest_open_order(ACCOUNT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests
+import requests_mock
+
+from tastytrade_api.streamer.account_events import decode_message
+from tastytrade_api.trading.order import TastytradeOrder
+from tastytrade_api.trading.order_tracing import OrderTracer
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+
+
+def order_event(order_id, status):
+    return decode_message({"type": "Order", "data": {"id": order_id, "status": status}})
+
+
+class TestOrderTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.traces = []
+        self.tracer = OrderTracer(trace_log=self.traces.append)
+        self.client = TastytradeOrder("token", API_URL, tracer=self.tracer)
+
+    @requests_mock.Mocker()
+    def test_create_until_filled(self, mock):
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", status_code=201,
+                  json={"data": {"order": {"id": 7, "status": "Received"}}})
+
+        self.client.create_order(ACCOUNT, {"price": "1.0"})
+        self.tracer.on_event(order_event(7, "Live"))
+        self.tracer.on_event(order_event(7, "Filled"))
+
+        self.assertEqual(len(self.traces), 1)
+        self.assertEqual(self.traces[0]["operation"], "create")
+        self.assertEqual(self.traces[0]["first-event-status"], "Live")
+        self.assertEqual(self.traces[0]["status"], "Filled")
+        self.assertEqual(set(self.tracer.snapshot()["create"]), {"ack", "first_event", "terminal", "fill"})
+        self.assertEqual(self.tracer.pending, {})
+
+    @requests_mock.Mocker()
+    def test_event_before_response(self, mock):
+        def create(request, context):
+            # The streamer reports the order before the HTTP response arrives
+            self.tracer.on_event(order_event(8, "Rejected"))
+            context.status_code = 201
+            return {"data": {"order": {"id": 8, "status": "Received"}}}
+
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", json=create)
+
+        self.client.create_order(ACCOUNT, {"price": "1.0"})
+
+        self.assertEqual([trace["status"] for trace in self.traces], ["Rejected"])
+        self.assertEqual(self.tracer.pending, {})
+
+    @requests_mock.Mocker()
+    def test_cancel_keeps_create_trace(self, mock):
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", status_code=201,
+                  json={"data": {"order": {"id": 9, "status": "Received"}}})
+        mock.delete(f"{API_URL}/accounts/{ACCOUNT}/orders/9", status_code=200,
+                    json={"data": {"id": 9, "status": "Cancel Requested"}})
+
+        self.client.create_order(ACCOUNT, {"price": "1.0"})
+        self.tracer.on_event(order_event(9, "Live"))
+        self.client.cancel_order(ACCOUNT, 9)
+        self.tracer.on_event(order_event(9, "Cancelled"))
+
+        traces = {trace["operation"]: trace for trace in self.traces}
+        self.assertEqual(set(traces), {"create", "cancel"})
+        self.assertEqual(traces["create"]["first-event-status"], "Live")
+        self.assertEqual(traces["cancel"]["first-event-status"], "Cancelled")
+        self.assertEqual({trace["status"] for trace in self.traces}, {"Cancelled"})
+        self.assertEqual(self.tracer.pending, {})
+
+    @requests_mock.Mocker()
+    def test_failed_request(self, mock):
+        mock.put(f"{API_URL}/accounts/{ACCOUNT}/orders/10", status_code=422, json={})
+
+        with self.assertRaises(Exception):
+            self.client.replace_order(ACCOUNT, 10, {"price": "1.0"})
+
+        self.assertEqual([(trace["operation"], trace["error"]) for trace in self.traces], [("replace", "422")])
+        self.assertEqual(self.tracer.snapshot()["replace"]["ack"]["count"], 1)
+
+    @requests_mock.Mocker()
+    def test_connection_error(self, mock):
+        mock.post(f"{API_URL}/accounts/{ACCOUNT}/orders", exc=requests.exceptions.ConnectTimeout("timed out"))
+
+        with self.assertRaises(requests.exceptions.ConnectTimeout):
+            self.client.create_order(ACCOUNT, {"price": "1.0"})
+
+        self.assertEqual([(trace["operation"], trace["error"]) for trace in self.traces], [("create", "timed out")])
+        self.assertEqual(self.tracer.pending, {})
+
+    def test_untraced_events_expire(self):
+        tracer = OrderTracer(max_event_age=0)
+
+        for order_id in range(100):
+            tracer.on_event(order_event(order_id, "Live"))
+
+        self.assertLessEqual(len(tracer.early_events), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.trading.order import TastytradeOrder
+from tastytrade_api.trading.order_validation import OrderValidator
+
+API_URL = "https://api.tastytrade.com"
+ACCOUNT = "5WT00001"
+ORDERS_URL = f"{API_URL}/accounts/{ACCOUNT}/orders"
+DRY_RUN_URL = f"{API_URL}/accounts/{ACCOUNT}/orders/dry-run"
+
+PRECISIONS = {"items": [{"instrument-type": "Equity", "value": 0}, {"instrument-type": "Equity Option", "value": 0}]}
+OPTION_TICKS = [{"value": "0.01", "threshold": "3"}, {"value": "0.05"}]
+
+
+def option_order(price, price_effect="Debit", quantity=1):
+    return {"order-type": "Limit", "time-in-force": "Day", "price": price, "price-effect": price_effect,
+            "legs": [{"instrument-type": "Equity Option", "symbol": "SPY   230616C00400000", "quantity": quantity,
+                      "action": "Buy to Open"}]}
+
+
+def equity_order(price, price_effect="Debit", quantity=100):
+    return {"order-type": "Limit", "time-in-force": "Day", "price": price, "price-effect": price_effect,
+            "legs": [{"instrument-type": "Equity", "symbol": "SPY", "quantity": quantity, "action": "Buy to Open"}]}
+
+
+class TestOrderValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.addCleanup(self.mock.stop)
+        self.mock.get(f"{API_URL}/instruments/quantity-decimal-precisions", json={"data": PRECISIONS})
+        self.mock.get(f"{API_URL}/option-chains/SPY/nested", json={"data": {"items": [{"tick-sizes": OPTION_TICKS}]}})
+        self.mock.get(f"{API_URL}/instruments/equities/", json={"data": {"items": [{"tick-sizes": [{"value": "0.01"}]}]}})
+        self.mock.get(f"{API_URL}/accounts/{ACCOUNT}/balances",
+                      json={"data": {"equity-buying-power": "10000.0", "derivative-buying-power": "5000.0"}})
+        self.validator = OrderValidator(ACCOUNT, TastytradeInstruments("token", API_URL),
+                                        TastytradeAccountPositions("token", API_URL), margin_of_safety=0.1)
+
+    def test_price_rounding_by_price_effect(self):
+        debit = self.validator.validate(option_order("3.57", "Debit"))
+        credit = self.validator.validate(option_order("3.57", "Credit"))
+
+        self.assertTrue(debit.ok and credit.ok)
+        self.assertEqual(debit.order["price"], "3.55")
+        self.assertEqual(credit.order["price"], "3.60")
+        self.assertEqual(len(debit.adjustments), 1)
+
+    def test_tick_size_threshold(self):
+        self.assertEqual(str(self.validator.tick_size("Equity Option", None, "SPY", 2.99)), "0.01")
+        self.assertEqual(str(self.validator.tick_size("Equity Option", None, "SPY", 3)), "0.05")
+
+        with self.subTest("Below the threshold"):
+            self.assertTrue(self.validator.validate(option_order("2.99"), allow_rounding=False).ok)
+        with self.subTest("At the threshold"):
+            self.assertTrue(self.validator.validate(option_order("3.00"), allow_rounding=False).ok)
+        with self.subTest("Above the threshold"):
+            self.assertFalse(self.validator.validate(option_order("3.01"), allow_rounding=False).ok)
+
+    def test_tick_size_misses_cached(self):
+        self.mock.get(f"{API_URL}/option-chains/QQQ/nested", json={"data": {"items": [{}]}})
+        self.mock.get(f"{API_URL}/option-chains/IWM/nested", status_code=500)
+        order = option_order("1.234")
+
+        for underlying in ("QQQ", "IWM"):
+            with self.subTest(underlying):
+                order["legs"][0]["symbol"] = f"{underlying:<6}230616C00400000"
+                for _ in range(3):
+                    self.assertTrue(self.validator.validate(order, allow_rounding=False).ok)
+                chain_requests = [request for request in self.mock.request_history if underlying in request.url]
+                self.assertEqual(len(chain_requests), 1)
+
+        with self.subTest("Retried after tick_size_retry"):
+            self.validator.tick_size_retry = 0
+            self.validator.validate(order)
+            self.assertEqual(sum("IWM" in request.url for request in self.mock.request_history), 2)
+
+    def test_reject_or_round(self):
+        order = equity_order("50.005", quantity="10.5")
+
+        rounded = self.validator.validate(order)
+        rejected = self.validator.validate(order, allow_rounding=False)
+
+        with self.subTest("Round mode"):
+            self.assertTrue(rounded.ok)
+            self.assertEqual(rounded.order["legs"][0]["quantity"], 10)
+            self.assertEqual(rounded.order["price"], "50.00")
+            self.assertEqual(len(rounded.adjustments), 2)
+        with self.subTest("Reject mode"):
+            self.assertFalse(rejected.ok)
+            self.assertIn("decimals", rejected.errors[0])
+            self.assertEqual(rejected.adjustments, [])
+        with self.subTest("Input not modified"):
+            self.assertEqual(order["legs"][0]["quantity"], "10.5")
+            self.assertEqual(order["price"], "50.005")
+
+    def test_needs_dry_run_boundaries(self):
+        # Buying power 10000 with a 10% margin of safety: costs above 9000 need a dry run, above 10000 fail
+        at_margin = self.validator.validate(equity_order("90.00"))
+        inside_margin = self.validator.validate(equity_order("90.01"))
+        at_buying_power = self.validator.validate(equity_order("100.00"))
+        above_buying_power = self.validator.validate(equity_order("100.01"))
+        credit = self.validator.validate(equity_order("10.00", "Credit"))
+
+        self.assertFalse(at_margin.needs_dry_run)
+        self.assertTrue(inside_margin.needs_dry_run)
+        self.assertTrue(at_buying_power.ok and at_buying_power.needs_dry_run)
+        self.assertFalse(above_buying_power.ok)
+        self.assertTrue(credit.needs_dry_run)
+        with self.subTest("Balances cached"):
+            self.assertEqual(sum("/balances" in request.url for request in self.mock.request_history), 1)
+
+    def test_submit_dry_run_gating(self):
+        order_client = TastytradeOrder("token", API_URL)
+        self.mock.post(ORDERS_URL, status_code=201, json={"data": {"order": {"id": 1}}})
+        self.mock.post(DRY_RUN_URL, status_code=201, json={"data": {"errors": []}})
+
+        def posted():
+            return [request.url for request in self.mock.request_history if request.method == "POST"]
+
+        with self.subTest("Clear of the margin"):
+            self.validator.submit(order_client, equity_order("90.00"))
+            self.assertEqual(posted(), [ORDERS_URL])
+        with self.subTest("Inside the margin"):
+            self.validator.submit(order_client, equity_order("90.01"))
+            self.assertEqual(posted(), [ORDERS_URL, DRY_RUN_URL, ORDERS_URL])
+        with self.subTest("Dry run errors"):
+            self.mock.post(DRY_RUN_URL, status_code=201, json={"data": {"errors": [{"code": "margin_check_failed"}]}})
+            with self.assertRaises(Exception):
+                self.validator.submit(order_client, equity_order("90.01"))
+            self.assertEqual(posted()[-1], DRY_RUN_URL)
+        with self.subTest("Local rejection"):
+            with self.assertRaises(Exception):
+                self.validator.submit(order_client, equity_order("100.01"))
+            self.assertEqual(len(posted()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
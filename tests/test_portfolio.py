@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import queue
+import unittest
+
+from tastytrade_api.account import portfolio
+from tastytrade_api.account.portfolio import PortfolioEngine
+from tastytrade_api.streamer.dxlink_handler import DEFAULT_EVENT_FIELDS, DXLinkWebsocketClient
+
+POSITIONS = [
+    {"symbol": "SPY", "instrument-type": "Equity", "underlying-symbol": "SPY", "quantity": 100,
+     "quantity-direction": "Long", "multiplier": 1, "average-open-price": "400.0", "mark-price": "410.0"},
+    {"symbol": "SPY   230616C00400000", "instrument-type": "Equity Option", "underlying-symbol": "SPY",
+     "quantity": 2, "quantity-direction": "Short", "multiplier": 100, "average-open-price": "5.0",
+     "mark-price": "4.0", "streamer-symbol": ".SPY230616C400", "expires-at": "2023-06-16T20:15:00.000+00:00"},
+    {"symbol": "QQQ   230721P00300000", "instrument-type": "Equity Option", "underlying-symbol": "QQQ",
+     "quantity": 1, "quantity-direction": "Long", "multiplier": 100, "average-open-price": "2.0",
+     "mark-price": "2.5"},
+]
+
+
+@unittest.skipIf(portfolio.np is None, "numpy is not installed")
+class TestPortfolioEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = PortfolioEngine(POSITIONS)
+
+    def test_aggregates(self):
+        by_underlying = self.engine.aggregates("underlying")
+
+        self.assertEqual(by_underlying["SPY"]["delta"], 100.0)
+        self.assertEqual(by_underlying["SPY"]["pnl"], 1000.0 + 200.0)
+        self.assertEqual(by_underlying["QQQ"]["market-value"], 250.0)
+        self.assertEqual(list(self.engine.aggregates("expiry")), [None, "2023-06-16", "2023-07-21"])
+
+    def test_incremental_updates_match_recompute(self):
+        self.engine.update_greeks(["SPY   230616C00400000", "QQQ   230721P00300000"], delta=[0.5, -0.3],
+                                  theta=[-0.05, -0.02])
+        self.engine.update_quotes([".SPY230616C400", "UNKNOWN"], [4.4, 1.0], [4.6, 1.2])
+        self.engine.update_quotes(["QQQ   230721P00300000"], [float("nan")], [2.6])
+        incremental = self.engine.aggregates("underlying")
+
+        with self.subTest("Check values"):
+            self.assertAlmostEqual(incremental["SPY"]["delta"], 100.0 - 100.0)
+            self.assertAlmostEqual(incremental["SPY"]["theta"], 10.0)
+            self.assertAlmostEqual(incremental["SPY"]["pnl"], 1000.0 + 100.0)
+            self.assertAlmostEqual(incremental["QQQ"]["market-value"], 250.0)
+        with self.subTest("Check against recompute"):
+            self.engine.recompute()
+            for underlying, metrics in self.engine.aggregates("underlying").items():
+                for metric, value in metrics.items():
+                    self.assertAlmostEqual(incremental[underlying][metric], value)
+
+    def test_apply_feed_rows(self):
+        greeks = ["Greeks", ".SPY230616C400", 0, 0, 0, 4.5, 0.2, 0.6, 0.01, -0.04, 0.1, 0.3]
+        quote = ["Quote", "SPY", 0, 0, 0, 0, "Q", 419.0, 100, 0, "Q", 421.0, 100]
+
+        client = DXLinkWebsocketClient("wss://localhost", "token", queue.Queue())
+        rows = client.rows(["Greeks", greeks, "Quote", quote])
+
+        updated = self.engine.apply_feed_rows(rows, DEFAULT_EVENT_FIELDS)
+
+        self.assertEqual(updated, 2)
+        totals = self.engine.portfolio_totals()
+        self.assertAlmostEqual(totals["delta"], 100.0 - 120.0)
+        self.assertAlmostEqual(totals["vega"], -60.0)
+        self.assertAlmostEqual(totals["market-value"], 42000.0 - 800.0 + 250.0)
+
+    def test_apply_feed_rows_missing_event_fields(self):
+        greeks = ["Greeks", ".SPY230616C400", 0, 0, 0, 4.5, 0.2, 0.6, 0.01, -0.04, 0.1, 0.3]
+        quote = ["Quote", "SPY", 0, 0, 0, 0, "Q", 419.0, 100, 0, "Q", 421.0, 100]
+        rows = DXLinkWebsocketClient("wss://localhost", "token", queue.Queue()).rows(["Greeks", greeks, "Quote", quote])
+
+        self.assertEqual(self.engine.apply_feed_rows(rows, {}), 0)
+        self.assertEqual(self.engine.apply_feed_rows(rows, {"Greeks": DEFAULT_EVENT_FIELDS["Greeks"]}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
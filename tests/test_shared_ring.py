@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import os
+import subprocess
+import unittest
+
+from tastytrade_api.streamer.shared_ring import RingOverrunError, SharedRingReader, SharedRingWriter
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+# Run in a separate interpreter, with its own resource tracker, like an independent consumer process
+READ_IN_CHILD = """
+import sys
+from tastytrade_api.streamer.shared_ring import SharedRingReader
+reader = SharedRingReader(sys.argv[1], from_start=True)
+print(reader.read_batch())
+reader.close()
+"""
+
+
+class TestSharedRing(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = SharedRingWriter(f"tt-test-ring-{os.getpid()}", slot_count=8, slot_size=128)
+
+    def tearDown(self):
+        self.writer.unlink()
+
+    def test_wraparound(self):
+        reader = SharedRingReader(self.writer.name)
+        received = []
+        for i in range(30):
+            self.writer.publish(["Quote", ["SPY", i]])
+            if i % 3 == 2:
+                received.extend(reader.read_batch())
+        reader.close()
+
+        self.assertEqual([event[1][1] for event in received], list(range(30)))
+
+    def test_overrun(self):
+        reader = SharedRingReader(self.writer.name)
+        strict = SharedRingReader(self.writer.name, raise_on_overrun=True)
+        for i in range(20):
+            self.writer.publish(i)
+
+        with self.subTest("Check skip to oldest"):
+            self.assertEqual(reader.read_batch(), list(range(13, 20)))
+            self.assertEqual(reader.missed, 13)
+        with self.subTest("Check raise"):
+            with self.assertRaises(RingOverrunError):
+                strict.read()
+        reader.close()
+        strict.close()
+
+    def test_oversized_event(self):
+        with self.assertRaises(ValueError):
+            self.writer.publish("x" * 200)
+
+    def test_attach_from_other_processes(self):
+        for i in range(5):
+            self.writer.publish(i)
+        for _ in range(2):
+            output = subprocess.run([sys.executable, "-c", READ_IN_CHILD, self.writer.name], cwd=ROOT,
+                                    capture_output=True, text=True, timeout=30)
+            self.assertEqual(output.returncode, 0, output.stderr)
+            self.assertEqual(output.stdout.strip(), str(list(range(5))))
+
+        # The block survives the reader processes exiting
+        reader = SharedRingReader(self.writer.name, from_start=True)
+        self.assertEqual(reader.read_batch(), list(range(5)))
+        reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pickle
+import threading
+import unittest
+
+from tastytrade_api.symbol import Symbol
+
+
+class TestSymbol(unittest.TestCase):
+
+    def test_interning(self):
+        symbol = Symbol("SPY   230616C00400000")
+
+        self.assertIs(Symbol("SPY   230616C00400000"), symbol)
+        self.assertIs(Symbol(symbol), symbol)
+        self.assertIs(Symbol.by_id(symbol.id), symbol)
+        self.assertIs(pickle.loads(pickle.dumps(symbol)), symbol)
+        self.assertLess(symbol.id, Symbol.count())
+
+    def test_string_interchangeable(self):
+        quotes = {"SPY": 420.0}
+
+        self.assertEqual(quotes[Symbol("SPY")], 420.0)
+        self.assertEqual({Symbol("QQQ"): 1}["QQQ"], 1)
+        self.assertEqual(Symbol("SPY"), "SPY")
+        self.assertNotEqual(Symbol("SPY"), Symbol("QQQ"))
+        self.assertEqual(sorted([Symbol("SPY"), Symbol("AAPL")]), ["AAPL", "SPY"])
+
+    def test_forms(self):
+        symbol = Symbol("SPY   230616P00402500")
+
+        self.assertEqual(symbol.streamer, ".SPY230616P402.5")
+        self.assertIs(Symbol.from_streamer(".SPY230616P402.5"), symbol)
+        self.assertEqual(symbol.occ, "SPY230616P00402500")
+        self.assertEqual(symbol.components.strike_price, 402.5)
+        self.assertIsNone(Symbol("SPY").components)
+
+    def test_future_streamer_symbol(self):
+        future = Symbol.from_instrument({"symbol": "/ESZ3", "streamer-symbol": "/ESZ23:XCME"})
+
+        self.assertEqual(future.streamer, "/ESZ23:XCME")
+        self.assertIs(Symbol.from_streamer("/ESZ23:XCME"), future)
+        with self.assertRaises(ValueError):
+            Symbol("/NQZ3").streamer
+        with self.subTest("Unregistered streamer symbols"):
+            with self.assertRaises(ValueError):
+                Symbol.from_streamer("/NQZ23:XCME")
+            with self.assertRaises(ValueError):
+                Symbol.from_streamer("./NQZ23C16000:XCME")
+            self.assertIsNone(Symbol("/NQZ3").streamer_symbol)
+        with self.subTest("Conflicting streamer symbol"):
+            self.assertIs(Symbol("/ESZ3", "/ESZ23:XCME"), future)
+            with self.assertRaises(ValueError):
+                Symbol("/ESZ3", "/ESH24:XCME")
+            self.assertEqual(future.streamer, "/ESZ23:XCME")
+
+    def test_concurrent_interning(self):
+        results = []
+
+        def intern():
+            results.append([Symbol(f"CONCURRENT{i}").id for i in range(200)])
+
+        threads = [threading.Thread(target=intern) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(ids == results[0] for ids in results))
+        self.assertEqual(len(set(results[0])), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.market_data.symbol_search import SymbolSearchIndex
+
+API_URL = "https://api.tastytrade.com"
+
+EQUITIES = [
+    {"symbol": "AAPL", "description": "Apple Inc. - Common Stock"},
+    {"symbol": "AAP", "description": "Advance Auto Parts Inc."},
+    {"symbol": "MSFT", "description": "Microsoft Corporation - Common Stock"},
+    {"symbol": "APLE", "description": "Apple Hospitality REIT, Inc."},
+]
+
+
+class TestSymbolSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SymbolSearchIndex(EQUITIES, TastytradeInstruments("token", API_URL))
+
+    def test_prefix_search(self):
+        with self.subTest("Check symbol prefix"):
+            self.assertEqual([entry["symbol"] for entry in self.index.search("aap")], ["AAP", "AAPL"])
+        with self.subTest("Check description words after symbols"):
+            self.assertEqual([entry["symbol"] for entry in self.index.search("ap")], ["APLE", "AAPL"])
+        with self.subTest("Check limit"):
+            self.assertEqual(len(self.index.search("a", limit=2)), 2)
+
+    def test_replace_entry(self):
+        self.index.add([{"symbol": "AAPL", "description": "Apple Inc. - Ordinary Shares"},
+                        {"symbol": "MSFT", "description": "Microsoft Rebranded"},
+                        {"symbol": "MSFT", "description": "Microsoft Corp."}])
+
+        self.assertEqual(self.index.search("aapl")[0]["description"], "Apple Inc. - Ordinary Shares")
+        self.assertEqual([entry["symbol"] for entry in self.index.search("common", fallback=False)], [])
+        self.assertEqual([entry["symbol"] for entry in self.index.search("rebr", fallback=False)], [])
+        self.assertEqual([entry["symbol"] for entry in self.index.search("apple")], ["AAPL", "APLE"])
+        self.assertEqual([entry["symbol"] for entry in self.index.search("corp")], ["MSFT"])
+        self.assertEqual(self.index.words, sorted(self.index.words_set))
+
+    @requests_mock.Mocker()
+    def test_fallback(self, mock):
+        mock.get(f"{API_URL}/symbols/search/ZZ", json={"data": {"items": []}})
+        mock.get(f"{API_URL}/symbols/search/TSL", json={"data": {"items": [
+            {"symbol": "TSLA", "description": "Tesla, Inc."}]}})
+
+        self.assertEqual([entry["symbol"] for entry in self.index.search("tsl")], ["TSLA"])
+        self.assertEqual([entry["symbol"] for entry in self.index.search("tesla")], ["TSLA"])
+        self.assertEqual(self.index.search("zz"), [])
+        self.assertEqual(self.index.search("zz"), [])
+        self.assertEqual(mock.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_from_active_equities(self, mock):
+        def active(request, context):
+            page = int(request.qs["page-offset"][0])
+            return {"data": {"items": EQUITIES[page * 2:page * 2 + 2]}, "pagination": {"total-pages": 2}}
+
+        mock.get(f"{API_URL}/instruments/equities/active", json=active)
+
+        index = SymbolSearchIndex.from_active_equities(TastytradeInstruments("token", API_URL), per_page=2)
+
+        self.assertEqual(index.symbols, ["AAP", "AAPL", "APLE", "MSFT"])
+
+
+if __name__ == '__main__':
+    unittest.main()
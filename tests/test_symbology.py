@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tastytrade_api.symbology import (
+    from_streamer_symbol,
+    parse_future_option_symbol,
+    parse_future_symbol,
+    parse_option_symbol,
+    parse_option_symbols,
+    to_streamer_symbol,
+    to_tastytrade_future_option_symbol,
+    to_tastytrade_future_symbol,
+    to_tastytrade_option_symbol,
+    to_tastytrade_option_symbols,
+)
+
+
+class TestSymbology(unittest.TestCase):
+
+    def test_option_symbol_rounding(self):
+        self.assertEqual(to_tastytrade_option_symbol("AAPL", 4.35, "call", "2022-01-21"), "AAPL  220121C00004350")
+
+    def test_batch_encode_matches_single(self):
+        strikes = [0.5, 4.35, 130.0, 402.5, 1234.125]
+        expected = [to_tastytrade_option_symbol("SPY", strike, "put", "2023-06-16") for strike in strikes]
+
+        self.assertEqual(to_tastytrade_option_symbols("SPY", strikes, "put", "2023-06-16"), expected)
+        self.assertEqual(to_tastytrade_option_symbols(["AAPL", "QQQ"], 100, ["C", "P"], ["2023-06-16", "2023-07-21"]),
+                         ["AAPL  230616C00100000", "QQQ   230721P00100000"])
+
+    def test_batch_encode_checks_lengths(self):
+        with self.assertRaises(ValueError):
+            to_tastytrade_option_symbols(["SPY", "QQQ", "X"], [400, 1], "call", "2023-06-16")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_encode_numpy(self):
+        self.assertEqual(to_tastytrade_option_symbols("SPY", np.int64(400), "call", np.array(["2023-06-16"] * 2)),
+                         ["SPY   230616C00400000"] * 2)
+        self.assertEqual(to_tastytrade_option_symbols(["SPY", "QQQ"], np.array([400.0, 402.5]), "P", "2023-06-16"),
+                         ["SPY   230616P00400000", "QQQ   230616P00402500"])
+
+    def test_parse_option_symbol(self):
+        symbols = to_tastytrade_option_symbols(["AAPL", "SPY"], [130.0, 402.5], ["call", "put"],
+                                               ["2022-01-21", "2023-06-16"])
+
+        parsed = parse_option_symbols(symbols)
+
+        self.assertEqual(parsed[0], ("AAPL", "2022-01-21", "C", 130.0))
+        self.assertEqual(parsed[1].strike_price, 402.5)
+        with self.assertRaises(ValueError):
+            parse_option_symbol("AAPL")
+
+    def test_parse_future_symbols(self):
+        self.assertEqual(parse_future_symbol(to_tastytrade_future_symbol("CL", "2022-12")), ("CL", "Z", "2"))
+        self.assertEqual(parse_future_symbol("/ESZ23").year, "23")
+        self.assertEqual(parse_future_option_symbol("./CLZ2 LO1X2 221104C91000"),
+                         ("/CLZ2", "LO1X2", "2022-11-04", "C", 91.0))
+        with self.assertRaises(ValueError):
+            parse_future_symbol("SPY")
+
+    def test_future_option_round_trip(self):
+        for strike_price in (91.0, 4.25, 4850.0, 0.125):
+            with self.subTest(strike_price):
+                symbol = to_tastytrade_future_option_symbol("CL", "Z2", "LO1X2", "2022-11-04", "put", strike_price)
+                self.assertEqual(parse_future_option_symbol(symbol),
+                                 ("/CLZ2", "LO1X2", "2022-11-04", "P", strike_price))
+
+    def test_streamer_symbols(self):
+        self.assertEqual(to_streamer_symbol("SPY   230616C00400000"), ".SPY230616C400")
+        self.assertEqual(to_streamer_symbol("SPY   230616P00402500"), ".SPY230616P402.5")
+        self.assertEqual(to_streamer_symbol("SPY"), "SPY")
+        self.assertEqual(from_streamer_symbol(".SPY230616P402.5"), "SPY   230616P00402500")
+        self.assertEqual(from_streamer_symbol("SPY"), "SPY")
+        with self.assertRaises(ValueError):
+            to_streamer_symbol("/ESZ3")
+
+
+if __name__ == '__main__':
+    unittest.main()